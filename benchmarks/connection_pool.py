@@ -0,0 +1,59 @@
+# Multi-threaded load test: symptom queries through the connection pool versus a fresh
+# sqlite3.connect per query, as every page did before the pool existed.
+#
+#   python benchmarks/connection_pool.py [threads] [queries per thread] [catalog size]
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from medibot.database import initialize_database
+from medibot.repository import get_pool
+from medibot.search import parse_symptom_terms, query_database, rank_doctors
+from medibot.seed_data import DOCTORS_SEED
+
+QUERIES = ["fever", "joint pain and swelling", "chest pain, dizziness", "memory loss", "skin rashes", "anxiety"]
+
+
+def unpooled_query(symptoms, db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return rank_doctors(conn, parse_symptom_terms(symptoms))
+    finally:
+        conn.close()
+
+
+def pooled_query(symptoms, db_path):
+    return query_database(symptoms, db_path)
+
+
+def run_load(search, db_path, threads, queries_per_thread):
+    def worker(offset):
+        for i in range(queries_per_thread):
+            search(QUERIES[(offset + i) % len(QUERIES)], db_path)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        list(executor.map(worker, range(threads)))
+    return threads * queries_per_thread / (time.perf_counter() - start)
+
+
+def main(threads=8, queries_per_thread=500, size=len(DOCTORS_SEED)):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        catalog = [(str(100000 + i),) + DOCTORS_SEED[i % len(DOCTORS_SEED)][1:] for i in range(size)]
+        initialize_database(db_path, catalog)
+
+        print(f"{threads} threads x {queries_per_thread} queries, {size} doctors")
+        for name, search in (("no pool", unpooled_query), ("pool", pooled_query)):
+            throughput = run_load(search, db_path, threads, queries_per_thread)
+            print(f"{name:>10}: {throughput:10.0f} queries/s")
+        get_pool(db_path).close()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,165 @@
+# End-to-end latency and throughput of the request path on synthetic catalogs, with a
+# per-stage breakdown from the built-in metrics. Catalogs and query mixes are generated from a
+# fixed seed, so two runs of the same command measure the same work.
+#
+#   python benchmarks/request_path.py [--sizes 1000 100000 1000000] [--requests 500]
+#                                     [--threads 4] [--seed 0] [--db-dir DIR]
+#
+# Building a catalog dominates for the large sizes; pass --db-dir to keep the generated
+# databases and reuse them on later runs.
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from medibot.catalog import DoctorCatalog
+from medibot.database import initialize_database, migrate_database
+from medibot.geo import load_pincodes
+from medibot.metrics import METRICS
+from medibot.repository import connection, get_pool
+from medibot.search import query_database
+from medibot.seed_data import DOCTORS_SEED
+
+# Share of each kind of request in the mix
+QUERY_MIX = (
+    ("symptom", 0.5),
+    ("symptom+time", 0.2),
+    ("symptom+location", 0.15),
+    ("specialization", 0.15),
+)
+
+PAGE_SIZE = 20
+
+
+# `size` doctors mixing the seed profiles, hospitals and schedules, with random ratings
+def synthetic_catalog(size, seed=0):
+    rng = random.Random(seed)
+    rows = []
+    for i in range(size):
+        profile, hospital, schedule = rng.choice(DOCTORS_SEED), rng.choice(DOCTORS_SEED), rng.choice(DOCTORS_SEED)
+        rows.append(
+            (str(1000000 + i),) + profile[1:6] + hospital[6:8] + schedule[8:10]
+            + (round(rng.uniform(1.0, 5.0), 1),)
+        )
+    return rows
+
+
+# Database with a synthetic catalog, built once per (size, seed) when db_dir is given.
+# A database built earlier is brought up to the current schema.
+def build_database(size, seed, db_dir):
+    db_path = os.path.join(db_dir, f"catalog_{size}_{seed}.db")
+    if not os.path.exists(db_path):
+        initialize_database(db_path, synthetic_catalog(size, seed))
+    else:
+        with connection(db_path) as conn:
+            migrate_database(conn)
+    return db_path
+
+
+# (kind, function of the catalog) for each request, drawn from QUERY_MIX
+def query_mix(count, seed=0):
+    rng = random.Random(seed)
+    symptoms = sorted({symptom.strip() for row in DOCTORS_SEED for symptom in row[2].split(",")})
+    specializations = sorted({row[3] for row in DOCTORS_SEED})
+    places = sorted(load_pincodes()[0].values())
+    kinds, weights = zip(*QUERY_MIX)
+
+    requests = []
+    for kind in rng.choices(kinds, weights, k=count):
+        text = ", ".join(rng.sample(symptoms, rng.randint(1, 3)))
+        if kind == "symptom":
+            options = {}
+        elif kind == "symptom+time":
+            options = {"weekday": rng.randrange(7), "open_at": rng.randrange(8 * 60, 20 * 60)}
+        elif kind == "symptom+location":
+            options = {"near": rng.choice(places), "radius_km": 25, "nearest_first": rng.random() < 0.5}
+        if kind == "specialization":
+            specialization, weekday = rng.choice(specializations), rng.choice([None, rng.randrange(7)])
+            requests.append((kind, lambda catalog, s=specialization, w=weekday: [
+                doctor.row(("doctor_name", "rating"))
+                for doctor in catalog.doctors_by_specialization(s, w)[:PAGE_SIZE]
+            ]))
+        else:
+            requests.append((kind, lambda catalog, t=text, o=options: query_database(
+                t, catalog.db_path, PAGE_SIZE, catalog=catalog, **o
+            )))
+    return requests
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(int(q * len(values)), len(values) - 1)]
+
+
+def run(catalog, requests, threads):
+    def timed(request):
+        kind, handle = request
+        started_at = time.perf_counter()
+        handle(catalog)
+        return kind, time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        results = list(executor.map(timed, requests))
+    return results, time.perf_counter() - started_at
+
+
+def report(results, elapsed, threads):
+    by_kind = {}
+    for kind, seconds in results:
+        by_kind.setdefault(kind, []).append(seconds)
+    by_kind["all"] = [seconds for _, seconds in results]
+    print(f"  {'request':<18} {'count':>6} {'p50 ms':>9} {'p99 ms':>9} {'mean ms':>9}")
+    for kind, samples in by_kind.items():
+        print(
+            f"  {kind:<18} {len(samples):>6} {percentile(samples, 0.5) * 1000:>9.2f} "
+            f"{percentile(samples, 0.99) * 1000:>9.2f} {statistics.fmean(samples) * 1000:>9.2f}"
+        )
+    print(f"  throughput: {len(results) / elapsed:.0f} requests/s on {threads} threads")
+
+
+def report_stages():
+    print(f"  {'stage':<22} {'calls':>7} {'p50 ms':>9} {'p99 ms':>9}")
+    for stage, stats in METRICS.summary().items():
+        print(f"  {stage:<22} {stats['count']:>7} {stats['p50'] * 1000:>9.3f} {stats['p99'] * 1000:>9.3f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the request path on synthetic catalogs.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000, 1000000], help="doctors per catalog")
+    parser.add_argument("--requests", type=int, default=500, help="requests per catalog")
+    parser.add_argument("--threads", type=int, default=4, help="requests run at once")
+    parser.add_argument("--seed", type=int, default=0, help="seed for catalogs and query mixes")
+    parser.add_argument("--db-dir", help="keep generated databases here and reuse them")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_dir = args.db_dir or tmp
+        for size in args.sizes:
+            started_at = time.perf_counter()
+            db_path = build_database(size, args.seed, db_dir)
+            built_at = time.perf_counter()
+            catalog = DoctorCatalog.from_database(db_path)
+            loaded_at = time.perf_counter()
+            print(
+                f"{size} doctors: database ready in {built_at - started_at:.1f}s, "
+                f"catalog loaded in {loaded_at - built_at:.1f}s"
+            )
+
+            requests = query_mix(args.requests, args.seed)
+            # Warm up the connection pool and SQLite's page cache, then measure from zero
+            run(catalog, requests[:args.threads * 2], args.threads)
+            METRICS.reset()
+            report(*run(catalog, requests, args.threads), args.threads)
+            report_stages()
+            get_pool(db_path).close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# Measure the app's own overhead on the model response path (response cache, streaming)
+# against the local fake backend, so no network or API key is needed. Questions are asked one
+# after another the way a single session would ask them, then repeated.
+#
+#   python benchmarks/response_path.py [questions] [first token latency s] [chunk latency s]
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from medibot.llm import FakeBackend
+from medibot.recommender import model_response
+from medibot.response_cache import ResponseCache
+from medibot.streaming import TimedStream
+
+
+def ask(question, backend, cache):
+    started_at = time.perf_counter()
+    stream = TimedStream(model_response(question, None, backend, cache), started_at, "qa")
+    "".join(stream)
+    return stream
+
+
+def report(name, streams, expected_total=None):
+    ttft = statistics.median(s.time_to_first_token for s in streams) * 1000
+    total = statistics.median(s.total_latency for s in streams) * 1000
+    line = f"{name:>12}: first token {ttft:8.2f} ms, complete {total:8.2f} ms"
+    if expected_total is not None:
+        line += f", overhead {total - expected_total * 1000:6.2f} ms"
+    print(line)
+
+
+def main(questions=20, first_token_latency=0.05, chunk_latency=0.01):
+    backend = FakeBackend(first_token_latency=first_token_latency, chunk_latency=chunk_latency)
+    cache = ResponseCache(db_path=None)
+    chunk_count = -(-backend.reply_words // backend.chunk_words)
+    expected_total = first_token_latency + (chunk_count - 1) * chunk_latency
+
+    prompts = [f"What helps with symptom number {i}?" for i in range(questions)]
+    report("cache miss", [ask(prompt, backend, cache) for prompt in prompts], expected_total)
+    report("cache hit", [ask(prompt.upper(), backend, cache) for prompt in prompts])
+    print(f"cache stats: {cache.stats()}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(*([int(args[0])] if args else []) + [float(arg) for arg in args[1:]])
@@ -0,0 +1,68 @@
+# Compare the FTS5 symptom index with the old LIKE '%...%' scan on synthetic catalogs.
+#
+#   python benchmarks/symptom_search.py [catalog sizes...]
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from medibot.database import initialize_database
+from medibot.repository import get_pool
+from medibot.search import query_database
+from medibot.seed_data import DOCTORS_SEED
+
+QUERIES = ["fever", "joint pain", "chest pain", "memory loss", "skin rashes", "kidney stones", "migraines", "anxiety"]
+REPEATS = 5
+
+
+# The query path that query_database used before the symptom index existed
+def like_query(symptoms, db_path):
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    cursor.execute(
+        '''
+        SELECT doctor_identity_number, doctor_name, specialization, contact,
+               email, hospital_name, hospital_location, availability, working_days, rating
+        FROM doctors
+        WHERE symptom_name LIKE ?
+        ''',
+        ('%' + symptoms + '%',)
+    )
+    result = cursor.fetchall()
+    conn.close()
+    return result
+
+
+# Seed rows repeated with fresh identity numbers until the catalog has `size` doctors
+def synthetic_catalog(size):
+    return [
+        (str(100000 + i),) + DOCTORS_SEED[i % len(DOCTORS_SEED)][1:]
+        for i in range(size)
+    ]
+
+
+def time_queries(search, db_path):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        for query in QUERIES:
+            search(query, db_path)
+    return (time.perf_counter() - start) / (REPEATS * len(QUERIES)) * 1000
+
+
+def main(sizes):
+    print(f"{'doctors':>10} {'LIKE ms/query':>15} {'FTS ms/query':>15} {'speedup':>9}")
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "bench.db")
+            initialize_database(db_path, synthetic_catalog(size))
+            like_ms = time_queries(like_query, db_path)
+            fts_ms = time_queries(query_database, db_path)
+            print(f"{size:>10} {like_ms:>15.3f} {fts_ms:>15.3f} {like_ms / fts_ms:>8.1f}x")
+            get_pool(db_path).close()
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [200, 10000, 100000])
@@ -0,0 +1,116 @@
+# Run a file of symptom queries through the recommendation engine and write the ranked
+# doctors as JSON lines, e.g. for nightly evaluations.
+#
+#   python -m medibot.batch queries.txt [--output results.jsonl] [--workers 8] [--limit 20]
+#                           [--summary] [--db PATH]
+#
+# Each input line is either plain symptom text or a JSON object with the fields of a
+# POST /recommend request (see medibot.server). Queries run in parallel on a pool of worker
+# threads, and results are written in input order, one JSON object per line. A query that
+# cannot be answered gets an "error" field instead of doctors.
+import argparse
+import json
+import sys
+import time
+import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from medibot.database import DB_PATH
+from medibot.recommender import InvalidRequest, Recommender
+from medibot.repository import POOL_SIZE
+from medibot.search import TOP_K
+
+# Worker threads; by default as many as there are pooled database connections
+WORKERS = POOL_SIZE
+
+
+# (line number, request dict) for each non-empty line of a query file, read lazily
+def read_queries(handle, defaults):
+    for line_number, line in enumerate(handle, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("{"):
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError:
+                request = None
+        else:
+            request = {"symptoms": line}
+        if isinstance(request, dict):
+            request = {**defaults, **request}
+        yield line_number, request
+
+
+# Result for one query. Any failure becomes that line's error, so one bad query (or a
+# failing model call) never stops the rest of the batch; unexpected ones are logged in full.
+def answer(recommender, line_number, request):
+    try:
+        if request is None:
+            raise InvalidRequest("line is not valid JSON")
+        result = recommender.recommend(request)
+    except InvalidRequest as error:
+        result = {"error": str(error)}
+    except Exception as error:
+        sys.stderr.write(f"line {line_number}: {traceback.format_exc()}")
+        result = {"error": f"internal error: {type(error).__name__}: {error}"}
+    result["line"] = line_number
+    return result
+
+
+# Answer every query from `queries` on `workers` threads and write each result to `output`.
+# At most a few queries per worker are in flight, so memory stays flat for any input size.
+def run_batch(recommender, queries, output, workers=WORKERS):
+    stats = {"queries": 0, "errors": 0}
+    started_at = time.perf_counter()
+    pending = deque()
+
+    def write_oldest():
+        result = pending.popleft().result()
+        stats["queries"] += 1
+        stats["errors"] += "error" in result
+        output.write(json.dumps(result) + "\n")
+
+    with ThreadPoolExecutor(workers, thread_name_prefix="medibot-batch") as executor:
+        for line_number, request in queries:
+            pending.append(executor.submit(answer, recommender, line_number, request))
+            if len(pending) >= workers * 4:
+                write_oldest()
+        while pending:
+            write_oldest()
+
+    stats["seconds"] = time.perf_counter() - started_at
+    stats["queries_per_second"] = stats["queries"] / stats["seconds"] if stats["seconds"] else 0.0
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rank doctors for a file of symptom queries.")
+    parser.add_argument("queries", help="file with one query per line (plain text or JSON), - for stdin")
+    parser.add_argument("--output", "-o", default="-", help="JSONL file to write (default: stdout)")
+    parser.add_argument("--workers", type=int, default=WORKERS, help="queries run at once")
+    parser.add_argument("--limit", type=int, default=TOP_K, help="doctors per query")
+    parser.add_argument("--summary", action="store_true", help="also ask the model to summarize each result")
+    parser.add_argument("--db", default=DB_PATH, help="SQLite database to search")
+    args = parser.parse_args(argv)
+
+    defaults = {"limit": args.limit, "summary": args.summary}
+    recommender = Recommender(args.db)
+    input_handle = sys.stdin if args.queries == "-" else open(args.queries, encoding="utf-8")
+    output_handle = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        stats = run_batch(recommender, read_queries(input_handle, defaults), output_handle, args.workers)
+    finally:
+        for handle in (input_handle, output_handle):
+            if handle not in (sys.stdin, sys.stdout):
+                handle.close()
+    print(
+        f"{stats['queries']} queries in {stats['seconds']:.2f}s "
+        f"({stats['queries_per_second']:.0f} queries/s), {stats['errors']} errors",
+        file=sys.stderr
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import time
+
+from medibot.database import DB_PATH, DOCTOR_COLUMNS, catalog_version
+from medibot.geo import DEFAULT_RADIUS_KM, SpatialGrid
+from medibot.metrics import METRICS
+from medibot.repository import connection
+
+# How often (in seconds) a loaded catalog asks the database whether it has changed
+REFRESH_CHECK_INTERVAL = 30
+
+# Typed opening-hours columns loaded alongside DOCTOR_COLUMNS
+SCHEDULE_COLUMNS = ("opens_at", "closes_at", "working_days_mask")
+
+# Hospital coordinates, empty for addresses that could not be geocoded
+LOCATION_COLUMNS = ("latitude", "longitude")
+
+
+# One doctor row. __slots__ keeps hundreds of thousands of these compact in memory.
+class Doctor:
+    __slots__ = ("doctor_id",) + DOCTOR_COLUMNS + SCHEDULE_COLUMNS + LOCATION_COLUMNS + ("schedule",)
+
+    def __init__(self, doctor_id, *values):
+        self.doctor_id = doctor_id
+        for column, value in zip(DOCTOR_COLUMNS + SCHEDULE_COLUMNS + LOCATION_COLUMNS, values):
+            setattr(self, column, value)
+        self.schedule = None
+
+    def row(self, columns):
+        return tuple(getattr(self, column) for column in columns)
+
+
+# Read-only snapshot of the doctors table with lookup indexes, shared by every session in a process
+class DoctorCatalog:
+    def __init__(self, doctors, version=0, db_path=DB_PATH):
+        self.doctors = tuple(doctors)
+        self.version = version
+        self.db_path = db_path
+        self.checked_at = time.monotonic()
+
+        # Row positions per specialization. Rows are loaded in (specialization, rating) index
+        # order, so each specialization's list is best rated first. Symptom search runs on the
+        # FTS index in SQLite (medibot.search), so no symptom index is kept here.
+        by_specialization = {}
+        for position, doctor in enumerate(self.doctors):
+            by_specialization.setdefault(doctor.specialization, []).append(position)
+        self.specialization_index = {
+            specialization: tuple(positions) for specialization, positions in by_specialization.items()
+        }
+        self.specializations = tuple(by_specialization)
+
+        # Availability index. Doctors with the same working days and hours share a schedule
+        # number, and each weekday lists the (schedule, opens_at, closes_at) of the schedules
+        # that work that day. There are far fewer distinct schedules than doctors, so checking
+        # the hours of each is cheap, and a doctor's availability is then one set lookup.
+        schedules = {}
+        for doctor in self.doctors:
+            key = (doctor.working_days_mask, doctor.opens_at, doctor.closes_at)
+            doctor.schedule = schedules.setdefault(key, len(schedules))
+        schedules_by_weekday = {weekday: [] for weekday in range(7)}
+        for (mask, opens_at, closes_at), schedule in schedules.items():
+            for weekday in range(7):
+                if mask & (1 << weekday):
+                    schedules_by_weekday[weekday].append((schedule, opens_at, closes_at))
+        self.schedules_by_weekday = {weekday: tuple(hours) for weekday, hours in schedules_by_weekday.items()}
+
+        # Spatial index of row positions, one grid layer per specialization, for radius searches
+        self.spatial_index = SpatialGrid()
+        for position, doctor in enumerate(self.doctors):
+            if doctor.latitude is not None:
+                self.spatial_index.add(doctor.specialization, (doctor.latitude, doctor.longitude), position)
+
+    @classmethod
+    @METRICS.timed("catalog_load")
+    def from_database(cls, db_path=DB_PATH):
+        # Read the version and the rows in one transaction so they describe the same data
+        with connection(db_path) as conn, conn:
+            conn.execute("BEGIN")
+            version = catalog_version(conn)
+            rows = conn.execute(
+                f"SELECT doctor_id, {', '.join(DOCTOR_COLUMNS + SCHEDULE_COLUMNS + LOCATION_COLUMNS)} FROM doctors "
+                "ORDER BY specialization, rating DESC"
+            ).fetchall()
+        return cls((Doctor(*row) for row in rows), version, db_path)
+
+    # Schedule numbers open on `weekday` (0 = Monday) at minute `open_at` after midnight, or at
+    # any time that day when open_at is None. "Open" matches the SQL filter in medibot.search
+    # exactly: opens_at <= open_at < closes_at.
+    def open_schedules(self, weekday, open_at=None):
+        return frozenset(
+            schedule for schedule, opens_at, closes_at in self.schedules_by_weekday.get(weekday, ())
+            if open_at is None or opens_at <= open_at < closes_at
+        )
+
+    # Doctors with the given specialization, sorted by rating in descending order, optionally
+    # only those available on a weekday and time. Given a (latitude, longitude) point in `near`,
+    # only doctors within radius_km of it are kept, nearest first if nearest_first is set.
+    @METRICS.timed("specialization_query")
+    def doctors_by_specialization(
+        self, specialization, weekday=None, open_at=None, near=None, radius_km=DEFAULT_RADIUS_KM,
+        nearest_first=False
+    ):
+        positions = self.specialization_index.get(specialization, ())
+        if near is not None:
+            nearby = [position for _, position in self.spatial_index.within(specialization, near, radius_km)]
+            if not nearest_first:
+                nearby = set(nearby)
+                nearby = [position for position in positions if position in nearby]
+            positions = nearby
+        doctors = [self.doctors[p] for p in positions]
+        if weekday is None:
+            return doctors
+        open_schedules = self.open_schedules(weekday, open_at)
+        return [doctor for doctor in doctors if doctor.schedule in open_schedules]
+
+    # True when the database has been written since this snapshot was built. The database is
+    # consulted at most once per REFRESH_CHECK_INTERVAL, so callers can ask on every rerun.
+    def is_stale(self):
+        now = time.monotonic()
+        if now - self.checked_at < REFRESH_CHECK_INTERVAL:
+            return False
+        self.checked_at = now
+        with connection(self.db_path) as conn:
+            return catalog_version(conn) != self.version
@@ -0,0 +1,75 @@
+import os
+
+# Most recent question/answer turns sent verbatim with each message
+HISTORY_WINDOW = int(os.getenv("MEDIBOT_CHAT_HISTORY_TURNS", "6"))
+
+# Upper bound for the running summary of older turns
+SUMMARY_MAX_WORDS = int(os.getenv("MEDIBOT_CHAT_SUMMARY_WORDS", "150"))
+
+
+# Conversation with the model for a single user. Only the last HISTORY_WINDOW turns are
+# replayed on each request; older turns are folded into a short summary, so the prompt
+# size stays bounded however long the conversation runs. Folding takes a model call of its
+# own, so it happens just before the next message is sent rather than while an answer is
+# being returned.
+class ChatSession:
+    def __init__(self, backend, history_window=HISTORY_WINDOW, summary_max_words=SUMMARY_MAX_WORDS):
+        # Condensing keeps the newest half of the window, which must hold at least one turn
+        if history_window < 2:
+            raise ValueError(f"history_window must be at least 2, not {history_window}")
+        self.backend = backend
+        self.history_window = history_window
+        self.summary_max_words = summary_max_words
+        self.summary = ""
+        self.turns = []
+
+    # History in the format backends expect, with the summary as an opening exchange
+    def history(self):
+        history = []
+        if self.summary:
+            history.append({"role": "user", "parts": [f"Summary of our conversation so far: {self.summary}"]})
+            history.append({"role": "model", "parts": ["Understood, I will keep that in mind."]})
+        for question, answer in self.turns:
+            history.append({"role": "user", "parts": [question]})
+            history.append({"role": "model", "parts": [answer]})
+        return history
+
+    # Same interface as the SDK's ChatSession.send_message. With stream=True the chunks are
+    # passed through as they arrive and the turn is recorded once the stream is exhausted.
+    def send_message(self, content, stream=False):
+        if len(self.turns) > self.history_window:
+            self._condense()
+        response = self.backend.send_message(self.history(), content, stream=stream)
+        if stream:
+            return self._record_stream(content, response)
+        self.add_turn(content, response.text)
+        return response
+
+    def _record_stream(self, content, response):
+        parts = []
+        for chunk in response:
+            parts.append(chunk.text)
+            yield chunk
+        self.add_turn(content, "".join(parts))
+
+    def add_turn(self, question, answer):
+        self.turns.append((question, answer))
+
+    # Fold every turn but the newest half window into the summary
+    def _condense(self):
+        split = len(self.turns) - self.history_window // 2
+        older = self.turns[:split]
+        self.turns = self.turns[split:]
+        transcript = "\n".join(f"User: {question}\nAssistant: {answer}" for question, answer in older)
+        prompt = (
+            f"Summarize this conversation between a user and a medical assistant in under "
+            f"{self.summary_max_words} words. Keep symptoms, conditions and doctors mentioned.\n\n"
+        )
+        if self.summary:
+            prompt += f"Earlier summary: {self.summary}\n\n"
+        prompt += transcript
+        try:
+            self.summary = self.backend.generate_content(prompt).text.strip()
+        except Exception:
+            # A failed summary must not fail the user's request; the old turns are dropped instead
+            pass
@@ -0,0 +1,312 @@
+import hashlib
+from collections import Counter
+
+from medibot.geo import geocode_address
+from medibot.metrics import METRICS
+from medibot.repository import DB_PATH, connection
+
+# Columns of the doctors table that come from the seed data (everything except doctor_id)
+DOCTOR_COLUMNS = (
+    "doctor_identity_number", "doctor_name", "symptom_name", "specialization",
+    "contact", "email", "hospital_name", "hospital_location", "availability", "working_days", "rating"
+)
+
+# Keep the external-content FTS5 index in step with every change to doctors
+FTS_TRIGGERS = [
+    '''
+    CREATE TRIGGER doctors_fts_insert AFTER INSERT ON doctors BEGIN
+        INSERT INTO doctors_fts (rowid, symptom_name) VALUES (new.doctor_id, new.symptom_name);
+    END
+    ''',
+    '''
+    CREATE TRIGGER doctors_fts_delete AFTER DELETE ON doctors BEGIN
+        INSERT INTO doctors_fts (doctors_fts, rowid, symptom_name)
+        VALUES ('delete', old.doctor_id, old.symptom_name);
+    END
+    ''',
+    '''
+    CREATE TRIGGER doctors_fts_update AFTER UPDATE OF symptom_name ON doctors BEGIN
+        INSERT INTO doctors_fts (doctors_fts, rowid, symptom_name)
+        VALUES ('delete', old.doctor_id, old.symptom_name);
+        INSERT INTO doctors_fts (rowid, symptom_name) VALUES (new.doctor_id, new.symptom_name);
+    END
+    ''',
+]
+
+# Keep the doctors_location R*Tree in step with the hospital coordinates of every doctor
+LOCATION_TRIGGERS = [
+    '''
+    CREATE TRIGGER doctors_location_insert AFTER INSERT ON doctors WHEN new.latitude IS NOT NULL BEGIN
+        INSERT INTO doctors_location VALUES (new.doctor_id, new.latitude, new.latitude, new.longitude, new.longitude);
+    END
+    ''',
+    '''
+    CREATE TRIGGER doctors_location_delete AFTER DELETE ON doctors BEGIN
+        DELETE FROM doctors_location WHERE doctor_id = old.doctor_id;
+    END
+    ''',
+    '''
+    CREATE TRIGGER doctors_location_update AFTER UPDATE OF latitude, longitude ON doctors BEGIN
+        DELETE FROM doctors_location WHERE doctor_id = old.doctor_id;
+        INSERT INTO doctors_location
+        SELECT new.doctor_id, new.latitude, new.latitude, new.longitude, new.longitude
+        WHERE new.latitude IS NOT NULL;
+    END
+    ''',
+]
+
+# Schema migrations, applied in order. PRAGMA user_version records how many have run,
+# so each one executes exactly once per database file.
+MIGRATIONS = [
+    # 1: versioned schema. Databases created before versioning only ever held seed data,
+    # so the old unversioned table is dropped and rebuilt from the seed.
+    [
+        "DROP TABLE IF EXISTS doctors",
+        '''
+        CREATE TABLE doctors (
+            doctor_id INTEGER PRIMARY KEY,
+            doctor_identity_number TEXT NOT NULL,
+            doctor_name TEXT NOT NULL,
+            symptom_name TEXT NOT NULL,
+            specialization TEXT NOT NULL,
+            contact TEXT NOT NULL,
+            email TEXT NOT NULL,
+            hospital_name TEXT NOT NULL,
+            hospital_location TEXT NOT NULL,
+            availability TEXT NOT NULL,
+            working_days TEXT NOT NULL,
+            rating TEXT NOT NULL
+        )
+        ''',
+        "CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    ],
+    # 2: full-text index over symptom_name. It is an external-content FTS5 table, so it
+    # stores only the index and the triggers keep it in step with every change to doctors.
+    [
+        '''
+        CREATE VIRTUAL TABLE doctors_fts USING fts5(
+            symptom_name, content='doctors', content_rowid='doctor_id', tokenize='porter unicode61'
+        )
+        ''',
+        *FTS_TRIGGERS,
+        "INSERT INTO doctors_fts (doctors_fts) VALUES ('rebuild')",
+    ],
+    # 3: bulk imports. `source` separates seed rows, which sync_seed_data manages, from imported
+    # ones it must leave alone; imports look doctors up by identity number.
+    [
+        "ALTER TABLE doctors ADD COLUMN source TEXT NOT NULL DEFAULT 'seed'",
+        "CREATE INDEX doctors_identity_number ON doctors (doctor_identity_number)",
+        "CREATE INDEX doctors_specialization ON doctors (specialization)",
+    ],
+    # 4: typed storage. rating becomes REAL, and opening hours and working days get numeric
+    # columns derived from the display strings, so sorting and availability filters run in SQL.
+    # SQLite cannot change a column's type in place, so the table is rebuilt with the same rowids
+    # (which the FTS index refers to) and its triggers and indexes are recreated.
+    [
+        '''
+        CREATE TABLE doctors_typed (
+            doctor_id INTEGER PRIMARY KEY,
+            doctor_identity_number TEXT NOT NULL,
+            doctor_name TEXT NOT NULL,
+            symptom_name TEXT NOT NULL,
+            specialization TEXT NOT NULL,
+            contact TEXT NOT NULL,
+            email TEXT NOT NULL,
+            hospital_name TEXT NOT NULL,
+            hospital_location TEXT NOT NULL,
+            availability TEXT NOT NULL,
+            working_days TEXT NOT NULL,
+            rating REAL NOT NULL,
+            source TEXT NOT NULL DEFAULT 'seed',
+            opens_at INTEGER GENERATED ALWAYS AS (
+                CAST(substr(availability, 1, 2) AS INTEGER) * 60 + CAST(substr(availability, 4, 2) AS INTEGER)
+            ) STORED,
+            closes_at INTEGER GENERATED ALWAYS AS (
+                CAST(substr(availability, 7, 2) AS INTEGER) * 60 + CAST(substr(availability, 10, 2) AS INTEGER)
+            ) STORED,
+            working_days_mask INTEGER GENERATED ALWAYS AS (
+                (instr(working_days, 'Monday') > 0) * 1
+                + (instr(working_days, 'Tuesday') > 0) * 2
+                + (instr(working_days, 'Wednesday') > 0) * 4
+                + (instr(working_days, 'Thursday') > 0) * 8
+                + (instr(working_days, 'Friday') > 0) * 16
+                + (instr(working_days, 'Saturday') > 0) * 32
+                + (instr(working_days, 'Sunday') > 0) * 64
+            ) STORED
+        )
+        ''',
+        f'''
+        INSERT INTO doctors_typed (doctor_id, {", ".join(DOCTOR_COLUMNS)}, source)
+        SELECT doctor_id, {", ".join(DOCTOR_COLUMNS[:-1])}, CAST(rating AS REAL), source FROM doctors
+        ''',
+        "DROP TABLE doctors",
+        "ALTER TABLE doctors_typed RENAME TO doctors",
+        *FTS_TRIGGERS,
+        "CREATE INDEX doctors_identity_number ON doctors (doctor_identity_number)",
+        "CREATE INDEX doctors_specialization_rating ON doctors (specialization, rating DESC)",
+    ],
+    # 5: hospital coordinates, filled in by geocode_doctors from the PIN code in hospital_location
+    [
+        "ALTER TABLE doctors ADD COLUMN latitude REAL",
+        "ALTER TABLE doctors ADD COLUMN longitude REAL",
+    ],
+    # 6: the address each row's coordinates were looked up for, so addresses without a known
+    # PIN code are tried once and a changed address is looked up again. The partial index
+    # lists just the rows waiting for a lookup.
+    [
+        "ALTER TABLE doctors ADD COLUMN geocoded_location TEXT",
+        "UPDATE doctors SET geocoded_location = hospital_location WHERE latitude IS NOT NULL",
+        "CREATE INDEX doctors_pending_geocode ON doctors (doctor_id) WHERE geocoded_location IS NOT hospital_location",
+    ],
+    # 7: the name of the seed doctor an imported row took over, so seed sync can leave exactly
+    # that doctor alone. Imports made before this only took over seed doctors of the same name.
+    [
+        "ALTER TABLE doctors ADD COLUMN replaces_seed_name TEXT",
+        "UPDATE doctors SET replaces_seed_name = doctor_name WHERE source != 'seed'",
+    ],
+    # 8: spatial index of the geocoded hospitals, so a radius search only looks at the doctors
+    # inside the circle's bounding box. Each doctor is a point: a box with equal min and max.
+    [
+        '''
+        CREATE VIRTUAL TABLE doctors_location USING rtree(
+            doctor_id, min_latitude, max_latitude, min_longitude, max_longitude
+        )
+        ''',
+        *LOCATION_TRIGGERS,
+        '''
+        INSERT INTO doctors_location
+        SELECT doctor_id, latitude, latitude, longitude, longitude FROM doctors WHERE latitude IS NOT NULL
+        ''',
+    ],
+]
+
+# Bit for each working day in working_days_mask, in datetime.weekday() order (Monday = bit 0)
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+RATING_INDEX = DOCTOR_COLUMNS.index("rating")
+
+
+# Bring the schema up to date by running every migration the database hasn't seen yet.
+# BEGIN IMMEDIATE takes the write lock first, so concurrent processes can't apply the same step twice.
+def migrate_database(conn):
+    while True:
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version >= len(MIGRATIONS):
+                return
+            for statement in MIGRATIONS[version]:
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {version + 1}")
+
+
+# Doctor names compared the way imports match them: case and spacing are ignored
+def name_key(name):
+    return " ".join(name.lower().split())
+
+
+# A row in DOCTOR_COLUMNS order as it is stored, with the rating as a number
+def storage_row(row):
+    row = tuple(row)
+    return row[:RATING_INDEX] + (float(row[RATING_INDEX]),) + row[RATING_INDEX + 1:]
+
+
+# Content hash of the seed rows, used to detect when the seed data has changed
+def seed_hash(rows):
+    digest = hashlib.sha256()
+    for row in rows:
+        digest.update(repr(tuple(row)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+# Apply only the differences between the seed data and the seed rows already stored. Seed
+# doctors taken over by an import (see medibot.ingest) are skipped, so the seed never adds a
+# second copy of an imported doctor. The hash check, the diff and the writes share one
+# BEGIN IMMEDIATE transaction, so a process starting at the same time as another waits for
+# it and then finds the seed already applied.
+def sync_seed_data(conn, rows):
+    current_hash = seed_hash(rows)
+    columns = ", ".join(DOCTOR_COLUMNS)
+
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        stored = conn.execute("SELECT value FROM metadata WHERE key = 'seed_hash'").fetchone()
+        if stored and stored[0] == current_hash:
+            return
+
+        imported = {
+            (identity, name_key(name)) for identity, name in
+            conn.execute("SELECT doctor_identity_number, replaces_seed_name FROM doctors WHERE replaces_seed_name IS NOT NULL")
+        }
+        wanted = Counter(storage_row(row) for row in rows if (row[0], name_key(row[1])) not in imported)
+
+        stale_ids = []
+        for doctor_id, *row in conn.execute(f"SELECT doctor_id, {columns} FROM doctors WHERE source = 'seed'"):
+            row = tuple(row)
+            if wanted[row] > 0:
+                wanted[row] -= 1
+            else:
+                stale_ids.append((doctor_id,))
+        added = list(wanted.elements())
+
+        conn.executemany("DELETE FROM doctors WHERE doctor_id = ?", stale_ids)
+        conn.executemany(
+            f"INSERT INTO doctors ({columns}) VALUES ({', '.join('?' * len(DOCTOR_COLUMNS))})",
+            added,
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO metadata (key, value) VALUES ('seed_hash', ?)",
+            (current_hash,)
+        )
+        if stale_ids or added:
+            bump_catalog_version(conn)
+
+
+# Counter that changes whenever the doctors table is written, so in-memory copies know to reload
+def catalog_version(conn):
+    row = conn.execute("SELECT value FROM metadata WHERE key = 'catalog_version'").fetchone()
+    return int(row[0]) if row else 0
+
+
+# Call inside the transaction that modified the doctors table
+def bump_catalog_version(conn):
+    conn.execute(
+        "INSERT OR REPLACE INTO metadata (key, value) VALUES ('catalog_version', ?)",
+        (str(catalog_version(conn) + 1),)
+    )
+
+
+# Look up coordinates for every doctor whose hospital address has not been geocoded yet, or
+# has changed since it was. Addresses without a known PIN code get empty coordinates, are left
+# out of distance searches, and are not tried again until the address changes. Returns the
+# number of doctors located.
+def geocode_doctors(conn):
+    located = {}
+    updates = []
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        for doctor_id, address in conn.execute(
+            "SELECT doctor_id, hospital_location FROM doctors WHERE geocoded_location IS NOT hospital_location"
+        ).fetchall():
+            if address not in located:
+                located[address] = geocode_address(address) or (None, None)
+            updates.append(located[address] + (address, doctor_id))
+        if updates:
+            conn.executemany(
+                "UPDATE doctors SET latitude = ?, longitude = ?, geocoded_location = ? WHERE doctor_id = ?",
+                updates
+            )
+            bump_catalog_version(conn)
+    return sum(1 for update in updates if update[0] is not None)
+
+
+# Create or upgrade the database and load the seed data. Safe to run from several processes at
+# once: every step that reads before it writes holds the write lock for the whole step.
+@METRICS.timed("initialize_database")
+def initialize_database(db_path=DB_PATH, seed_rows=None):
+    if seed_rows is None:
+        from medibot.seed_data import DOCTORS_SEED
+        seed_rows = DOCTORS_SEED
+    with connection(db_path) as conn:
+        migrate_database(conn)
+        sync_seed_data(conn, seed_rows)
+        geocode_doctors(conn)
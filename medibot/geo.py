@@ -0,0 +1,114 @@
+import csv
+import math
+import os
+import re
+from functools import lru_cache
+
+# Bundled PIN code -> coordinates table, so hospitals and users are located without any network calls
+PINCODE_TABLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "pincodes.csv")
+
+# Older or alternative spellings users type for places in the table
+PLACE_ALIASES = {
+    "bangalore": "bengaluru", "mysore": "mysuru", "mangalore": "mangaluru", "belgaum": "belagavi",
+    "hubli": "hubballi", "shimoga": "shivamogga", "gulbarga": "kalaburagi", "bellary": "ballari",
+    "bijapur": "vijayapura", "tumkur": "tumakuru", "davangere": "davanagere", "chikmagalur": "chikkamagaluru",
+}
+
+# Search radius used when a location is given without one
+DEFAULT_RADIUS_KM = 25
+
+# Side of one spatial grid cell in degrees (about 28 km north-south)
+GRID_CELL_DEGREES = 0.25
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = 111.195
+
+PINCODE_PATTERN = re.compile(r"\b(\d{6})\b")
+
+
+# {pincode: (latitude, longitude)} and {place name: (latitude, longitude)}, read once
+@lru_cache(maxsize=None)
+def load_pincodes(path=PINCODE_TABLE):
+    by_pincode, by_place = {}, {}
+    with open(path, newline="", encoding="utf-8") as handle:
+        for record in csv.DictReader(handle):
+            point = (float(record["latitude"]), float(record["longitude"]))
+            by_pincode[record["pincode"]] = point
+            by_place.setdefault(record["place"].lower(), point)
+    return by_pincode, by_place
+
+
+# Coordinates of a PIN code. Unknown codes fall back to the average of known codes sharing
+# their first three digits (the sorting district), which is close enough for distance ranking.
+def pincode_location(pincode):
+    by_pincode, _ = load_pincodes()
+    if pincode in by_pincode:
+        return by_pincode[pincode]
+    nearby = [point for code, point in by_pincode.items() if code[:3] == pincode[:3]]
+    if not nearby:
+        return None
+    return (
+        sum(point[0] for point in nearby) / len(nearby),
+        sum(point[1] for point in nearby) / len(nearby),
+    )
+
+
+# Coordinates of a free-text hospital address, from the PIN code in it
+def geocode_address(address):
+    match = PINCODE_PATTERN.search(address)
+    return pincode_location(match.group(1)) if match else None
+
+
+# Coordinates for what a user typed as their location: a PIN code or a place name
+def locate(query):
+    query = query.strip()
+    match = PINCODE_PATTERN.fullmatch(query)
+    if match:
+        return pincode_location(match.group(1))
+    _, by_place = load_pincodes()
+    name = query.split(",")[0].strip().lower()
+    return by_place.get(PLACE_ALIASES.get(name, name))
+
+
+# Great-circle distance between two (latitude, longitude) points
+def haversine_km(a, b):
+    lat1, lon1, lat2, lon2 = map(math.radians, (a[0], a[1], b[0], b[1]))
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(h))
+
+
+# (min latitude, max latitude, min longitude, max longitude) enclosing a circle around a point
+def bounding_box(center, radius_km):
+    lat_span = radius_km / KM_PER_DEGREE
+    lon_span = radius_km / (KM_PER_DEGREE * max(math.cos(math.radians(center[0])), 0.01))
+    return center[0] - lat_span, center[0] + lat_span, center[1] - lon_span, center[1] + lon_span
+
+
+# Uniform latitude/longitude grid of items, split into independent layers (e.g. one per
+# specialization). A radius query only visits the cells overlapping the circle's bounding box,
+# so its cost depends on how many items are nearby, not on the size of the catalog.
+class SpatialGrid:
+    def __init__(self, cell_degrees=GRID_CELL_DEGREES):
+        self.cell_degrees = cell_degrees
+        self.cells = {}
+
+    def _cell(self, latitude, longitude):
+        return math.floor(latitude / self.cell_degrees), math.floor(longitude / self.cell_degrees)
+
+    def add(self, layer, point, item):
+        self.cells.setdefault((layer,) + self._cell(*point), []).append((point, item))
+
+    # (distance in km, item) for every item in the layer within radius_km of center, nearest first
+    def within(self, layer, center, radius_km):
+        min_lat, max_lat, min_lon, max_lon = bounding_box(center, radius_km)
+        low_row, low_column = self._cell(min_lat, min_lon)
+        high_row, high_column = self._cell(max_lat, max_lon)
+        found = []
+        for row in range(low_row, high_row + 1):
+            for column in range(low_column, high_column + 1):
+                for point, item in self.cells.get((layer, row, column), ()):
+                    distance = haversine_km(center, point)
+                    if distance <= radius_km:
+                        found.append((distance, item))
+        found.sort(key=lambda entry: entry[0])
+        return found
@@ -0,0 +1,265 @@
+# Bulk-load doctors from CSV or JSONL files into the database.
+#
+#   python -m medibot.ingest directory.csv [more files...] [--batch-size 1000] [--db PATH]
+#
+# Files are read as a stream and written in fixed-size batches, one transaction per batch, so
+# memory use stays flat for any file size. Rows are matched to existing doctors by
+# doctor_identity_number: a match is updated, anything else is inserted.
+#
+# Identity numbers are not unique (the seed data has different doctors sharing one), so when
+# several doctors have the number, only those with the imported row's name are the same doctor.
+# The oldest of them is updated and any other copies are removed, each one logged. A row that
+# matches none of several doctors is ambiguous and rejected. When an import takes over a seed
+# doctor it records that doctor's name, and seed sync (medibot.database.sync_seed_data) then
+# leaves that doctor alone, so a later seed change never brings the seed version back next to
+# the import. The full-text symptom
+# index and the specialization index are maintained row by row as each batch is written, and
+# new hospital addresses are geocoded once the files are loaded.
+import argparse
+import csv
+import json
+import re
+import sys
+import time
+from itertools import islice
+
+from medibot.database import (
+    DB_PATH, DOCTOR_COLUMNS, WEEKDAYS, bump_catalog_version, geocode_doctors, migrate_database, name_key
+)
+from medibot.repository import connection
+
+BATCH_SIZE = 1000
+
+LOCATION_INDEX = DOCTOR_COLUMNS.index("hospital_location")
+
+WEEKDAY_NAMES = {day.lower(): day for day in WEEKDAYS}
+WEEKDAY_NAMES.update({day[:3].lower(): day for day in WEEKDAYS})
+
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+AVAILABILITY_PATTERN = re.compile(r"^(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})$")
+
+
+# A row that failed validation; the message says which field and why
+class InvalidRow(ValueError):
+    pass
+
+
+# 10-digit number; country code 91 or a trunk 0 in front of it is dropped
+def normalize_phone(value):
+    digits = re.sub(r"\D", "", value)
+    if len(digits) == 12 and digits.startswith("91"):
+        digits = digits[2:]
+    elif len(digits) == 11 and digits.startswith("0"):
+        digits = digits[1:]
+    if len(digits) != 10:
+        raise InvalidRow(f"contact {value!r} is not a 10-digit phone number")
+    return digits
+
+
+def normalize_email(value):
+    email = value.strip().lower()
+    if not EMAIL_PATTERN.match(email):
+        raise InvalidRow(f"email {value!r} is not a valid address")
+    return email
+
+
+# Full or three-letter day names in any case and separator, stored in week order as "Monday, Friday"
+def normalize_working_days(value):
+    days = set()
+    for name in re.split(r"[\s,;/|]+", value.strip()):
+        if not name:
+            continue
+        day = WEEKDAY_NAMES.get(name.lower())
+        if day is None:
+            raise InvalidRow(f"working_days has unknown day {name!r}")
+        days.add(day)
+    if not days:
+        raise InvalidRow("working_days is empty")
+    return ", ".join(day for day in WEEKDAYS if day in days)
+
+
+# "9:00 - 17:30" -> "09:00-17:30". Hours must close later the same day (at 24:00 at the
+# latest); overnight ranges such as 22:00-06:00 are rejected, because availability search
+# matches opens_at <= time < closes_at within one day.
+def normalize_availability(value):
+    match = AVAILABILITY_PATTERN.match(value.strip())
+    if not match:
+        raise InvalidRow(f"availability {value!r} is not in HH:MM-HH:MM form")
+    open_hour, open_minute, close_hour, close_minute = (int(part) for part in match.groups())
+    opens_at, closes_at = open_hour * 60 + open_minute, close_hour * 60 + close_minute
+    if open_hour > 23 or open_minute > 59 or close_minute > 59 or closes_at > 24 * 60:
+        raise InvalidRow(f"availability {value!r} is not a valid time range")
+    if opens_at >= closes_at:
+        raise InvalidRow(f"availability {value!r} does not close after it opens (overnight hours are not supported)")
+    return f"{open_hour:02d}:{open_minute:02d}-{close_hour:02d}:{close_minute:02d}"
+
+
+def normalize_rating(value):
+    try:
+        rating = float(value)
+    except ValueError:
+        raise InvalidRow(f"rating {value!r} is not a number") from None
+    if not 0 <= rating <= 5:
+        raise InvalidRow(f"rating {value!r} is outside 0-5")
+    return round(rating, 1)
+
+
+NORMALIZERS = {
+    "contact": normalize_phone,
+    "email": normalize_email,
+    "working_days": normalize_working_days,
+    "availability": normalize_availability,
+    "rating": normalize_rating,
+}
+
+
+# Validate a record read from a file and return it as a tuple in DOCTOR_COLUMNS order
+def normalize_row(record):
+    if not isinstance(record, dict):
+        raise InvalidRow("row is not a JSON object")
+    row = []
+    for column in DOCTOR_COLUMNS:
+        value = record.get(column)
+        value = "" if value is None else str(value).strip()
+        if not value:
+            raise InvalidRow(f"{column} is missing")
+        normalize = NORMALIZERS.get(column)
+        row.append(normalize(value) if normalize else value)
+    return tuple(row)
+
+
+# (line number, record dict) for each row of a CSV or JSONL file, read lazily
+def read_records(path, file_format=None):
+    file_format = file_format or ("csv" if path.lower().endswith(".csv") else "jsonl")
+    with open(path, newline="", encoding="utf-8") as handle:
+        if file_format == "csv":
+            reader = csv.DictReader(handle)
+            for record in reader:
+                yield reader.line_num, record
+        else:
+            for line_number, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_number, json.loads(line)
+                except json.JSONDecodeError:
+                    yield line_number, None
+
+
+# Write one batch of normalized rows in a single transaction; returns (inserted, updated,
+# removed, rejected), where removed counts extra copies of an updated doctor and rejected the
+# rows that could not be matched to one doctor. Both are reported through `log`.
+def upsert_batch(conn, rows, source, log=print):
+    # The last row for an identity number within a batch wins
+    by_identity = {row[0]: row for row in rows}
+    identities = list(by_identity)
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        existing = {}
+        for identity, doctor_id, name in conn.execute(
+            f"SELECT doctor_identity_number, doctor_id, doctor_name FROM doctors "
+            f"WHERE doctor_identity_number IN ({', '.join('?' * len(identities))}) "
+            f"ORDER BY doctor_id",
+            identities
+        ):
+            existing.setdefault(identity, []).append((doctor_id, name))
+
+        updates, duplicates, inserts, rejected = [], [], [], 0
+        for identity, row in by_identity.items():
+            matches = existing.get(identity, [])
+            if len(matches) > 1:
+                matches = [match for match in matches if name_key(match[1]) == name_key(row[1])]
+                if not matches:
+                    rejected += 1
+                    log(
+                        f"skipped {row[1]!r}: doctor_identity_number {identity} is shared by "
+                        f"{len(existing[identity])} doctors and none of them has this name"
+                    )
+                    continue
+            if not matches:
+                inserts.append(row + (source,))
+                continue
+            updates.append(row[1:] + (source, row[LOCATION_INDEX], row[LOCATION_INDEX], matches[0][0]))
+            for doctor_id, name in matches[1:]:
+                duplicates.append((doctor_id,))
+                log(f"removed doctor {doctor_id} ({name!r}), a second copy of doctor_identity_number {identity}")
+
+        # The right-hand sides see the row as it was, so coordinates are kept only while the
+        # address stays the same (a new address is looked up again by geocode_doctors), and a
+        # seed doctor's name is remembered when the import takes it over
+        assignments = ", ".join(f"{column} = ?" for column in DOCTOR_COLUMNS[1:])
+        keep_if_same_address = "CASE WHEN hospital_location IS ? THEN {} END"
+        conn.executemany("DELETE FROM doctors WHERE doctor_id = ?", duplicates)
+        conn.executemany(
+            f"UPDATE doctors SET {assignments}, source = ?, "
+            f"replaces_seed_name = CASE WHEN source = 'seed' THEN doctor_name ELSE replaces_seed_name END, "
+            f"latitude = {keep_if_same_address.format('latitude')}, "
+            f"longitude = {keep_if_same_address.format('longitude')} "
+            f"WHERE doctor_id = ?",
+            updates
+        )
+        conn.executemany(
+            f"INSERT INTO doctors ({', '.join(DOCTOR_COLUMNS)}, source) "
+            f"VALUES ({', '.join('?' * (len(DOCTOR_COLUMNS) + 1))})",
+            inserts
+        )
+        bump_catalog_version(conn)
+    return len(inserts), len(updates), len(duplicates), rejected
+
+
+# Import files into the database and return counts for the report
+def ingest(paths, db_path=DB_PATH, batch_size=BATCH_SIZE, file_format=None, log=print):
+    stats = {"rows": 0, "inserted": 0, "updated": 0, "removed": 0, "rejected": 0}
+    started_at = time.perf_counter()
+    with connection(db_path) as conn:
+        migrate_database(conn)
+        for path in paths:
+            records = read_records(path, file_format)
+            while True:
+                batch = list(islice(records, batch_size))
+                if not batch:
+                    break
+                rows = []
+                for line_number, record in batch:
+                    try:
+                        rows.append(normalize_row(record))
+                    except InvalidRow as error:
+                        stats["rejected"] += 1
+                        log(f"{path}:{line_number}: skipped, {error}")
+                if rows:
+                    inserted, updated, removed, rejected = upsert_batch(
+                        conn, rows, f"import:{path}", log=lambda message, path=path: log(f"{path}: {message}")
+                    )
+                    stats["inserted"] += inserted
+                    stats["updated"] += updated
+                    stats["removed"] += removed
+                    stats["rejected"] += rejected
+                stats["rows"] += len(batch)
+        stats["geocoded"] = geocode_doctors(conn)
+    stats["seconds"] = time.perf_counter() - started_at
+    stats["rows_per_second"] = stats["rows"] / stats["seconds"] if stats["seconds"] else 0.0
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import doctors from CSV or JSONL files.")
+    parser.add_argument("paths", nargs="+", help="CSV or JSONL files with one doctor per row")
+    parser.add_argument("--db", default=DB_PATH, help="SQLite database to load into")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="rows per transaction")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="file format (default: from extension)")
+    args = parser.parse_args(argv)
+
+    stats = ingest(
+        args.paths, args.db, args.batch_size, args.format,
+        log=lambda message: print(message, file=sys.stderr)
+    )
+    print(
+        f"{stats['rows']} rows in {stats['seconds']:.2f}s ({stats['rows_per_second']:.0f} rows/s): "
+        f"{stats['inserted']} inserted, {stats['updated']} updated, {stats['removed']} duplicates removed, "
+        f"{stats['rejected']} rejected, "
+        f"{stats['geocoded']} geocoded"
+    )
+
+
+if __name__ == "__main__":
+    main()
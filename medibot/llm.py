@@ -0,0 +1,112 @@
+import hashlib
+import os
+import random
+import threading
+import time
+from types import SimpleNamespace
+
+# Which backend answers model requests: "gemini" (the Google API) or "fake" (local, for offline work)
+LLM_BACKEND = os.getenv("MEDIBOT_LLM_BACKEND", "gemini")
+
+GEMINI_MODEL = os.getenv("MEDIBOT_GEMINI_MODEL", "gemini-pro")
+
+# Filler the fake backend draws its replies from
+FAKE_WORDS = (
+    "please consult a qualified doctor about these symptoms rest drink fluids and monitor "
+    "any changes the listed specialists treat this condition and can advise further"
+).split()
+
+
+# Raised by the fake backend when a failure is injected
+class FakeBackendError(RuntimeError):
+    pass
+
+
+# Every backend offers the same two calls. send_message continues a conversation given as
+# start_chat()-style history and returns an object with .text, or with stream=True an iterable
+# of such chunks. generate_content answers a single prompt with no history, the same way.
+class GeminiBackend:
+    def __init__(self, model_name=GEMINI_MODEL, api_key=None):
+        import google.generativeai as genai
+
+        genai.configure(api_key=api_key or os.getenv("GOOGLE_API_KEY"))
+        self.model = genai.GenerativeModel(model_name)
+
+    def send_message(self, history, content, stream=False):
+        return self.model.start_chat(history=history).send_message(content, stream=stream)
+
+    def generate_content(self, prompt, stream=False):
+        return self.model.generate_content(prompt, stream=stream)
+
+
+# Local stand-in with no network. Replies are derived from a hash of the prompt, so the same
+# prompt always gets the same text, and timing and failures are configurable.
+class FakeBackend:
+    def __init__(
+        self,
+        first_token_latency=0.2,
+        chunk_latency=0.05,
+        chunk_words=5,
+        reply_words=60,
+        failure_rate=0.0,
+        stream_failure_rate=0.0,
+        seed=0,
+    ):
+        self.first_token_latency = first_token_latency
+        self.chunk_latency = chunk_latency
+        self.chunk_words = chunk_words
+        self.reply_words = reply_words
+        self.failure_rate = failure_rate
+        self.stream_failure_rate = stream_failure_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _roll(self, rate):
+        with self._lock:
+            return self._random.random() < rate
+
+    def reply(self, content):
+        digest = hashlib.sha256(content.encode("utf-8")).digest()
+        words = [FAKE_WORDS[(digest[i % len(digest)] + i) % len(FAKE_WORDS)] for i in range(self.reply_words)]
+        return f"[{digest.hex()[:8]}] " + " ".join(words)
+
+    def _chunks(self, text, fail_midway):
+        words = text.split(" ")
+        chunk_count = -(-len(words) // self.chunk_words)
+        time.sleep(self.first_token_latency)
+        for index in range(chunk_count):
+            if fail_midway and index == chunk_count // 2:
+                raise FakeBackendError("injected failure during stream")
+            if index:
+                time.sleep(self.chunk_latency)
+            piece = " ".join(words[index * self.chunk_words:(index + 1) * self.chunk_words])
+            yield SimpleNamespace(text=piece if index == 0 else " " + piece)
+
+    def send_message(self, history, content, stream=False):
+        if self._roll(self.failure_rate):
+            raise FakeBackendError("injected failure")
+        chunks = self._chunks(self.reply(content), self._roll(self.stream_failure_rate))
+        if stream:
+            return chunks
+        return SimpleNamespace(text="".join(chunk.text for chunk in chunks))
+
+    def generate_content(self, prompt, stream=False):
+        return self.send_message([], prompt, stream=stream)
+
+
+# Backend named by MEDIBOT_LLM_BACKEND; the fake one reads its settings from MEDIBOT_FAKE_LLM_*
+def load_backend(name=None):
+    name = (name or LLM_BACKEND).lower()
+    if name == "gemini":
+        return GeminiBackend()
+    if name == "fake":
+        return FakeBackend(
+            first_token_latency=float(os.getenv("MEDIBOT_FAKE_LLM_LATENCY", "0.2")),
+            chunk_latency=float(os.getenv("MEDIBOT_FAKE_LLM_CHUNK_LATENCY", "0.05")),
+            chunk_words=int(os.getenv("MEDIBOT_FAKE_LLM_CHUNK_WORDS", "5")),
+            reply_words=int(os.getenv("MEDIBOT_FAKE_LLM_REPLY_WORDS", "60")),
+            failure_rate=float(os.getenv("MEDIBOT_FAKE_LLM_FAILURE_RATE", "0")),
+            stream_failure_rate=float(os.getenv("MEDIBOT_FAKE_LLM_STREAM_FAILURE_RATE", "0")),
+            seed=int(os.getenv("MEDIBOT_FAKE_LLM_SEED", "0")),
+        )
+    raise ValueError(f"Unknown LLM backend: {name!r} (expected 'gemini' or 'fake')")
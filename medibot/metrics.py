@@ -0,0 +1,156 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+# Upper bounds of the latency histogram buckets, in seconds, from sub-millisecond database work
+# up to a slow model response
+LATENCY_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+
+# Cumulative-style latency histogram with fixed buckets, so memory stays constant however many
+# values are observed. Quantiles are estimated from the buckets the way Prometheus does.
+class Histogram:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        # One count per bucket, plus a last one for values above the largest bound
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    # Estimated q-quantile (0..1), interpolating linearly inside the bucket it falls in
+    def quantile(self, q):
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                if index == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[index - 1] if index else 0.0
+                return lower + (self.buckets[index] - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+
+# Per-stage call counts, error counts and latency histograms for one process
+class Metrics:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._histograms = {}
+        self._errors = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage, seconds, error=False):
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = Histogram(self.buckets)
+                self._errors[stage] = 0
+            histogram.observe(seconds)
+            if error:
+                self._errors[stage] += 1
+
+    # `with metrics.timer("stage"):` times the block; an exception counts as an error
+    @contextmanager
+    def timer(self, stage):
+        started_at = time.perf_counter()
+        error = False
+        try:
+            yield
+        except Exception:
+            error = True
+            raise
+        finally:
+            self.observe(stage, time.perf_counter() - started_at, error)
+
+    # Decorator timing every call of a function under `stage`
+    def timed(self, stage):
+        def decorate(function):
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                with self.timer(stage):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    # Pass a stream of chunks through, recording the time to the first chunk as
+    # "<stage>_first_chunk" and to the end of the stream as `stage`. A stream closed before its
+    # end (a reader that gave up or timed out) is recorded as "<stage>_cancelled" instead, so
+    # its cut-short duration does not pass for a complete response.
+    def timed_stream(self, stage, chunks):
+        started_at = time.perf_counter()
+        first_chunk = True
+        error = cancelled = False
+        try:
+            for chunk in chunks:
+                if first_chunk:
+                    self.observe(f"{stage}_first_chunk", time.perf_counter() - started_at)
+                    first_chunk = False
+                yield chunk
+        except GeneratorExit:
+            cancelled = True
+            raise
+        except BaseException:
+            error = True
+            raise
+        finally:
+            self.observe(f"{stage}_cancelled" if cancelled else stage, time.perf_counter() - started_at, error)
+
+    # {stage: {"count", "errors", "mean", "p50", "p99"}} with times in seconds
+    def summary(self):
+        with self._lock:
+            return {
+                stage: {
+                    "count": histogram.count,
+                    "errors": self._errors[stage],
+                    "mean": histogram.sum / histogram.count,
+                    "p50": histogram.quantile(0.5),
+                    "p99": histogram.quantile(0.99),
+                }
+                for stage, histogram in sorted(self._histograms.items())
+            }
+
+    # Everything recorded, in the Prometheus text exposition format
+    def prometheus_text(self, prefix="medibot"):
+        duration = f"{prefix}_stage_duration_seconds"
+        errors = f"{prefix}_stage_errors_total"
+        lines = [
+            f"# HELP {duration} Time spent in each stage of a request.",
+            f"# TYPE {duration} histogram",
+        ]
+        # Copy each histogram under the lock, so its buckets, sum and count describe the same calls
+        with self._lock:
+            stages = [
+                (stage, list(histogram.counts), histogram.sum, histogram.count, self._errors[stage])
+                for stage, histogram in sorted(self._histograms.items())
+            ]
+        for stage, counts, total, count, _ in stages:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + ("+Inf",), counts):
+                cumulative += bucket_count
+                lines.append(f'{duration}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+            lines.append(f'{duration}_sum{{stage="{stage}"}} {total}')
+            lines.append(f'{duration}_count{{stage="{stage}"}} {count}')
+        lines += [f"# HELP {errors} Calls of each stage that raised an error.", f"# TYPE {errors} counter"]
+        lines += [f'{errors}{{stage="{stage}"}} {error_count}' for stage, *_, error_count in stages]
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._errors.clear()
+
+
+# Process-wide metrics every instrumented stage records into
+METRICS = Metrics()
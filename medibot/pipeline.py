@@ -0,0 +1,83 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Model calls allowed in flight at once per process; further requests queue for a free worker
+MAX_CONCURRENT_LLM_CALLS = int(os.getenv("MEDIBOT_MAX_LLM_CALLS", "4"))
+
+# Seconds a request may take, including time spent waiting for a worker
+LLM_TIMEOUT = float(os.getenv("MEDIBOT_LLM_TIMEOUT", "60"))
+
+_DONE = object()
+
+
+# Chunks produced by a background model call, read on the script thread as they arrive.
+# Iterating stops at the deadline (setting timed_out) or when the call fails (setting error,
+# rather than raising into the page), and cancels the call if abandoned early.
+class BackgroundStream:
+    def __init__(self, deadline):
+        self.deadline = deadline
+        self.timed_out = False
+        self.error = None
+        self.cancelled = threading.Event()
+        self._chunks = queue.Queue()
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def __iter__(self):
+        try:
+            while True:
+                remaining = self.deadline - time.monotonic()
+                try:
+                    item = self._chunks.get(timeout=max(remaining, 0))
+                except queue.Empty:
+                    self.timed_out = True
+                    return
+                if item is _DONE:
+                    return
+                if isinstance(item, BaseException):
+                    self.error = item
+                    return
+                yield item
+        finally:
+            # Reaching here without _DONE (timeout, error or a rerun closing the generator)
+            # tells the worker to stop; after _DONE it is a no-op
+            self.cancel()
+
+
+# Runs model calls on a bounded pool of worker threads so the page can carry on rendering
+class LLMWorkerPool:
+    def __init__(self, max_concurrent=MAX_CONCURRENT_LLM_CALLS, timeout=LLM_TIMEOUT):
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_concurrent, thread_name_prefix="medibot-llm")
+
+    # `produce` is called on a worker and returns the chunks of a (streamed) response
+    def submit(self, produce):
+        stream = BackgroundStream(time.monotonic() + self.timeout)
+        self._executor.submit(self._run, produce, stream)
+        return stream
+
+    def _run(self, produce, stream):
+        chunks = None
+        try:
+            # Skip requests cancelled or expired while waiting for a worker
+            if stream.cancelled.is_set() or time.monotonic() >= stream.deadline:
+                return
+            chunks = produce()
+            for chunk in chunks:
+                if stream.cancelled.is_set():
+                    break
+                stream._chunks.put(chunk)
+        except Exception as error:
+            stream._chunks.put(error)
+        finally:
+            # Closing an unfinished generator keeps partial answers out of the response cache
+            if stream.cancelled.is_set() and hasattr(chunks, "close"):
+                chunks.close()
+            stream._chunks.put(_DONE)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
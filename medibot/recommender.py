@@ -0,0 +1,200 @@
+import re
+import threading
+
+from medibot import database
+from medibot.catalog import DoctorCatalog
+from medibot.database import DB_PATH, DOCTOR_COLUMNS, WEEKDAYS
+from medibot.geo import DEFAULT_RADIUS_KM, haversine_km, locate
+from medibot.llm import load_backend
+from medibot.metrics import METRICS
+from medibot.response_cache import ResponseCache, cache_key, cached_chunks
+from medibot.search import RESULT_COLUMNS, TOP_K, query_database
+
+# Most doctors one request may ask for
+MAX_LIMIT = 100
+
+TIME_PATTERN = re.compile(r"^(\d{1,2}):(\d{2})$")
+
+
+# A request with a missing or malformed field; the message says which one
+class InvalidRequest(ValueError):
+    pass
+
+
+# Prompt asking the model to explain why the doctors found suit the symptoms
+def recommendation_prompt(question, doctor_details):
+    context = (
+        f"You are a doctor recommendation chatbot. "
+        f"Based on the input '{question}', the following doctors are suitable for the symptoms:\n"
+    )
+    for doctor in doctor_details:
+        context += (
+            f"Doctor Identity Number: {doctor[0]}, Name: {doctor[1]}, Specialization: {doctor[2]}, "
+            f"Contact: {doctor[3]}, Email: {doctor[4]}, Hospital: {doctor[5]}, Location: {doctor[6]}, "
+            f"Availability: {doctor[7]}, Working Days: {', '.join(doctor[8])}\n\n"
+        )
+    return context + "Please provide a summary of the doctor details and why these doctors are suitable."
+
+
+# Prompt for a general medical question
+def question_prompt(question):
+    return (
+        f"You are an intelligent chatbot. "
+        f"Answer the user's question '{question}' in under 200 words."
+    )
+
+
+# Chunks of the model's answer to a question, or its summary of doctor_details (rows from
+# query_database). Each prompt carries everything the model needs and is sent without any
+# conversation history, so a repeated question is answered from the cache whoever asks it.
+# Timing is recorded as the "get_gemini_response" stage.
+def model_response(question, doctor_details, backend, cache):
+    return METRICS.timed_stream("get_gemini_response", _model_chunks(question, doctor_details, backend, cache))
+
+
+def _model_chunks(question, doctor_details, backend, cache):
+    if doctor_details:
+        context = recommendation_prompt(question, doctor_details)
+    else:
+        context = question_prompt(question)
+
+    key = cache_key(question, doctor_details or ())
+    cached = cache.get(key)
+    if cached is not None:
+        yield from cached_chunks(cached)
+        return
+
+    yield from cache.store_stream(key, backend.generate_content(context, stream=True))
+
+
+def _weekday(value):
+    name = str(value).strip().lower()
+    for index, day in enumerate(WEEKDAYS):
+        if name in (day.lower(), day[:3].lower()):
+            return index
+    raise InvalidRequest(f"day {value!r} is not a day of the week")
+
+
+def _minute_of_day(value):
+    match = TIME_PATTERN.match(str(value).strip())
+    if not match or int(match.group(1)) > 23 or int(match.group(2)) > 59:
+        raise InvalidRequest(f"time {value!r} is not in HH:MM form")
+    return int(match.group(1)) * 60 + int(match.group(2))
+
+
+def _integer(request, field, default, low, high):
+    value = request.get(field, default)
+    if isinstance(value, bool) or not isinstance(value, int) or not low <= value <= high:
+        raise InvalidRequest(f"{field} must be a whole number from {low} to {high}")
+    return value
+
+
+# Search filters from a JSON-style request: optional "day" (e.g. "Monday"), "time" ("HH:MM",
+# needs a day), "location" (PIN code or city), "radius_km" and "nearest_first"
+def search_filters(request):
+    filters = {"weekday": None, "open_at": None, "near": None}
+    if request.get("day"):
+        filters["weekday"] = _weekday(request["day"])
+        if request.get("time"):
+            filters["open_at"] = _minute_of_day(request["time"])
+    elif request.get("time"):
+        raise InvalidRequest("time needs a day")
+    if request.get("location"):
+        filters["near"] = locate(str(request["location"]))
+        if filters["near"] is None:
+            raise InvalidRequest(f"location {request['location']!r} is not a known PIN code or city")
+    radius_km = request.get("radius_km", DEFAULT_RADIUS_KM)
+    if isinstance(radius_km, bool) or not isinstance(radius_km, (int, float)) or radius_km <= 0:
+        raise InvalidRequest("radius_km must be a positive number")
+    filters["radius_km"] = radius_km
+    filters["nearest_first"] = bool(request.get("nearest_first", False))
+    return filters
+
+
+# The recommendation engine without any user interface: symptom search, specialization lookup
+# and model summaries over one database. It is safe to share between threads. The database,
+# catalog and model backend are set up on first use, so creating one is cheap.
+class Recommender:
+    def __init__(self, db_path=DB_PATH, backend=None, cache=None):
+        self.db_path = db_path
+        self._backend = backend
+        self._cache = cache
+        self._catalog = None
+        self._lock = threading.Lock()
+
+    # Catalog snapshot, reloaded when the database has changed since it was built
+    @property
+    def catalog(self):
+        with self._lock:
+            if self._catalog is None:
+                database.initialize_database(self.db_path)
+                self._catalog = DoctorCatalog.from_database(self.db_path)
+            elif self._catalog.is_stale():
+                self._catalog = DoctorCatalog.from_database(self.db_path)
+            return self._catalog
+
+    @property
+    def backend(self):
+        with self._lock:
+            if self._backend is None:
+                self._backend = load_backend()
+            return self._backend
+
+    @property
+    def cache(self):
+        with self._lock:
+            if self._cache is None:
+                self._cache = ResponseCache()
+            return self._cache
+
+    # Ranked doctors for a request {"symptoms": ..., "limit", "offset", "summary", plus the
+    # search_filters fields}. Each doctor is a dict of RESULT_COLUMNS (and distance_km); with
+    # "summary": true the model's explanation of these results is added.
+    def recommend(self, request):
+        symptoms = request.get("symptoms")
+        if not isinstance(symptoms, str) or not symptoms.strip():
+            raise InvalidRequest("symptoms is missing")
+        limit = _integer(request, "limit", TOP_K, 1, MAX_LIMIT)
+        offset = _integer(request, "offset", 0, 0, 10 ** 9)
+        filters = search_filters(request)
+
+        rows = query_database(
+            symptoms, self.db_path, limit, catalog=self.catalog, offset=offset, **filters
+        ) or []
+        result = {
+            "symptoms": symptoms,
+            "doctors": [dict(zip(RESULT_COLUMNS + ("distance_km",), row)) for row in rows],
+        }
+        if request.get("summary") and rows:
+            # A failed model call still returns the doctors found, with the reason in summary_error
+            try:
+                chunks = model_response(symptoms, rows, self.backend, self.cache)
+                result["summary"] = "".join(chunk.text for chunk in chunks)
+            except Exception as error:
+                result["summary_error"] = str(error) or type(error).__name__
+        return result
+
+    # Doctors of one specialization for a request {"specialization": ..., "limit", "offset",
+    # plus the search_filters fields}, best rated (or nearest) first
+    def doctors(self, request):
+        catalog = self.catalog
+        specialization = request.get("specialization")
+        if not isinstance(specialization, str) or specialization not in catalog.specialization_index:
+            raise InvalidRequest(f"specialization {specialization!r} is not known")
+        limit = _integer(request, "limit", TOP_K, 1, MAX_LIMIT)
+        offset = _integer(request, "offset", 0, 0, 10 ** 9)
+        filters = search_filters(request)
+        near = filters["near"]
+
+        found = catalog.doctors_by_specialization(specialization, **filters)
+        doctors = []
+        for doctor in found[offset:offset + limit]:
+            record = dict(zip(DOCTOR_COLUMNS, doctor.row(DOCTOR_COLUMNS)))
+            record["working_days"] = record["working_days"].split(", ")
+            if near is not None:
+                record["distance_km"] = round(haversine_km(near, (doctor.latitude, doctor.longitude)), 1)
+            doctors.append(record)
+        return {"specialization": specialization, "total": len(found), "doctors": doctors}
+
+    def specializations(self):
+        return list(self.catalog.specializations)
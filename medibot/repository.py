@@ -0,0 +1,101 @@
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from medibot.metrics import METRICS
+
+# SQLite database for the Doctor Recommendation Chatbot
+DB_PATH = "doctor_recommendations.db"
+
+# Most connections a single pool keeps open at once
+POOL_SIZE = 8
+
+# Seconds to wait for a free connection, and for SQLite's write lock (busy timeout)
+POOL_TIMEOUT = 30
+
+# Prepared statements kept per connection, so repeated queries skip re-parsing their SQL
+STATEMENT_CACHE_SIZE = 256
+
+
+# Bounded pool of SQLite connections. Each thread checks out its own connection for the
+# duration of a `with pool.connection()` block; nested blocks on that thread reuse it.
+class ConnectionPool:
+    def __init__(self, db_path=DB_PATH, size=POOL_SIZE, timeout=POOL_TIMEOUT):
+        self.db_path = db_path
+        self.size = size
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _connect(self):
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.timeout,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        # WAL lets readers run alongside a writer instead of waiting on it
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def connection(self):
+        held = getattr(self._local, "conn", None)
+        if held is not None:
+            yield held
+            return
+
+        # Time spent waiting for a free slot and opening a connection shows up as "db_connect"
+        started_at = time.perf_counter()
+        if not self._slots.acquire(timeout=self.timeout):
+            METRICS.observe("db_connect", time.perf_counter() - started_at, error=True)
+            raise sqlite3.OperationalError("timed out waiting for a pooled database connection")
+        try:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                conn = self._connect()
+        except BaseException:
+            self._slots.release()
+            raise
+        METRICS.observe("db_connect", time.perf_counter() - started_at)
+
+        self._local.conn = conn
+        try:
+            yield conn
+        finally:
+            self._local.conn = None
+            if conn.in_transaction:
+                conn.rollback()
+            with self._lock:
+                self._idle.append(conn)
+            self._slots.release()
+
+    # Close the idle connections, e.g. before deleting the database file
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+# Process-wide pool for a database file, created on first use
+def get_pool(db_path=DB_PATH):
+    with _pools_lock:
+        pool = _pools.get(db_path)
+        if pool is None:
+            pool = _pools[db_path] = ConnectionPool(db_path)
+        return pool
+
+
+# Shortcut for `with get_pool(db_path).connection() as conn:`
+def connection(db_path=DB_PATH):
+    return get_pool(db_path).connection()
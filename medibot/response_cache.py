@@ -0,0 +1,131 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
+
+from medibot.repository import connection
+
+# Answers kept in memory, least recently used evicted first
+CACHE_SIZE = int(os.getenv("MEDIBOT_RESPONSE_CACHE_SIZE", "512"))
+
+# Seconds an answer stays valid
+CACHE_TTL = int(os.getenv("MEDIBOT_RESPONSE_CACHE_TTL", "86400"))
+
+# SQLite file for the persistent tier; unset keeps the cache in memory only
+CACHE_DB_PATH = os.getenv("MEDIBOT_RESPONSE_CACHE_DB") or None
+
+
+# Cache key for a question: case, punctuation and spacing are ignored. `doctors` are the rows
+# given to the model as context, and every field of them is part of the key, so a summary is
+# never served for doctors whose details have changed since, or for a different doctor who
+# happens to share an identity number.
+def cache_key(question, doctors=()):
+    normalized = " ".join(re.findall(r"\w+", question.lower()))
+    context = hashlib.sha256(json.dumps([list(doctor) for doctor in doctors], default=str).encode("utf-8")).hexdigest()
+    return hashlib.sha256(f"{normalized}|{context}".encode("utf-8")).hexdigest()
+
+
+# Cached answer in the shape of a streamed response: an iterable of chunks with .text
+def cached_chunks(text):
+    return [SimpleNamespace(text=text)]
+
+
+# Model answers by cache key: an in-memory LRU tier with TTL in front of an optional SQLite tier
+class ResponseCache:
+    def __init__(self, max_entries=CACHE_SIZE, ttl=CACHE_TTL, db_path=CACHE_DB_PATH):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.db_path = db_path
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if db_path:
+            with connection(db_path) as conn, conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses "
+                    "(key TEXT PRIMARY KEY, response TEXT NOT NULL, expires_at REAL NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)")
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+
+        if self.db_path:
+            with connection(self.db_path) as conn:
+                row = conn.execute(
+                    "SELECT response, expires_at FROM responses WHERE key = ? AND expires_at > ?",
+                    (key, now)
+                ).fetchone()
+            if row:
+                self._remember(key, row[0], row[1])
+                with self._lock:
+                    self.hits += 1
+                    self.disk_hits += 1
+                return row[0]
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, text):
+        expires_at = time.time() + self.ttl
+        self._remember(key, text, expires_at)
+        if self.db_path:
+            with connection(self.db_path) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, expires_at) VALUES (?, ?, ?)",
+                    (key, text, expires_at)
+                )
+                conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+
+    def _remember(self, key, text, expires_at):
+        with self._lock:
+            self._entries[key] = (expires_at, text)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    # Pass a streamed response through unchanged, caching the full text once it completes
+    def store_stream(self, key, chunks):
+        parts = []
+        for chunk in chunks:
+            parts.append(chunk.text)
+            yield chunk
+        self.put(key, "".join(parts))
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
+
+    # stats() in the Prometheus text format, to serve next to METRICS.prometheus_text()
+    def prometheus_text(self, prefix="medibot"):
+        stats = self.stats()
+        lines = []
+        for field, kind, description in (
+            ("hits", "counter", "Model answers served from the response cache."),
+            ("disk_hits", "counter", "Cache hits served from the SQLite tier."),
+            ("misses", "counter", "Lookups that had to ask the model."),
+            ("entries", "gauge", "Answers held in the in-memory tier."),
+        ):
+            name = f"{prefix}_response_cache_{field}" + ("_total" if kind == "counter" else "")
+            lines += [f"# HELP {name} {description}", f"# TYPE {name} {kind}", f"{name} {stats[field]}"]
+        return "\n".join(lines) + "\n"
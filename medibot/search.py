@@ -0,0 +1,276 @@
+import json
+import math
+import re
+import threading
+from collections import OrderedDict
+
+from medibot.database import catalog_version
+from medibot.geo import DEFAULT_RADIUS_KM, KM_PER_DEGREE, bounding_box, haversine_km
+from medibot.metrics import METRICS
+from medibot.repository import DB_PATH, connection
+
+# Number of doctors returned for a symptom query
+TOP_K = 20
+
+# Fields of each row query_database returns, followed by distance_km when searching near a location
+RESULT_COLUMNS = (
+    "doctor_identity_number", "doctor_name", "specialization", "contact", "email",
+    "hospital_name", "hospital_location", "availability", "working_days", "rating"
+)
+
+# How the final score is put together. Coverage (share of the query's symptoms a doctor treats)
+# dominates, BM25 relevance breaks ties between equally covering doctors, and rating comes last.
+COVERAGE_WEIGHT = 0.6
+RELEVANCE_WEIGHT = 0.25
+RATING_WEIGHT = 0.15
+
+# Each term's BM25 relevance r counts as r / (r + RELEVANCE_SATURATION), which is between 0 and 1
+# without comparing it to the other matches
+RELEVANCE_SATURATION = 2.0
+
+# Best FTS matches of each term that are ranked. Only doctors among them are returned, which
+# bounds the work of a common symptom on a large catalog.
+CANDIDATES_PER_TERM = 1000
+
+# Number of recent searches whose ranking is kept for paging (RankedSearches)
+RANKED_SEARCHES_SIZE = 256
+
+# Words and punctuation that separate one symptom from the next in free text
+TERM_SEPARATORS = re.compile(r"[,;/&+\n]|\b(?:and|or|with|plus|also)\b")
+
+# Filler words trimmed from the start and end of a symptom ("I have a fever" -> "fever")
+FILLER_WORDS = {
+    "i", "im", "am", "have", "has", "had", "having", "a", "an", "the", "my", "me", "some",
+    "feel", "feeling", "been", "got", "get", "getting", "suffering", "from", "is", "are", "very",
+}
+
+# Words dropped when a symptom is split into single words ("pain in my chest" -> pain, chest)
+CONNECTING_WORDS = FILLER_WORDS | {
+    "in", "on", "of", "at", "to", "around", "near", "behind", "under", "over", "when", "while",
+    "after", "before", "during", "lot", "lots", "bit", "really", "both", "all",
+}
+
+
+# Split free text into distinct symptom terms, each a list of words
+def parse_symptom_terms(text):
+    terms = []
+    for chunk in TERM_SEPARATORS.split(text.lower()):
+        words = re.findall(r"\w+", chunk)
+        while words and words[0] in FILLER_WORDS:
+            words.pop(0)
+        while words and words[-1] in FILLER_WORDS:
+            words.pop()
+        if words and words not in terms:
+            terms.append(words)
+    return terms
+
+
+# FTS5 phrase query for one term. The last word is matched as a prefix, which keeps the old
+# LIKE '%...%' behaviour of matching partially typed symptoms.
+def term_match_expression(words):
+    return '"' + " ".join(words) + '" *'
+
+
+# Terms whose phrase matches no doctor ("fever cough", "pain in my chest") are replaced by their
+# words as separate terms, so coverage and BM25 still rank the doctors treating some of them
+def expand_unmatched_terms(conn, terms):
+    expanded = []
+    for words in terms:
+        matched = len(words) == 1 or conn.execute(
+            "SELECT 1 FROM doctors_fts WHERE doctors_fts MATCH ? LIMIT 1", [term_match_expression(words)]
+        ).fetchone()
+        for term in [words] if matched else [[word] for word in words if word not in CONNECTING_WORDS]:
+            if term not in expanded:
+                expanded.append(term)
+    return expanded
+
+
+# SQL condition (and its parameters) restricting doctors to a weekday (0 = Monday, as in
+# datetime.weekday()) and/or a time of day in minutes after midnight. It is checked on each FTS
+# match, read by primary key, and no index on the hours would be used: FTS5 costs over a
+# millisecond per rowid lookup, so candidates cannot start from the doctors open at a time.
+# A day and time nobody works is answered by the catalog's open_schedules without any SQL.
+def availability_condition(weekday=None, open_at=None):
+    conditions, params = [], []
+    if weekday is not None:
+        conditions.append("working_days_mask & ? != 0")
+        params.append(1 << weekday)
+    if open_at is not None:
+        conditions.append("opens_at <= ? AND closes_at > ?")
+        params += [open_at, open_at]
+    return " AND ".join(conditions) or "1", params
+
+
+# SQL expression (and its parameters) for the squared distance of a doctor's hospital from a
+# (latitude, longitude) point, in degrees. It treats the surface as flat around the point, which
+# is accurate to well under a percent over the distances a patient would travel, and is NULL
+# for hospitals without coordinates.
+def distance_expression(near):
+    latitude, longitude = near
+    longitude_scale = math.cos(math.radians(latitude)) ** 2
+    return (
+        "(latitude - ?) * (latitude - ?) + (longitude - ?) * (longitude - ?) * ?",
+        [latitude, latitude, longitude, longitude, longitude_scale],
+    )
+
+
+# SQL condition (and its parameters) keeping the FTS matches whose hospital lies in the bounding
+# box of radius_km around near, looked up in the doctors_location R*Tree. The box is read once
+# per query, so FTS matches elsewhere are dropped before their doctor row is read or scored.
+# The unary + keeps SQLite from handing the ids to FTS5 as rowid lookups, which cost far more.
+def nearby_condition(near, radius_km):
+    min_latitude, max_latitude, min_longitude, max_longitude = bounding_box(near, radius_km)
+    return (
+        "+doctors_fts.rowid IN (SELECT doctor_id FROM doctors_location WHERE min_latitude <= ? "
+        "AND max_latitude >= ? AND min_longitude <= ? AND max_longitude >= ?)",
+        [max_latitude, min_latitude, max_longitude, min_longitude],
+    )
+
+
+# Rank doctors for the given terms in SQL: the best CANDIDATES_PER_TERM FTS matches of each term
+# (by BM25, or by distance with nearest_first), grouped per doctor and scored. Terms no doctor
+# matches as a phrase are searched word by word (expand_unmatched_terms). With a location,
+# doctors further than radius_km away are dropped. The filters are applied while picking each
+# term's candidates, so a filtered search still sees every doctor that passes them. The ranked
+# ids are kept per search (RankedSearches), and every further page slices them.
+@METRICS.timed("rank_doctors")
+def rank_doctors(
+    conn, terms, limit=TOP_K, weekday=None, open_at=None, near=None, radius_km=DEFAULT_RADIUS_KM,
+    nearest_first=False, offset=0
+):
+    ranked = RANKED_SEARCHES.ranking(
+        conn, terms, weekday, open_at, near, radius_km, nearest_first,
+        lambda: ranked_doctor_ids(conn, terms, weekday, open_at, near, radius_km, nearest_first)
+    )
+    page = ranked[offset:offset + limit]
+    if not page:
+        return []
+    return conn.execute(
+        '''
+        SELECT doctor_identity_number, doctor_name, specialization, contact,
+               email, hospital_name, hospital_location, availability, working_days, rating,
+               latitude, longitude
+        FROM json_each(?) AS page JOIN doctors ON doctor_id = page.value
+        ORDER BY page.key
+        ''',
+        [json.dumps(page)]
+    ).fetchall()
+
+
+# Ids of the doctors matching terms, best first, for rank_doctors
+def ranked_doctor_ids(conn, terms, weekday, open_at, near, radius_km, nearest_first):
+    terms = expand_unmatched_terms(conn, terms)
+    if not terms:
+        return []
+    available, available_params = availability_condition(weekday, open_at)
+    distance, distance_params = "NULL", []
+    if near is not None:
+        distance, distance_params = distance_expression(near)
+        nearby, nearby_params = nearby_condition(near, radius_km)
+        available += f" AND {nearby} AND {distance} <= ?"
+        available_params += nearby_params + distance_params + [(radius_km / KM_PER_DEGREE) ** 2]
+    by_distance = near is not None and nearest_first
+    # Without filters FTS5 picks the best matches on its own, without reading the doctors. With
+    # them, ordering by the relevance column instead of rank has BM25 score only the matches
+    # that pass.
+    if available_params:
+        filtered = f"JOIN doctors ON doctor_id = doctors_fts.rowid WHERE {available} AND"
+        candidate_order = f"{distance}, relevance DESC" if by_distance else "relevance DESC"
+    else:
+        filtered, candidate_order = "WHERE", "rank"
+    candidates = " UNION ALL ".join(
+        f'''SELECT * FROM (
+            SELECT doctors_fts.rowid AS doctor_id, -bm25(doctors_fts) AS relevance
+            FROM doctors_fts {filtered} doctors_fts MATCH ?
+            ORDER BY {candidate_order}
+            LIMIT ?
+        )'''
+        for _ in terms
+    )
+    candidate_params = []
+    for words in terms:
+        candidate_params += available_params + [term_match_expression(words)]
+        candidate_params += (distance_params if by_distance else []) + [CANDIDATES_PER_TERM]
+    order = "distance, score DESC" if by_distance else "score DESC"
+    return [row[0] for row in conn.execute(
+        f'''
+        WITH candidates AS MATERIALIZED ({candidates}),
+        per_doctor AS (
+            SELECT doctor_id, COUNT(*) AS matched,
+                   SUM(relevance / (relevance + ?)) AS relevance
+            FROM candidates
+            GROUP BY doctor_id
+        )
+        SELECT doctor_id,
+               (? * matched + ? * relevance) / ? + ? * rating / 5.0 AS score,
+               {distance} AS distance
+        FROM per_doctor JOIN doctors USING (doctor_id)
+        ORDER BY {order}, doctor_id
+        ''',
+        candidate_params + [RELEVANCE_SATURATION]
+        + [COVERAGE_WEIGHT, RELEVANCE_WEIGHT, float(len(terms)), RATING_WEIGHT] + distance_params
+    )]
+
+
+# Ranked doctor ids of recent searches, least recently used dropped first. A search is keyed on
+# the database file and its catalog version, which every change to the doctors bumps, so a
+# stale ranking is never served.
+class RankedSearches:
+    def __init__(self, max_entries=RANKED_SEARCHES_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def ranking(self, conn, terms, weekday, open_at, near, radius_km, nearest_first, rank):
+        key = (
+            conn.execute("PRAGMA database_list").fetchone()[2], catalog_version(conn),
+            tuple(map(tuple, terms)), weekday, open_at, near, radius_km, nearest_first
+        )
+        with self._lock:
+            ranked = self._entries.get(key)
+            if ranked is not None:
+                self._entries.move_to_end(key)
+                return ranked
+        ranked = rank()
+        with self._lock:
+            self._entries[key] = ranked
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return ranked
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+RANKED_SEARCHES = RankedSearches()
+
+
+# Query the database for the best matching doctors, most relevant first. weekday and open_at
+# optionally keep only doctors who work on that day and/or are open at that minute of the day.
+# Given a catalog, its availability index answers "is anyone open then?" before any SQL runs.
+# near, radius_km and nearest_first restrict the search to a (latitude, longitude) area, and
+# each row then ends with the hospital's distance in km. offset skips that many of the best
+# matches, so a page of results is fetched as (limit=page size, offset=page * page size).
+@METRICS.timed("query_database")
+def query_database(
+    symptoms, db_path=DB_PATH, limit=TOP_K, weekday=None, open_at=None, catalog=None,
+    near=None, radius_km=DEFAULT_RADIUS_KM, nearest_first=False, offset=0
+):
+    terms = parse_symptom_terms(symptoms)
+    if not terms:
+        return None
+    if catalog is not None and weekday is not None and not catalog.open_schedules(weekday, open_at):
+        return None
+
+    with connection(db_path) as conn:
+        result = rank_doctors(conn, terms, limit, weekday, open_at, near, radius_km, nearest_first, offset)
+
+    # Convert working_days string back to a list
+    if result:
+        result = [
+            list(row[:8]) + [row[8].split(', '), row[9]]
+            + ([round(haversine_km(near, row[10:12]), 1)] if near is not None else [])
+            for row in result
+        ]
+    return result if result else None
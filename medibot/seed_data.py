@@ -0,0 +1,203 @@
+# Sample doctors loaded into the database
+DOCTORS_SEED = [
+    ('1017', 'Dr. Shanta V.', 'fractures, internal injuries, tumors, abnormal growths, infections, lung conditions, heart conditions, brain abnormalities, gastrointestinal issues, spinal problems, cancer screening, bone density issues, unexplained pain, swollen organs, imaging needs', 'Radiologist', '9853398615', 'dr..shanta.v.@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '09:00-18:00', 'Wednesday, Thursday, Tuesday, Saturday', '1.6') ,
+    ('4925', 'Dr. Vandana Shiva', 'mobility issues, memory loss, frequent falls, arthritis, chronic diseases, osteoporosis, frailty, depression in the elderly, hearing problems, visual impairments, medication management, dementia, sleep issues, urinary incontinence, cardiovascular diseases', 'Geriatrician', '9655368054', 'dr..vandana.shiva@hospital.com', 'Shimoga Institute of Medical Sciences', 'Sagar Road\nShivamogga, Karnataka 577201\nIndia', '09:00-19:00', 'Wednesday, Saturday, Friday', '1.2') ,
+    ('8429', 'Dr. K. K. Aggarwal', 'joint pain, stiffness, swelling, fatigue, arthritis, lupus, gout, back pain, connective tissue disorders, autoimmune diseases, fibromyalgia, joint inflammation, muscle weakness, chronic pain, swollen fingers or toes', 'Rheumatologist', '9972973251', 'dr..k..k..aggarwal@hospital.com', 'Sparsh Hospital', 'Infantry Road\nBengaluru, Karnataka 560001\nIndia', '09:00-17:00', 'Saturday, Friday, Wednesday, Tuesday, Thursday', '4.0') ,
+    ('1919', 'Dr. V. Mohan', 'severe headaches, brain tumors, dizziness, seizures, memory loss, numbness or tingling, paralysis, tremors, migraines, muscle weakness, speech difficulties, cognitive problems, movement disorders, difficulty walking, stroke symptoms', 'Neurologist', '9802793639', 'dr..v..mohan@hospital.com', 'SDM College of Medical Sciences & Hospital', 'Manjushree Nagar\nDharwad, Karnataka 580009\nIndia', '10:00-18:00', 'Thursday, Tuesday, Wednesday, Friday', '0.2') ,
+    ('5263', 'Dr. Kavita Patil', 'joint pain, stiffness, swelling, fatigue, arthritis, lupus, gout, back pain, connective tissue disorders, autoimmune diseases, fibromyalgia, joint inflammation, muscle weakness, chronic pain, swollen fingers or toes', 'Rheumatologist', '9677762484', 'dr..kavita.patil@hospital.com', 'KMC Hospital', 'Ambedkar Circle\nMangalore, Karnataka 575001\nIndia', '10:00-17:00', 'Sunday, Thursday, Tuesday, Monday', '3.7') ,
+    ('3140', 'Dr. Sunita Naik', 'ear pain, hearing loss, nasal congestion, throat pain, sinus infections, balance issues, snoring, voice problems, tonsillitis, tinnitus, allergies, deviated septum, speech difficulties, chronic cough, ear infections', 'ENT Specialist', '9709815461', 'dr..sunita.naik@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '09:00-18:00', 'Wednesday, Saturday, Sunday', '3.4') ,
+    ('1861', 'Dr. Anjali Kulkarni', 'joint pain, broken bones, arthritis, back pain, sports injuries, sprains, ligament tears, bone deformities, dislocations, scoliosis, knee pain, hip pain, tendon injuries, carpal tunnel syndrome, shoulder stiffness', 'Orthopedic Surgeon', '9983003423', 'dr..anjali.kulkarni@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '09:00-19:00', 'Thursday, Saturday, Sunday, Wednesday, Tuesday', '4.0') ,
+    ('8023', 'Dr. Anjali Kulkarni', 'mobility issues, memory loss, frequent falls, arthritis, chronic diseases, osteoporosis, frailty, depression in the elderly, hearing problems, visual impairments, medication management, dementia, sleep issues, urinary incontinence, cardiovascular diseases', 'Geriatrician', '9833043645', 'dr..anjali.kulkarni@hospital.com', 'JSS Hospital', 'MG Road\nMysuru, Karnataka 570004\nIndia', '08:00-17:00', 'Thursday, Friday, Saturday, Tuesday, Monday', '4.8') ,
+    ('1588', 'Dr. Sudhansu Bhattacharyya', 'stomach pain, bloating, heartburn, indigestion, constipation, diarrhea, blood in stool, acid reflux, difficulty swallowing, nausea, vomiting, gas issues, ulcers, liver problems, gallstones', 'Gastroenterologist', '9693616480', 'dr..sudhansu.bhattacharyya@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '09:00-18:00', 'Tuesday, Wednesday, Monday, Saturday, Sunday', '3.1') ,
+    ('3021', 'Dr. Gagandeep Kang', 'anemia, fatigue, pale skin, easy bruising, excessive bleeding, blood clots, swollen lymph nodes, infections, low platelet count, bone marrow problems, leukemia, sickle cell disease, thalassemia, bleeding disorders, iron deficiency', 'Hematologist', '9874790705', 'dr..gagandeep.kang@hospital.com', 'Vinayaka Hospital', 'Vinoba Nagar\nShivamogga, Karnataka 577204\nIndia', '10:00-17:00', 'Sunday, Saturday, Tuesday', '4.3') ,
+    ('7357', 'Dr. Shanta V.', 'acne, skin rashes, dry skin, eczema, psoriasis, moles, skin discoloration, warts, hair loss, dandruff, nail problems, skin allergies, skin infections, wrinkles, scars', 'Dermatologist', '9481611082', 'dr..shanta.v.@hospital.com', 'Apollo BGS Hospitals', 'Adichunchanagiri Road\nMysuru, Karnataka 570023\nIndia', '10:00-18:00', 'Wednesday, Sunday, Saturday', '1.6') ,
+    ('6955', 'Dr. P. Raghuram', 'mobility issues, memory loss, frequent falls, arthritis, chronic diseases, osteoporosis, frailty, depression in the elderly, hearing problems, visual impairments, medication management, dementia, sleep issues, urinary incontinence, cardiovascular diseases', 'Geriatrician', '9306063157', 'dr..p..raghuram@hospital.com', 'Narayana Health City', 'Bommasandra Industrial Area\nBengaluru, Karnataka 560099\nIndia', '09:00-16:00', 'Friday, Monday, Sunday, Saturday, Wednesday', '2.5') ,
+    ('6699', 'Dr. Swati Piramal', 'irregular periods, pelvic pain, vaginal discharge, urinary infections, infertility, pregnancy care, menopause symptoms, hormonal imbalances, breast lumps, painful periods, endometriosis, PCOS, abnormal bleeding, pelvic infections, sexual health concerns', 'Gynecologist', '9688985704', 'dr..swati.piramal@hospital.com', 'St. John’s Medical College and Hospital', 'Sarjapur Road\nBengaluru, Karnataka 560034\nIndia', '09:00-17:00', 'Sunday, Saturday, Friday', '3.1') ,
+    ('8767', 'Dr. Mammen Chandy', 'acne, skin rashes, dry skin, eczema, psoriasis, moles, skin discoloration, warts, hair loss, dandruff, nail problems, skin allergies, skin infections, wrinkles, scars', 'Dermatologist', '9163883071', 'dr..mammen.chandy@hospital.com', 'Father Muller Medical College Hospital', 'Kankanady\nMangalore, Karnataka 575002\nIndia', '09:00-18:00', 'Friday, Monday, Tuesday, Sunday, Saturday', '3.5') ,
+    ('3048', 'Dr. Randeep Guleria', 'disease diagnosis, biopsy analysis, abnormal blood test results, cancer detection, infections, chronic diseases, tissue analysis, organ dysfunction, laboratory testing issues, unexplained symptoms, genetic disorders, disease progression monitoring, infections in organs, rare conditions, tumor evaluation', 'Pathologist', '9898884213', 'dr..randeep.guleria@hospital.com', 'Father Muller Medical College Hospital', 'Kankanady\nMangalore, Karnataka 575002\nIndia', '10:00-16:00', 'Friday, Wednesday, Monday, Sunday, Tuesday', '1.3') ,
+    ('9632', 'Dr. Prashant Sharma', 'persistent cough, shortness of breath, chest tightness, wheezing, asthma symptoms, chronic bronchitis, pneumonia, sleep apnea, lung infections, coughing up blood, fatigue from breathing issues, chest pain, COPD, tuberculosis, lung cancer symptoms', 'Pulmonologist', '9800696597', 'dr..prashant.sharma@hospital.com', 'KLE Hospital', 'Nehru Nagar\nBelagavi, Karnataka 590010\nIndia', '10:00-16:00', 'Friday, Saturday, Wednesday, Tuesday, Thursday', '2.4') ,
+    ('5084', 'Dr. Shanta V.', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9729661450', 'dr..shanta.v.@hospital.com', 'SDM College of Medical Sciences & Hospital', 'Manjushree Nagar\nDharwad, Karnataka 580009\nIndia', '08:00-19:00', 'Tuesday, Saturday, Sunday, Wednesday', '4.2') ,
+    ('7723', 'Dr. Naresh Trehan', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9355557353', 'dr..naresh.trehan@hospital.com', 'BGS Gleneagles Global Hospital', 'Kengeri\nBengaluru, Karnataka 560060\nIndia', '08:00-19:00', 'Monday, Sunday, Tuesday, Friday, Saturday', '3.6') ,
+    ('8115', 'Dr. Randeep Guleria', 'swelling in legs or feet, blood in urine, foamy urine, high blood pressure, kidney stones, fatigue, nausea, frequent urination at night, chronic kidney disease, difficulty concentrating, decreased appetite, back pain near kidneys, electrolyte imbalance, kidney infections, dialysis needs', 'Nephrologist', '9258615528', 'dr..randeep.guleria@hospital.com', 'Vinayaka Hospital', 'Vinoba Nagar\nShivamogga, Karnataka 577204\nIndia', '10:00-16:00', 'Monday, Wednesday, Friday, Saturday', '1.0') ,
+    ('8693', 'Dr. Ashok Seth', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9606217711', 'dr..ashok.seth@hospital.com', 'St. John’s Medical College and Hospital', 'Sarjapur Road\nBengaluru, Karnataka 560034\nIndia', '09:00-18:00', 'Friday, Monday, Saturday', '1.2') ,
+    ('2596', 'Dr. Prashant Sharma', 'fractures, internal injuries, tumors, abnormal growths, infections, lung conditions, heart conditions, brain abnormalities, gastrointestinal issues, spinal problems, cancer screening, bone density issues, unexplained pain, swollen organs, imaging needs', 'Radiologist', '9848084382', 'dr..prashant.sharma@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '09:00-18:00', 'Monday, Wednesday, Saturday, Tuesday, Thursday', '4.4') ,
+    ('5427', 'Dr. Balamurali Ambati', 'fractures, internal injuries, tumors, abnormal growths, infections, lung conditions, heart conditions, brain abnormalities, gastrointestinal issues, spinal problems, cancer screening, bone density issues, unexplained pain, swollen organs, imaging needs', 'Radiologist', '9932762075', 'dr..balamurali.ambati@hospital.com', 'BGS Gleneagles Global Hospital', 'Kengeri\nBengaluru, Karnataka 560060\nIndia', '09:00-19:00', 'Sunday, Saturday, Monday, Thursday, Tuesday', '0.6') ,
+    ('6175', 'Dr. B. C. Roy', 'frequent infections, allergic reactions, autoimmune diseases, asthma, eczema, hay fever, hives, immunodeficiency disorders, food allergies, swelling after insect bites, recurrent colds, chronic sinus infections, fatigue from weak immunity, unusual infections, vaccine-related issues', 'Immunologist', '9973478998', 'dr..b..c..roy@hospital.com', 'SDM College of Medical Sciences & Hospital', 'Manjushree Nagar\nDharwad, Karnataka 580009\nIndia', '10:00-18:00', 'Thursday, Friday, Monday, Sunday', '3.4') ,
+    ('5894', 'Dr. Meena Menon', 'joint pain, stiffness, swelling, fatigue, arthritis, lupus, gout, back pain, connective tissue disorders, autoimmune diseases, fibromyalgia, joint inflammation, muscle weakness, chronic pain, swollen fingers or toes', 'Rheumatologist', '9391465479', 'dr..meena.menon@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '08:00-16:00', 'Friday, Tuesday, Saturday, Thursday', '0.7') ,
+    ('3690', 'Dr. Sameer Reddy', 'fractures, internal injuries, tumors, abnormal growths, infections, lung conditions, heart conditions, brain abnormalities, gastrointestinal issues, spinal problems, cancer screening, bone density issues, unexplained pain, swollen organs, imaging needs', 'Radiologist', '9607661997', 'dr..sameer.reddy@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '08:00-18:00', 'Thursday, Wednesday, Monday, Tuesday, Saturday', '3.9') ,
+    ('7044', 'Dr. B. C. Roy', 'severe headaches, brain tumors, dizziness, seizures, memory loss, numbness or tingling, paralysis, tremors, migraines, muscle weakness, speech difficulties, cognitive problems, movement disorders, difficulty walking, stroke symptoms', 'Neurologist', '9958789460', 'dr..b..c..roy@hospital.com', 'Shimoga Institute of Medical Sciences', 'Sagar Road\nShivamogga, Karnataka 577201\nIndia', '09:00-18:00', 'Saturday, Sunday, Tuesday', '2.5') ,
+    ('3654', 'Dr. Sameer Reddy', 'stomach pain, bloating, heartburn, indigestion, constipation, diarrhea, blood in stool, acid reflux, difficulty swallowing, nausea, vomiting, gas issues, ulcers, liver problems, gallstones', 'Gastroenterologist', '9657909606', 'dr..sameer.reddy@hospital.com', 'Vinayaka Hospital', 'Vinoba Nagar\nShivamogga, Karnataka 577204\nIndia', '10:00-16:00', 'Sunday, Tuesday, Friday', '0.5') ,
+    ('9565', 'Dr. Gagandeep Kang', 'mobility issues, memory loss, frequent falls, arthritis, chronic diseases, osteoporosis, frailty, depression in the elderly, hearing problems, visual impairments, medication management, dementia, sleep issues, urinary incontinence, cardiovascular diseases', 'Geriatrician', '9447197491', 'dr..gagandeep.kang@hospital.com', 'SDM College of Medical Sciences & Hospital', 'Manjushree Nagar\nDharwad, Karnataka 580009\nIndia', '10:00-16:00', 'Friday, Wednesday, Saturday, Thursday', '2.6') ,
+    ('9295', 'Dr. Gagandeep Kang', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9737799885', 'dr..gagandeep.kang@hospital.com', 'Sparsh Hospital', 'Infantry Road\nBengaluru, Karnataka 560001\nIndia', '09:00-16:00', 'Wednesday, Monday, Sunday', '0.5') ,
+    ('8164', 'Dr. Devi Prasad Shetty', 'frequent infections, allergic reactions, autoimmune diseases, asthma, eczema, hay fever, hives, immunodeficiency disorders, food allergies, swelling after insect bites, recurrent colds, chronic sinus infections, fatigue from weak immunity, unusual infections, vaccine-related issues', 'Immunologist', '9878017360', 'dr..devi.prasad.shetty@hospital.com', 'Sparsh Hospital', 'Infantry Road\nBengaluru, Karnataka 560001\nIndia', '10:00-19:00', 'Saturday, Thursday, Monday, Friday, Tuesday', '0.2') ,
+    ('3613', 'Dr. Mahesh Gowda', 'chest pain, breathlessness, fatigue, irregular heartbeats, high blood pressure, dizziness, fainting, chest tightness, heart failure, swollen ankles or feet, palpitations, heart attack symptoms, angina, heart murmurs, hypertension', 'Cardiologist', '9910453520', 'dr..mahesh.gowda@hospital.com', 'SDM College of Medical Sciences & Hospital', 'Manjushree Nagar\nDharwad, Karnataka 580009\nIndia', '09:00-17:00', 'Sunday, Wednesday, Monday, Friday', '2.6') ,
+    ('1685', 'Dr. Prathap C. Reddy', 'stomach pain, bloating, heartburn, indigestion, constipation, diarrhea, blood in stool, acid reflux, difficulty swallowing, nausea, vomiting, gas issues, ulcers, liver problems, gallstones', 'Gastroenterologist', '9986720356', 'dr..prathap.c..reddy@hospital.com', 'Vinayaka Hospital', 'Vinoba Nagar\nShivamogga, Karnataka 577204\nIndia', '09:00-16:00', 'Monday, Sunday, Thursday, Wednesday, Friday', '3.8') ,
+    ('9840', 'Dr. Swati Piramal', 'fractures, internal injuries, tumors, abnormal growths, infections, lung conditions, heart conditions, brain abnormalities, gastrointestinal issues, spinal problems, cancer screening, bone density issues, unexplained pain, swollen organs, imaging needs', 'Radiologist', '9855652939', 'dr..swati.piramal@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '10:00-16:00', 'Saturday, Sunday, Monday, Wednesday', '1.3') ,
+    ('7965', 'Dr. Ravi Kumar', 'stomach pain, bloating, heartburn, indigestion, constipation, diarrhea, blood in stool, acid reflux, difficulty swallowing, nausea, vomiting, gas issues, ulcers, liver problems, gallstones', 'Gastroenterologist', '9256948222', 'dr..ravi.kumar@hospital.com', 'Kasturba Medical College and Hospital', 'Tiger Circle Road\nManipal, Karnataka 576104\nIndia', '09:00-16:00', 'Saturday, Tuesday, Friday, Wednesday', '1.1') ,
+    ('5513', 'Dr. Anjali Kulkarni', 'persistent cough, shortness of breath, chest tightness, wheezing, asthma symptoms, chronic bronchitis, pneumonia, sleep apnea, lung infections, coughing up blood, fatigue from breathing issues, chest pain, COPD, tuberculosis, lung cancer symptoms', 'Pulmonologist', '9354527503', 'dr..anjali.kulkarni@hospital.com', 'Vinayaka Hospital', 'Vinoba Nagar\nShivamogga, Karnataka 577204\nIndia', '10:00-16:00', 'Sunday, Saturday, Friday, Wednesday, Monday', '4.7') ,
+    ('3598', 'Dr. Mahesh Gowda', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9591608558', 'dr..mahesh.gowda@hospital.com', 'BGS Gleneagles Global Hospital', 'Kengeri\nBengaluru, Karnataka 560060\nIndia', '09:00-18:00', 'Wednesday, Friday, Thursday, Monday', '1.3') ,
+    ('5655', 'Dr. V. Mohan', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9695189880', 'dr..v..mohan@hospital.com', 'KMC Hospital', 'Ambedkar Circle\nMangalore, Karnataka 575001\nIndia', '08:00-19:00', 'Sunday, Thursday, Monday', '0.2') ,
+    ('7312', 'Dr. S. K. Sarin', 'joint pain, stiffness, swelling, fatigue, arthritis, lupus, gout, back pain, connective tissue disorders, autoimmune diseases, fibromyalgia, joint inflammation, muscle weakness, chronic pain, swollen fingers or toes', 'Rheumatologist', '9982715560', 'dr..s..k..sarin@hospital.com', 'KMC Hospital', 'Ambedkar Circle\nMangalore, Karnataka 575001\nIndia', '09:00-18:00', 'Tuesday, Thursday, Monday, Wednesday, Friday', '2.1') ,
+    ('3149', 'Dr. Devi Prasad Shetty', 'acne, skin rashes, dry skin, eczema, psoriasis, moles, skin discoloration, warts, hair loss, dandruff, nail problems, skin allergies, skin infections, wrinkles, scars', 'Dermatologist', '9864356254', 'dr..devi.prasad.shetty@hospital.com', 'Kasturba Medical College and Hospital', 'Tiger Circle Road\nManipal, Karnataka 576104\nIndia', '10:00-16:00', 'Thursday, Monday, Wednesday', '0.8') ,
+    ('2393', 'Dr. Meena Menon', 'disease diagnosis, biopsy analysis, abnormal blood test results, cancer detection, infections, chronic diseases, tissue analysis, organ dysfunction, laboratory testing issues, unexplained symptoms, genetic disorders, disease progression monitoring, infections in organs, rare conditions, tumor evaluation', 'Pathologist', '9619852342', 'dr..meena.menon@hospital.com', 'Vinayaka Hospital', 'Vinoba Nagar\nShivamogga, Karnataka 577204\nIndia', '08:00-17:00', 'Monday, Saturday, Wednesday, Thursday, Sunday', '2.4') ,
+    ('4396', 'Dr. Mahesh Gowda', 'fever, body aches, colds, cough, flu, stomach pain, headaches, fatigue, minor injuries, allergies, infections, high blood pressure, diabetes symptoms, general weakness, preventive health care', 'General Physician', '9469240430', 'dr..mahesh.gowda@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '09:00-18:00', 'Tuesday, Sunday, Thursday', '4.7') ,
+    ('4697', 'Dr. Prathap C. Reddy', 'joint pain, stiffness, swelling, fatigue, arthritis, lupus, gout, back pain, connective tissue disorders, autoimmune diseases, fibromyalgia, joint inflammation, muscle weakness, chronic pain, swollen fingers or toes', 'Rheumatologist', '9548090742', 'dr..prathap.c..reddy@hospital.com', 'BGS Gleneagles Global Hospital', 'Kengeri\nBengaluru, Karnataka 560060\nIndia', '09:00-16:00', 'Tuesday, Wednesday, Friday, Sunday', '4.5') ,
+    ('9674', 'Dr. K. K. Aggarwal', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9519323272', 'dr..k..k..aggarwal@hospital.com', 'Narayana Health City', 'Bommasandra Industrial Area\nBengaluru, Karnataka 560099\nIndia', '09:00-17:00', 'Wednesday, Saturday, Friday, Sunday, Tuesday', '4.6') ,
+    ('5926', 'Dr. A. Velumani', 'scars, burns, deformities, nose reshaping, breast reconstruction, facial reconstruction, cleft lip or palate, cosmetic issues, skin grafting, excess skin removal, liposuction, wrinkles, hand injuries, ear reshaping, facial asymmetry', 'Plastic Surgeon', '9218900855', 'dr..a..velumani@hospital.com', 'Kasturba Medical College and Hospital', 'Tiger Circle Road\nManipal, Karnataka 576104\nIndia', '10:00-18:00', 'Saturday, Sunday, Friday, Monday, Wednesday', '1.4') ,
+    ('7814', 'Dr. Ashok Seth', 'chest pain, breathlessness, fatigue, irregular heartbeats, high blood pressure, dizziness, fainting, chest tightness, heart failure, swollen ankles or feet, palpitations, heart attack symptoms, angina, heart murmurs, hypertension', 'Cardiologist', '9306590286', 'dr..ashok.seth@hospital.com', 'St. John’s Medical College and Hospital', 'Sarjapur Road\nBengaluru, Karnataka 560034\nIndia', '08:00-18:00', 'Monday, Sunday, Tuesday, Wednesday', '4.2') ,
+    ('1832', 'Dr. Kavita Patil', 'disease diagnosis, biopsy analysis, abnormal blood test results, cancer detection, infections, chronic diseases, tissue analysis, organ dysfunction, laboratory testing issues, unexplained symptoms, genetic disorders, disease progression monitoring, infections in organs, rare conditions, tumor evaluation', 'Pathologist', '9395782278', 'dr..kavita.patil@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '10:00-17:00', 'Friday, Monday, Saturday, Sunday', '3.9') ,
+    ('9045', 'Dr. Randeep Guleria', 'fever in children, ear infections, cough, colds, flu, developmental delays, skin rashes, stomach pain, vomiting, diarrhea, asthma symptoms, behavioral issues, vaccination needs, growth concerns, allergies in children', 'Pediatrician', '9707315427', 'dr..randeep.guleria@hospital.com', 'Kasturba Medical College and Hospital', 'Tiger Circle Road\nManipal, Karnataka 576104\nIndia', '10:00-18:00', 'Saturday, Sunday, Friday, Tuesday, Monday', '0.6') ,
+    ('5229', 'Dr. Balamurali Ambati', 'chest pain, breathlessness, fatigue, irregular heartbeats, high blood pressure, dizziness, fainting, chest tightness, heart failure, swollen ankles or feet, palpitations, heart attack symptoms, angina, heart murmurs, hypertension', 'Cardiologist', '9739823624', 'dr..balamurali.ambati@hospital.com', 'Father Muller Medical College Hospital', 'Kankanady\nMangalore, Karnataka 575002\nIndia', '08:00-17:00', 'Saturday, Wednesday, Friday', '1.9') ,
+    ('9171', 'Dr. Arjun Rao', 'scars, burns, deformities, nose reshaping, breast reconstruction, facial reconstruction, cleft lip or palate, cosmetic issues, skin grafting, excess skin removal, liposuction, wrinkles, hand injuries, ear reshaping, facial asymmetry', 'Plastic Surgeon', '9979701093', 'dr..arjun.rao@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '09:00-16:00', 'Saturday, Sunday, Friday, Thursday, Monday', '2.7') ,
+    ('2435', 'Dr. B. C. Roy', 'irregular periods, pelvic pain, vaginal discharge, urinary infections, infertility, pregnancy care, menopause symptoms, hormonal imbalances, breast lumps, painful periods, endometriosis, PCOS, abnormal bleeding, pelvic infections, sexual health concerns', 'Gynecologist', '9475322318', 'dr..b..c..roy@hospital.com', 'Sparsh Hospital', 'Infantry Road\nBengaluru, Karnataka 560001\nIndia', '10:00-17:00', 'Monday, Friday, Saturday', '0.4') ,
+    ('3492', 'Dr. Gagandeep Kang', 'stomach pain, bloating, heartburn, indigestion, constipation, diarrhea, blood in stool, acid reflux, difficulty swallowing, nausea, vomiting, gas issues, ulcers, liver problems, gallstones', 'Gastroenterologist', '9843770533', 'dr..gagandeep.kang@hospital.com', 'Narayana Health City', 'Bommasandra Industrial Area\nBengaluru, Karnataka 560099\nIndia', '09:00-17:00', 'Thursday, Friday, Saturday, Wednesday', '0.2') ,
+    ('9396', 'Dr. Kavita Patil', 'fever in children, ear infections, cough, colds, flu, developmental delays, skin rashes, stomach pain, vomiting, diarrhea, asthma symptoms, behavioral issues, vaccination needs, growth concerns, allergies in children', 'Pediatrician', '9287922783', 'dr..kavita.patil@hospital.com', 'Apollo BGS Hospitals', 'Adichunchanagiri Road\nMysuru, Karnataka 570023\nIndia', '08:00-18:00', 'Monday, Friday, Tuesday', '3.1') ,
+    ('4203', 'Dr. Kavita Patil', 'chest pain, breathlessness, fatigue, irregular heartbeats, high blood pressure, dizziness, fainting, chest tightness, heart failure, swollen ankles or feet, palpitations, heart attack symptoms, angina, heart murmurs, hypertension', 'Cardiologist', '9301849274', 'dr..kavita.patil@hospital.com', 'JSS Hospital', 'MG Road\nMysuru, Karnataka 570004\nIndia', '08:00-18:00', 'Saturday, Monday, Wednesday', '0.9') ,
+    ('3958', 'Dr. Sunita Naik', 'severe headaches, brain tumors, dizziness, seizures, memory loss, numbness or tingling, paralysis, tremors, migraines, muscle weakness, speech difficulties, cognitive problems, movement disorders, difficulty walking, stroke symptoms', 'Neurologist', '9301030819', 'dr..sunita.naik@hospital.com', 'KLE Hospital', 'Nehru Nagar\nBelagavi, Karnataka 590010\nIndia', '10:00-19:00', 'Sunday, Tuesday, Monday', '2.7') ,
+    ('3079', 'Dr. Prashant Sharma', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9397102826', 'dr..prashant.sharma@hospital.com', 'Manipal Hospital', 'HAL Old Airport Road\nBengaluru, Karnataka 560017\nIndia', '08:00-17:00', 'Saturday, Friday, Tuesday, Monday', '3.4') ,
+    ('7782', 'Dr. Naresh Trehan', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9777527597', 'dr..naresh.trehan@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '10:00-16:00', 'Tuesday, Sunday, Friday', '2.6') ,
+    ('8101', 'Dr. Meena Menon', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9575474945', 'dr..meena.menon@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '09:00-19:00', 'Wednesday, Thursday, Tuesday, Sunday', '4.0') ,
+    ('9808', 'Dr. Swati Piramal', 'acne, skin rashes, dry skin, eczema, psoriasis, moles, skin discoloration, warts, hair loss, dandruff, nail problems, skin allergies, skin infections, wrinkles, scars', 'Dermatologist', '9871438657', 'dr..swati.piramal@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '10:00-17:00', 'Wednesday, Tuesday, Saturday', '4.2') ,
+    ('8167', 'Dr. Shanta V.', 'disease diagnosis, biopsy analysis, abnormal blood test results, cancer detection, infections, chronic diseases, tissue analysis, organ dysfunction, laboratory testing issues, unexplained symptoms, genetic disorders, disease progression monitoring, infections in organs, rare conditions, tumor evaluation', 'Pathologist', '9732904847', 'dr..shanta.v.@hospital.com', 'Apollo BGS Hospitals', 'Adichunchanagiri Road\nMysuru, Karnataka 570023\nIndia', '10:00-17:00', 'Saturday, Thursday, Tuesday, Monday', '2.7') ,
+    ('1501', 'Dr. Meena Menon', 'stomach pain, bloating, heartburn, indigestion, constipation, diarrhea, blood in stool, acid reflux, difficulty swallowing, nausea, vomiting, gas issues, ulcers, liver problems, gallstones', 'Gastroenterologist', '9406223908', 'dr..meena.menon@hospital.com', 'Sparsh Hospital', 'Infantry Road\nBengaluru, Karnataka 560001\nIndia', '08:00-17:00', 'Tuesday, Monday, Saturday', '2.0') ,
+    ('3561', 'Dr. Shalini Desai', 'joint pain, stiffness, swelling, fatigue, arthritis, lupus, gout, back pain, connective tissue disorders, autoimmune diseases, fibromyalgia, joint inflammation, muscle weakness, chronic pain, swollen fingers or toes', 'Rheumatologist', '9829766608', 'dr..shalini.desai@hospital.com', 'S. S. Institute of Medical Sciences', 'NH-4 Bypass\nDavangere, Karnataka 577005\nIndia', '10:00-19:00', 'Thursday, Wednesday, Monday', '3.1') ,
+    ('1904', 'Dr. Balamurali Ambati', 'blurry vision, eye pain, red eyes, dry eyes, watery eyes, sensitivity to light, floaters, double vision, loss of vision, eyelid problems, cataracts, glaucoma, macular degeneration, eye injuries, eye infections', 'Ophthalmologist', '9339710477', 'dr..balamurali.ambati@hospital.com', 'Victoria Hospital', 'K.R. Market\nBengaluru, Karnataka 560002\nIndia', '09:00-16:00', 'Wednesday, Sunday, Friday, Monday, Tuesday', '1.3') ,
+    ('2297', 'Dr. Sunita Naik', 'joint pain, broken bones, arthritis, back pain, sports injuries, sprains, ligament tears, bone deformities, dislocations, scoliosis, knee pain, hip pain, tendon injuries, carpal tunnel syndrome, shoulder stiffness', 'Orthopedic Surgeon', '9443391445', 'dr..sunita.naik@hospital.com', 'SDM College of Medical Sciences & Hospital', 'Manjushree Nagar\nDharwad, Karnataka 580009\nIndia', '10:00-16:00', 'Thursday, Tuesday, Friday, Saturday, Monday', '3.1') ,
+    ('9285', 'Dr. B. C. Roy', 'fever, body aches, colds, cough, flu, stomach pain, headaches, fatigue, minor injuries, allergies, infections, high blood pressure, diabetes symptoms, general weakness, preventive health care', 'General Physician', '9716058263', 'dr..b..c..roy@hospital.com', 'Victoria Hospital', 'K.R. Market\nBengaluru, Karnataka 560002\nIndia', '10:00-16:00', 'Saturday, Monday, Sunday', '0.6') ,
+    ('9646', 'Dr. Prathap C. Reddy', 'swelling in legs or feet, blood in urine, foamy urine, high blood pressure, kidney stones, fatigue, nausea, frequent urination at night, chronic kidney disease, difficulty concentrating, decreased appetite, back pain near kidneys, electrolyte imbalance, kidney infections, dialysis needs', 'Nephrologist', '9785950576', 'dr..prathap.c..reddy@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '09:00-18:00', 'Saturday, Sunday, Friday', '3.8') ,
+    ('8820', 'Dr. Shalini Desai', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9559661312', 'dr..shalini.desai@hospital.com', 'St. John’s Medical College and Hospital', 'Sarjapur Road\nBengaluru, Karnataka 560034\nIndia', '09:00-18:00', 'Saturday, Wednesday, Sunday, Friday', '4.9') ,
+    ('2555', 'Dr. Shanta V.', 'irregular periods, pelvic pain, vaginal discharge, urinary infections, infertility, pregnancy care, menopause symptoms, hormonal imbalances, breast lumps, painful periods, endometriosis, PCOS, abnormal bleeding, pelvic infections, sexual health concerns', 'Gynecologist', '9850627535', 'dr..shanta.v.@hospital.com', 'S. S. Institute of Medical Sciences', 'NH-4 Bypass\nDavangere, Karnataka 577005\nIndia', '09:00-18:00', 'Friday, Sunday, Saturday', '2.0') ,
+    ('6950', 'Dr. Vikas Iyer', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9956679525', 'dr..vikas.iyer@hospital.com', 'KMC Hospital', 'Ambedkar Circle\nMangalore, Karnataka 575001\nIndia', '08:00-17:00', 'Saturday, Thursday, Friday, Sunday, Monday', '2.3') ,
+    ('4493', 'Dr. Anjali Kulkarni', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9810870623', 'dr..anjali.kulkarni@hospital.com', 'Father Muller Medical College Hospital', 'Kankanady\nMangalore, Karnataka 575002\nIndia', '08:00-16:00', 'Wednesday, Friday, Tuesday, Saturday', '1.1') ,
+    ('7565', 'Dr. Sudhansu Bhattacharyya', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9883578106', 'dr..sudhansu.bhattacharyya@hospital.com', 'Manipal Hospital', 'HAL Old Airport Road\nBengaluru, Karnataka 560017\nIndia', '08:00-16:00', 'Monday, Tuesday, Thursday, Wednesday, Friday', '3.2') ,
+    ('8820', 'Dr. Sunita Naik', 'ear pain, hearing loss, nasal congestion, throat pain, sinus infections, balance issues, snoring, voice problems, tonsillitis, tinnitus, allergies, deviated septum, speech difficulties, chronic cough, ear infections', 'ENT Specialist', '9779696836', 'dr..sunita.naik@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '08:00-17:00', 'Monday, Friday, Wednesday', '2.7') ,
+    ('8230', 'Dr. Priya Shetty', 'chest pain, breathlessness, fatigue, irregular heartbeats, high blood pressure, dizziness, fainting, chest tightness, heart failure, swollen ankles or feet, palpitations, heart attack symptoms, angina, heart murmurs, hypertension', 'Cardiologist', '9577106040', 'dr..priya.shetty@hospital.com', 'KMC Hospital', 'Ambedkar Circle\nMangalore, Karnataka 575001\nIndia', '08:00-19:00', 'Saturday, Sunday, Tuesday, Monday, Thursday', '2.6') ,
+    ('9723', 'Dr. Balamurali Ambati', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9311203216', 'dr..balamurali.ambati@hospital.com', 'Victoria Hospital', 'K.R. Market\nBengaluru, Karnataka 560002\nIndia', '10:00-17:00', 'Tuesday, Thursday, Wednesday', '1.2') ,
+    ('5990', 'Dr. P. Raghuram', 'scars, burns, deformities, nose reshaping, breast reconstruction, facial reconstruction, cleft lip or palate, cosmetic issues, skin grafting, excess skin removal, liposuction, wrinkles, hand injuries, ear reshaping, facial asymmetry', 'Plastic Surgeon', '9496585880', 'dr..p..raghuram@hospital.com', 'Shimoga Institute of Medical Sciences', 'Sagar Road\nShivamogga, Karnataka 577201\nIndia', '09:00-17:00', 'Wednesday, Saturday, Friday, Monday', '1.3') ,
+    ('8798', 'Dr. Sudhansu Bhattacharyya', 'severe headaches, brain tumors, dizziness, seizures, memory loss, numbness or tingling, paralysis, tremors, migraines, muscle weakness, speech difficulties, cognitive problems, movement disorders, difficulty walking, stroke symptoms', 'Neurologist', '9334436634', 'dr..sudhansu.bhattacharyya@hospital.com', 'St. John’s Medical College and Hospital', 'Sarjapur Road\nBengaluru, Karnataka 560034\nIndia', '09:00-17:00', 'Friday, Saturday, Monday, Thursday, Sunday', '3.4') ,
+    ('9195', 'Dr. Anjali Kulkarni', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9347865551', 'dr..anjali.kulkarni@hospital.com', 'SDM College of Medical Sciences & Hospital', 'Manjushree Nagar\nDharwad, Karnataka 580009\nIndia', '09:00-16:00', 'Tuesday, Sunday, Saturday, Friday', '1.5') ,
+    ('5113', 'Dr. Randeep Guleria', 'toothache, gum bleeding, cavities, bad breath, sensitivity to hot or cold, oral infections, jaw pain, wisdom teeth issues, teeth cleaning, braces, mouth ulcers, dry mouth, broken teeth, missing teeth, tooth decay', 'Dentist', '9664584524', 'dr..randeep.guleria@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '10:00-17:00', 'Tuesday, Monday, Friday', '1.5') ,
+    ('9398', 'Dr. Padmavati Sivaramakrishna Iyer', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9944887165', 'dr..padmavati.sivaramakrishna.iyer@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '10:00-16:00', 'Monday, Saturday, Wednesday, Tuesday', '1.1') ,
+    ('3716', 'Dr. Mammen Chandy', 'mobility issues, memory loss, frequent falls, arthritis, chronic diseases, osteoporosis, frailty, depression in the elderly, hearing problems, visual impairments, medication management, dementia, sleep issues, urinary incontinence, cardiovascular diseases', 'Geriatrician', '9871221793', 'dr..mammen.chandy@hospital.com', 'Kasturba Medical College and Hospital', 'Tiger Circle Road\nManipal, Karnataka 576104\nIndia', '10:00-16:00', 'Monday, Saturday, Tuesday, Wednesday, Sunday', '2.2') ,
+    ('7347', 'Dr. S. K. Sarin', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9392724660', 'dr..s..k..sarin@hospital.com', 'Sparsh Hospital', 'Infantry Road\nBengaluru, Karnataka 560001\nIndia', '08:00-19:00', 'Tuesday, Monday, Thursday, Sunday, Friday', '4.0') ,
+    ('3469', 'Dr. Kavita Patil', 'swelling in legs or feet, blood in urine, foamy urine, high blood pressure, kidney stones, fatigue, nausea, frequent urination at night, chronic kidney disease, difficulty concentrating, decreased appetite, back pain near kidneys, electrolyte imbalance, kidney infections, dialysis needs', 'Nephrologist', '9362845502', 'dr..kavita.patil@hospital.com', 'Kasturba Medical College and Hospital', 'Tiger Circle Road\nManipal, Karnataka 576104\nIndia', '08:00-16:00', 'Friday, Thursday, Tuesday, Saturday', '4.2') ,
+    ('5551', 'Dr. Ashok Seth', 'disease diagnosis, biopsy analysis, abnormal blood test results, cancer detection, infections, chronic diseases, tissue analysis, organ dysfunction, laboratory testing issues, unexplained symptoms, genetic disorders, disease progression monitoring, infections in organs, rare conditions, tumor evaluation', 'Pathologist', '9750428249', 'dr..ashok.seth@hospital.com', 'Father Muller Medical College Hospital', 'Kankanady\nMangalore, Karnataka 575002\nIndia', '10:00-16:00', 'Monday, Friday, Sunday, Saturday', '3.8') ,
+    ('7986', 'Dr. K. K. Aggarwal', 'scars, burns, deformities, nose reshaping, breast reconstruction, facial reconstruction, cleft lip or palate, cosmetic issues, skin grafting, excess skin removal, liposuction, wrinkles, hand injuries, ear reshaping, facial asymmetry', 'Plastic Surgeon', '9580755514', 'dr..k..k..aggarwal@hospital.com', 'KLE Hospital', 'Nehru Nagar\nBelagavi, Karnataka 590010\nIndia', '09:00-17:00', 'Friday, Sunday, Monday', '3.9') ,
+    ('8089', 'Dr. Arjun Rao', 'pain management needs, pre-surgery assessments, post-surgery recovery, chronic pain issues, numbness for surgery, sedation, monitoring during operations, spinal anesthesia, epidurals, critical care, pain relief during labor, nerve blocks, emergency pain relief, breathing support, anesthesia for dental procedures', 'Anesthesiologist', '9249180386', 'dr..arjun.rao@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '09:00-18:00', 'Friday, Monday, Sunday', '0.9') ,
+    ('7705', 'Dr. V. Mohan', 'anemia, fatigue, pale skin, easy bruising, excessive bleeding, blood clots, swollen lymph nodes, infections, low platelet count, bone marrow problems, leukemia, sickle cell disease, thalassemia, bleeding disorders, iron deficiency', 'Hematologist', '9288459527', 'dr..v..mohan@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '08:00-19:00', 'Friday, Saturday, Thursday', '3.7') ,
+    ('4122', 'Dr. Padmavati Sivaramakrishna Iyer', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9989204331', 'dr..padmavati.sivaramakrishna.iyer@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '08:00-17:00', 'Wednesday, Friday, Sunday', '5.0') ,
+    ('1293', 'Dr. S. K. Sarin', 'persistent cough, shortness of breath, chest tightness, wheezing, asthma symptoms, chronic bronchitis, pneumonia, sleep apnea, lung infections, coughing up blood, fatigue from breathing issues, chest pain, COPD, tuberculosis, lung cancer symptoms', 'Pulmonologist', '9634346050', 'dr..s..k..sarin@hospital.com', 'Apollo BGS Hospitals', 'Adichunchanagiri Road\nMysuru, Karnataka 570023\nIndia', '10:00-18:00', 'Thursday, Friday, Monday, Wednesday', '4.1') ,
+    ('3793', 'Dr. Balamurali Ambati', 'acne, skin rashes, dry skin, eczema, psoriasis, moles, skin discoloration, warts, hair loss, dandruff, nail problems, skin allergies, skin infections, wrinkles, scars', 'Dermatologist', '9390430016', 'dr..balamurali.ambati@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '09:00-19:00', 'Sunday, Saturday, Monday, Wednesday, Thursday', '0.2') ,
+    ('3209', 'Dr. Vikas Iyer', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9806374949', 'dr..vikas.iyer@hospital.com', 'Father Muller Medical College Hospital', 'Kankanady\nMangalore, Karnataka 575002\nIndia', '10:00-18:00', 'Wednesday, Tuesday, Saturday, Thursday', '0.5') ,
+    ('6209', 'Dr. Kavita Patil', 'acne, skin rashes, dry skin, eczema, psoriasis, moles, skin discoloration, warts, hair loss, dandruff, nail problems, skin allergies, skin infections, wrinkles, scars', 'Dermatologist', '9682319453', 'dr..kavita.patil@hospital.com', 'Victoria Hospital', 'K.R. Market\nBengaluru, Karnataka 560002\nIndia', '08:00-16:00', 'Thursday, Saturday, Monday, Friday', '1.0') ,
+    ('9175', 'Dr. Prashant Sharma', 'anemia, fatigue, pale skin, easy bruising, excessive bleeding, blood clots, swollen lymph nodes, infections, low platelet count, bone marrow problems, leukemia, sickle cell disease, thalassemia, bleeding disorders, iron deficiency', 'Hematologist', '9304102743', 'dr..prashant.sharma@hospital.com', 'Narayana Health City', 'Bommasandra Industrial Area\nBengaluru, Karnataka 560099\nIndia', '08:00-17:00', 'Thursday, Tuesday, Wednesday, Friday', '0.7') ,
+    ('6076', 'Dr. Vikas Iyer', 'chest pain, breathlessness, fatigue, irregular heartbeats, high blood pressure, dizziness, fainting, chest tightness, heart failure, swollen ankles or feet, palpitations, heart attack symptoms, angina, heart murmurs, hypertension', 'Cardiologist', '9552276500', 'dr..vikas.iyer@hospital.com', 'KLE Hospital', 'Nehru Nagar\nBelagavi, Karnataka 590010\nIndia', '08:00-17:00', 'Monday, Friday, Saturday, Thursday, Wednesday', '4.2') ,
+    ('6108', 'Dr. Mammen Chandy', 'pain management needs, pre-surgery assessments, post-surgery recovery, chronic pain issues, numbness for surgery, sedation, monitoring during operations, spinal anesthesia, epidurals, critical care, pain relief during labor, nerve blocks, emergency pain relief, breathing support, anesthesia for dental procedures', 'Anesthesiologist', '9689430332', 'dr..mammen.chandy@hospital.com', 'St. John’s Medical College and Hospital', 'Sarjapur Road\nBengaluru, Karnataka 560034\nIndia', '10:00-16:00', 'Saturday, Friday, Thursday, Wednesday, Tuesday', '0.4') ,
+    ('5147', 'Dr. A. Velumani', 'scars, burns, deformities, nose reshaping, breast reconstruction, facial reconstruction, cleft lip or palate, cosmetic issues, skin grafting, excess skin removal, liposuction, wrinkles, hand injuries, ear reshaping, facial asymmetry', 'Plastic Surgeon', '9416161252', 'dr..a..velumani@hospital.com', 'St. John’s Medical College and Hospital', 'Sarjapur Road\nBengaluru, Karnataka 560034\nIndia', '09:00-19:00', 'Tuesday, Wednesday, Sunday, Monday', '3.4') ,
+    ('8298', 'Dr. Devi Prasad Shetty', 'stomach pain, bloating, heartburn, indigestion, constipation, diarrhea, blood in stool, acid reflux, difficulty swallowing, nausea, vomiting, gas issues, ulcers, liver problems, gallstones', 'Gastroenterologist', '9708267417', 'dr..devi.prasad.shetty@hospital.com', 'KMC Hospital', 'Ambedkar Circle\nMangalore, Karnataka 575001\nIndia', '08:00-18:00', 'Tuesday, Friday, Monday, Wednesday, Sunday', '0.7') ,
+    ('3972', 'Dr. P. Raghuram', 'stomach pain, bloating, heartburn, indigestion, constipation, diarrhea, blood in stool, acid reflux, difficulty swallowing, nausea, vomiting, gas issues, ulcers, liver problems, gallstones', 'Gastroenterologist', '9247771320', 'dr..p..raghuram@hospital.com', 'SDM College of Medical Sciences & Hospital', 'Manjushree Nagar\nDharwad, Karnataka 580009\nIndia', '10:00-19:00', 'Friday, Thursday, Monday', '4.0') ,
+    ('6188', 'Dr. Mammen Chandy', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9239857797', 'dr..mammen.chandy@hospital.com', 'Shimoga Institute of Medical Sciences', 'Sagar Road\nShivamogga, Karnataka 577201\nIndia', '08:00-16:00', 'Sunday, Thursday, Saturday, Wednesday', '2.2') ,
+    ('1957', 'Dr. Priya Shetty', 'chest pain, breathlessness, fatigue, irregular heartbeats, high blood pressure, dizziness, fainting, chest tightness, heart failure, swollen ankles or feet, palpitations, heart attack symptoms, angina, heart murmurs, hypertension', 'Cardiologist', '9100742578', 'dr..priya.shetty@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '08:00-18:00', 'Thursday, Monday, Tuesday, Saturday', '3.9') ,
+    ('4493', 'Dr. Arjun Rao', 'anemia, fatigue, pale skin, easy bruising, excessive bleeding, blood clots, swollen lymph nodes, infections, low platelet count, bone marrow problems, leukemia, sickle cell disease, thalassemia, bleeding disorders, iron deficiency', 'Hematologist', '9793965467', 'dr..arjun.rao@hospital.com', 'Manipal Hospital', 'HAL Old Airport Road\nBengaluru, Karnataka 560017\nIndia', '10:00-16:00', 'Thursday, Tuesday, Saturday, Wednesday', '3.5') ,
+    ('3889', 'Dr. Prathap C. Reddy', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9411922157', 'dr..prathap.c..reddy@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '09:00-19:00', 'Wednesday, Saturday, Thursday, Friday, Monday', '4.9') ,
+    ('3671', 'Dr. Sameer Reddy', 'disease diagnosis, biopsy analysis, abnormal blood test results, cancer detection, infections, chronic diseases, tissue analysis, organ dysfunction, laboratory testing issues, unexplained symptoms, genetic disorders, disease progression monitoring, infections in organs, rare conditions, tumor evaluation', 'Pathologist', '9145618247', 'dr..sameer.reddy@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '09:00-19:00', 'Monday, Sunday, Friday, Saturday, Tuesday', '4.9') ,
+    ('7536', 'Dr. A. Velumani', 'fever, body aches, colds, cough, flu, stomach pain, headaches, fatigue, minor injuries, allergies, infections, high blood pressure, diabetes symptoms, general weakness, preventive health care', 'General Physician', '9500980314', 'dr..a..velumani@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '08:00-18:00', 'Wednesday, Thursday, Saturday, Sunday, Tuesday', '3.6') ,
+    ('8634', 'Dr. Vandana Shiva', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9681521939', 'dr..vandana.shiva@hospital.com', 'Manipal Hospital', 'HAL Old Airport Road\nBengaluru, Karnataka 560017\nIndia', '09:00-17:00', 'Saturday, Wednesday, Thursday', '2.9') ,
+    ('1616', 'Dr. Mammen Chandy', 'fractures, internal injuries, tumors, abnormal growths, infections, lung conditions, heart conditions, brain abnormalities, gastrointestinal issues, spinal problems, cancer screening, bone density issues, unexplained pain, swollen organs, imaging needs', 'Radiologist', '9612000974', 'dr..mammen.chandy@hospital.com', 'Victoria Hospital', 'K.R. Market\nBengaluru, Karnataka 560002\nIndia', '10:00-17:00', 'Saturday, Sunday, Thursday', '0.9') ,
+    ('2052', 'Dr. Mammen Chandy', 'pain management needs, pre-surgery assessments, post-surgery recovery, chronic pain issues, numbness for surgery, sedation, monitoring during operations, spinal anesthesia, epidurals, critical care, pain relief during labor, nerve blocks, emergency pain relief, breathing support, anesthesia for dental procedures', 'Anesthesiologist', '9898178245', 'dr..mammen.chandy@hospital.com', 'Narayana Health City', 'Bommasandra Industrial Area\nBengaluru, Karnataka 560099\nIndia', '10:00-18:00', 'Monday, Friday, Wednesday', '1.0') ,
+    ('9922', 'Dr. Priya Shetty', 'disease diagnosis, biopsy analysis, abnormal blood test results, cancer detection, infections, chronic diseases, tissue analysis, organ dysfunction, laboratory testing issues, unexplained symptoms, genetic disorders, disease progression monitoring, infections in organs, rare conditions, tumor evaluation', 'Pathologist', '9437372281', 'dr..priya.shetty@hospital.com', 'Father Muller Medical College Hospital', 'Kankanady\nMangalore, Karnataka 575002\nIndia', '09:00-18:00', 'Monday, Friday, Tuesday, Wednesday, Saturday', '0.1') ,
+    ('7833', 'Dr. Meena Menon', 'anemia, fatigue, pale skin, easy bruising, excessive bleeding, blood clots, swollen lymph nodes, infections, low platelet count, bone marrow problems, leukemia, sickle cell disease, thalassemia, bleeding disorders, iron deficiency', 'Hematologist', '9674821570', 'dr..meena.menon@hospital.com', 'S. S. Institute of Medical Sciences', 'NH-4 Bypass\nDavangere, Karnataka 577005\nIndia', '09:00-18:00', 'Friday, Monday, Sunday', '4.7') ,
+    ('5388', 'Dr. Vikas Iyer', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9101135923', 'dr..vikas.iyer@hospital.com', 'SDM College of Medical Sciences & Hospital', 'Manjushree Nagar\nDharwad, Karnataka 580009\nIndia', '08:00-19:00', 'Saturday, Tuesday, Friday', '2.5') ,
+    ('5422', 'Dr. A. Velumani', 'fever, body aches, colds, cough, flu, stomach pain, headaches, fatigue, minor injuries, allergies, infections, high blood pressure, diabetes symptoms, general weakness, preventive health care', 'General Physician', '9522087984', 'dr..a..velumani@hospital.com', 'Father Muller Medical College Hospital', 'Kankanady\nMangalore, Karnataka 575002\nIndia', '08:00-19:00', 'Sunday, Friday, Thursday', '4.5') ,
+    ('5806', 'Dr. Prathap C. Reddy', 'acne, skin rashes, dry skin, eczema, psoriasis, moles, skin discoloration, warts, hair loss, dandruff, nail problems, skin allergies, skin infections, wrinkles, scars', 'Dermatologist', '9777285111', 'dr..prathap.c..reddy@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '08:00-16:00', 'Thursday, Saturday, Monday, Tuesday', '2.0') ,
+    ('3851', 'Dr. Anjali Kulkarni', 'disease diagnosis, biopsy analysis, abnormal blood test results, cancer detection, infections, chronic diseases, tissue analysis, organ dysfunction, laboratory testing issues, unexplained symptoms, genetic disorders, disease progression monitoring, infections in organs, rare conditions, tumor evaluation', 'Pathologist', '9614087114', 'dr..anjali.kulkarni@hospital.com', 'SDM College of Medical Sciences & Hospital', 'Manjushree Nagar\nDharwad, Karnataka 580009\nIndia', '09:00-16:00', 'Thursday, Monday, Tuesday, Friday', '1.7') ,
+    ('6998', 'Dr. Mammen Chandy', 'acne, skin rashes, dry skin, eczema, psoriasis, moles, skin discoloration, warts, hair loss, dandruff, nail problems, skin allergies, skin infections, wrinkles, scars', 'Dermatologist', '9912789870', 'dr..mammen.chandy@hospital.com', 'BGS Gleneagles Global Hospital', 'Kengeri\nBengaluru, Karnataka 560060\nIndia', '09:00-17:00', 'Monday, Sunday, Tuesday, Wednesday', '0.8') ,
+    ('3342', 'Dr. Padmavati Sivaramakrishna Iyer', 'joint pain, broken bones, arthritis, back pain, sports injuries, sprains, ligament tears, bone deformities, dislocations, scoliosis, knee pain, hip pain, tendon injuries, carpal tunnel syndrome, shoulder stiffness', 'Orthopedic Surgeon', '9946646829', 'dr..padmavati.sivaramakrishna.iyer@hospital.com', 'Kasturba Medical College and Hospital', 'Tiger Circle Road\nManipal, Karnataka 576104\nIndia', '08:00-19:00', 'Sunday, Friday, Wednesday, Saturday', '1.6') ,
+    ('1613', 'Dr. V. Mohan', 'frequent infections, allergic reactions, autoimmune diseases, asthma, eczema, hay fever, hives, immunodeficiency disorders, food allergies, swelling after insect bites, recurrent colds, chronic sinus infections, fatigue from weak immunity, unusual infections, vaccine-related issues', 'Immunologist', '9543008356', 'dr..v..mohan@hospital.com', 'JSS Hospital', 'MG Road\nMysuru, Karnataka 570004\nIndia', '10:00-18:00', 'Thursday, Monday, Friday', '1.2') ,
+    ('5149', 'Dr. Sudhansu Bhattacharyya', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9948140463', 'dr..sudhansu.bhattacharyya@hospital.com', 'Apollo BGS Hospitals', 'Adichunchanagiri Road\nMysuru, Karnataka 570023\nIndia', '10:00-16:00', 'Sunday, Friday, Thursday, Monday', '2.4') ,
+    ('8859', 'Dr. Naresh Trehan', 'ear pain, hearing loss, nasal congestion, throat pain, sinus infections, balance issues, snoring, voice problems, tonsillitis, tinnitus, allergies, deviated septum, speech difficulties, chronic cough, ear infections', 'ENT Specialist', '9644910827', 'dr..naresh.trehan@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '10:00-16:00', 'Tuesday, Sunday, Thursday', '2.3') ,
+    ('1539', 'Dr. Prashant Sharma', 'joint pain, broken bones, arthritis, back pain, sports injuries, sprains, ligament tears, bone deformities, dislocations, scoliosis, knee pain, hip pain, tendon injuries, carpal tunnel syndrome, shoulder stiffness', 'Orthopedic Surgeon', '9946902475', 'dr..prashant.sharma@hospital.com', 'Victoria Hospital', 'K.R. Market\nBengaluru, Karnataka 560002\nIndia', '10:00-18:00', 'Saturday, Friday, Tuesday, Wednesday', '3.3') ,
+    ('9884', 'Dr. Prathap C. Reddy', 'severe headaches, brain tumors, dizziness, seizures, memory loss, numbness or tingling, paralysis, tremors, migraines, muscle weakness, speech difficulties, cognitive problems, movement disorders, difficulty walking, stroke symptoms', 'Neurologist', '9726082287', 'dr..prathap.c..reddy@hospital.com', 'SDM College of Medical Sciences & Hospital', 'Manjushree Nagar\nDharwad, Karnataka 580009\nIndia', '10:00-17:00', 'Wednesday, Monday, Friday', '2.8') ,
+    ('3922', 'Dr. Padmavati Sivaramakrishna Iyer', 'disease diagnosis, biopsy analysis, abnormal blood test results, cancer detection, infections, chronic diseases, tissue analysis, organ dysfunction, laboratory testing issues, unexplained symptoms, genetic disorders, disease progression monitoring, infections in organs, rare conditions, tumor evaluation', 'Pathologist', '9711560827', 'dr..padmavati.sivaramakrishna.iyer@hospital.com', 'Narayana Health City', 'Bommasandra Industrial Area\nBengaluru, Karnataka 560099\nIndia', '10:00-19:00', 'Sunday, Friday, Thursday, Monday', '1.4') ,
+    ('2060', 'Dr. Padmavati Sivaramakrishna Iyer', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9440717889', 'dr..padmavati.sivaramakrishna.iyer@hospital.com', 'Manipal Hospital', 'HAL Old Airport Road\nBengaluru, Karnataka 560017\nIndia', '09:00-19:00', 'Tuesday, Thursday, Sunday, Monday, Friday', '2.1') ,
+    ('4905', 'Dr. A. Velumani', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9451071661', 'dr..a..velumani@hospital.com', 'JSS Hospital', 'MG Road\nMysuru, Karnataka 570004\nIndia', '08:00-16:00', 'Tuesday, Sunday, Thursday', '0.3') ,
+    ('8023', 'Dr. Shalini Desai', 'swelling in legs or feet, blood in urine, foamy urine, high blood pressure, kidney stones, fatigue, nausea, frequent urination at night, chronic kidney disease, difficulty concentrating, decreased appetite, back pain near kidneys, electrolyte imbalance, kidney infections, dialysis needs', 'Nephrologist', '9252287604', 'dr..shalini.desai@hospital.com', 'KMC Hospital', 'Ambedkar Circle\nMangalore, Karnataka 575001\nIndia', '09:00-18:00', 'Thursday, Friday, Saturday', '4.6') ,
+    ('7074', 'Dr. P. Raghuram', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9898139891', 'dr..p..raghuram@hospital.com', 'Apollo BGS Hospitals', 'Adichunchanagiri Road\nMysuru, Karnataka 570023\nIndia', '10:00-18:00', 'Monday, Wednesday, Tuesday, Thursday', '3.2') ,
+    ('4061', 'Dr. S. K. Sarin', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9342307372', 'dr..s..k..sarin@hospital.com', 'Apollo BGS Hospitals', 'Adichunchanagiri Road\nMysuru, Karnataka 570023\nIndia', '08:00-17:00', 'Sunday, Friday, Tuesday, Thursday', '3.9') ,
+    ('8591', 'Dr. Ashok Seth', 'fractures, internal injuries, tumors, abnormal growths, infections, lung conditions, heart conditions, brain abnormalities, gastrointestinal issues, spinal problems, cancer screening, bone density issues, unexplained pain, swollen organs, imaging needs', 'Radiologist', '9222294011', 'dr..ashok.seth@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '10:00-16:00', 'Monday, Thursday, Sunday, Wednesday, Saturday', '1.2') ,
+    ('8046', 'Dr. Naresh Trehan', 'anemia, fatigue, pale skin, easy bruising, excessive bleeding, blood clots, swollen lymph nodes, infections, low platelet count, bone marrow problems, leukemia, sickle cell disease, thalassemia, bleeding disorders, iron deficiency', 'Hematologist', '9379774779', 'dr..naresh.trehan@hospital.com', 'JSS Hospital', 'MG Road\nMysuru, Karnataka 570004\nIndia', '09:00-16:00', 'Saturday, Sunday, Thursday', '2.7') ,
+    ('7805', 'Dr. Balamurali Ambati', 'acne, skin rashes, dry skin, eczema, psoriasis, moles, skin discoloration, warts, hair loss, dandruff, nail problems, skin allergies, skin infections, wrinkles, scars', 'Dermatologist', '9804438417', 'dr..balamurali.ambati@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '09:00-17:00', 'Sunday, Wednesday, Monday', '3.7') ,
+    ('1334', 'Dr. Mahesh Gowda', 'frequent infections, allergic reactions, autoimmune diseases, asthma, eczema, hay fever, hives, immunodeficiency disorders, food allergies, swelling after insect bites, recurrent colds, chronic sinus infections, fatigue from weak immunity, unusual infections, vaccine-related issues', 'Immunologist', '9402759195', 'dr..mahesh.gowda@hospital.com', 'SDM College of Medical Sciences & Hospital', 'Manjushree Nagar\nDharwad, Karnataka 580009\nIndia', '10:00-18:00', 'Wednesday, Friday, Thursday', '4.8') ,
+    ('4508', 'Dr. Sudhansu Bhattacharyya', 'fever in children, ear infections, cough, colds, flu, developmental delays, skin rashes, stomach pain, vomiting, diarrhea, asthma symptoms, behavioral issues, vaccination needs, growth concerns, allergies in children', 'Pediatrician', '9297365998', 'dr..sudhansu.bhattacharyya@hospital.com', 'Manipal Hospital', 'HAL Old Airport Road\nBengaluru, Karnataka 560017\nIndia', '10:00-16:00', 'Tuesday, Wednesday, Saturday, Friday, Monday', '3.2') ,
+    ('6537', 'Dr. Vikas Iyer', 'acne, skin rashes, dry skin, eczema, psoriasis, moles, skin discoloration, warts, hair loss, dandruff, nail problems, skin allergies, skin infections, wrinkles, scars', 'Dermatologist', '9174938696', 'dr..vikas.iyer@hospital.com', 'S. S. Institute of Medical Sciences', 'NH-4 Bypass\nDavangere, Karnataka 577005\nIndia', '09:00-19:00', 'Friday, Thursday, Wednesday, Tuesday', '4.8') ,
+    ('6530', 'Dr. Anjali Kulkarni', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9161559492', 'dr..anjali.kulkarni@hospital.com', 'Victoria Hospital', 'K.R. Market\nBengaluru, Karnataka 560002\nIndia', '10:00-18:00', 'Saturday, Tuesday, Thursday', '3.1') ,
+    ('6820', 'Dr. Devi Prasad Shetty', 'mobility issues, memory loss, frequent falls, arthritis, chronic diseases, osteoporosis, frailty, depression in the elderly, hearing problems, visual impairments, medication management, dementia, sleep issues, urinary incontinence, cardiovascular diseases', 'Geriatrician', '9606195842', 'dr..devi.prasad.shetty@hospital.com', 'Sparsh Hospital', 'Infantry Road\nBengaluru, Karnataka 560001\nIndia', '10:00-18:00', 'Monday, Friday, Saturday', '4.1') ,
+    ('9950', 'Dr. P. Raghuram', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9581154255', 'dr..p..raghuram@hospital.com', 'Manipal Hospital', 'HAL Old Airport Road\nBengaluru, Karnataka 560017\nIndia', '08:00-18:00', 'Sunday, Friday, Monday, Tuesday, Saturday', '4.0') ,
+    ('4952', 'Dr. B. C. Roy', 'irregular periods, pelvic pain, vaginal discharge, urinary infections, infertility, pregnancy care, menopause symptoms, hormonal imbalances, breast lumps, painful periods, endometriosis, PCOS, abnormal bleeding, pelvic infections, sexual health concerns', 'Gynecologist', '9660468395', 'dr..b..c..roy@hospital.com', 'KMC Hospital', 'Ambedkar Circle\nMangalore, Karnataka 575001\nIndia', '08:00-17:00', 'Thursday, Wednesday, Monday', '2.1') ,
+    ('9490', 'Dr. Ravi Kumar', 'stomach pain, bloating, heartburn, indigestion, constipation, diarrhea, blood in stool, acid reflux, difficulty swallowing, nausea, vomiting, gas issues, ulcers, liver problems, gallstones', 'Gastroenterologist', '9203813650', 'dr..ravi.kumar@hospital.com', 'Shimoga Institute of Medical Sciences', 'Sagar Road\nShivamogga, Karnataka 577201\nIndia', '10:00-16:00', 'Wednesday, Friday, Saturday, Sunday', '2.6') ,
+    ('1216', 'Dr. Devi Prasad Shetty', 'acne, skin rashes, dry skin, eczema, psoriasis, moles, skin discoloration, warts, hair loss, dandruff, nail problems, skin allergies, skin infections, wrinkles, scars', 'Dermatologist', '9145476271', 'dr..devi.prasad.shetty@hospital.com', 'Vinayaka Hospital', 'Vinoba Nagar\nShivamogga, Karnataka 577204\nIndia', '08:00-18:00', 'Tuesday, Monday, Saturday, Thursday, Friday', '4.6') ,
+    ('6841', 'Dr. Priya Shetty', 'anemia, fatigue, pale skin, easy bruising, excessive bleeding, blood clots, swollen lymph nodes, infections, low platelet count, bone marrow problems, leukemia, sickle cell disease, thalassemia, bleeding disorders, iron deficiency', 'Hematologist', '9435895058', 'dr..priya.shetty@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '09:00-17:00', 'Friday, Monday, Thursday, Sunday', '1.4') ,
+    ('4710', 'Dr. S. K. Sarin', 'chest pain, breathlessness, fatigue, irregular heartbeats, high blood pressure, dizziness, fainting, chest tightness, heart failure, swollen ankles or feet, palpitations, heart attack symptoms, angina, heart murmurs, hypertension', 'Cardiologist', '9698279707', 'dr..s..k..sarin@hospital.com', 'Shimoga Institute of Medical Sciences', 'Sagar Road\nShivamogga, Karnataka 577201\nIndia', '09:00-19:00', 'Monday, Saturday, Wednesday, Thursday, Sunday', '4.1') ,
+    ('3228', 'Dr. V. Mohan', 'persistent cough, shortness of breath, chest tightness, wheezing, asthma symptoms, chronic bronchitis, pneumonia, sleep apnea, lung infections, coughing up blood, fatigue from breathing issues, chest pain, COPD, tuberculosis, lung cancer symptoms', 'Pulmonologist', '9995209503', 'dr..v..mohan@hospital.com', 'Narayana Health City', 'Bommasandra Industrial Area\nBengaluru, Karnataka 560099\nIndia', '09:00-19:00', 'Wednesday, Thursday, Tuesday', '0.7') ,
+    ('9248', 'Dr. K. K. Aggarwal', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9994687910', 'dr..k..k..aggarwal@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '08:00-17:00', 'Wednesday, Saturday, Sunday, Thursday', '4.2') ,
+    ('5147', 'Dr. Mahesh Gowda', 'fever, body aches, colds, cough, flu, stomach pain, headaches, fatigue, minor injuries, allergies, infections, high blood pressure, diabetes symptoms, general weakness, preventive health care', 'General Physician', '9561591420', 'dr..mahesh.gowda@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '10:00-19:00', 'Monday, Sunday, Wednesday, Thursday', '1.5') ,
+    ('4499', 'Dr. Padmavati Sivaramakrishna Iyer', 'joint pain, stiffness, swelling, fatigue, arthritis, lupus, gout, back pain, connective tissue disorders, autoimmune diseases, fibromyalgia, joint inflammation, muscle weakness, chronic pain, swollen fingers or toes', 'Rheumatologist', '9329093455', 'dr..padmavati.sivaramakrishna.iyer@hospital.com', 'Dr. TMA Pai Hospital', 'Udupi-Manipal Highway\nManipal, Karnataka 576104\nIndia', '08:00-18:00', 'Monday, Saturday, Wednesday, Sunday, Thursday', '2.4') ,
+    ('4929', 'Dr. Prathap C. Reddy', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9649327580', 'dr..prathap.c..reddy@hospital.com', 'Dr. TMA Pai Hospital', 'Udupi-Manipal Highway\nManipal, Karnataka 576104\nIndia', '08:00-19:00', 'Thursday, Monday, Tuesday, Wednesday', '0.5') ,
+    ('8217', 'Dr. Prashant Sharma', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9850002075', 'dr..prashant.sharma@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '10:00-18:00', 'Sunday, Saturday, Tuesday, Friday', '2.2') ,
+    ('2573', 'Dr. Ashok Seth', 'irregular periods, pelvic pain, vaginal discharge, urinary infections, infertility, pregnancy care, menopause symptoms, hormonal imbalances, breast lumps, painful periods, endometriosis, PCOS, abnormal bleeding, pelvic infections, sexual health concerns', 'Gynecologist', '9590856281', 'dr..ashok.seth@hospital.com', 'Vinayaka Hospital', 'Vinoba Nagar\nShivamogga, Karnataka 577204\nIndia', '09:00-18:00', 'Tuesday, Sunday, Monday', '0.0') ,
+    ('8625', 'Dr. Gagandeep Kang', 'severe headaches, brain tumors, dizziness, seizures, memory loss, numbness or tingling, paralysis, tremors, migraines, muscle weakness, speech difficulties, cognitive problems, movement disorders, difficulty walking, stroke symptoms', 'Neurologist', '9441738269', 'dr..gagandeep.kang@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '08:00-18:00', 'Saturday, Wednesday, Sunday', '1.7') ,
+    ('5616', 'Dr. Vandana Shiva', 'ear pain, hearing loss, nasal congestion, throat pain, sinus infections, balance issues, snoring, voice problems, tonsillitis, tinnitus, allergies, deviated septum, speech difficulties, chronic cough, ear infections', 'ENT Specialist', '9686457877', 'dr..vandana.shiva@hospital.com', 'Father Muller Medical College Hospital', 'Kankanady\nMangalore, Karnataka 575002\nIndia', '10:00-17:00', 'Wednesday, Sunday, Monday, Saturday, Friday', '1.5') ,
+    ('2272', 'Dr. Priya Shetty', 'anemia, fatigue, pale skin, easy bruising, excessive bleeding, blood clots, swollen lymph nodes, infections, low platelet count, bone marrow problems, leukemia, sickle cell disease, thalassemia, bleeding disorders, iron deficiency', 'Hematologist', '9948289212', 'dr..priya.shetty@hospital.com', 'Shimoga Institute of Medical Sciences', 'Sagar Road\nShivamogga, Karnataka 577201\nIndia', '10:00-19:00', 'Friday, Sunday, Monday', '4.2') ,
+    ('1975', 'Dr. Ravi Kumar', 'ear pain, hearing loss, nasal congestion, throat pain, sinus infections, balance issues, snoring, voice problems, tonsillitis, tinnitus, allergies, deviated septum, speech difficulties, chronic cough, ear infections', 'ENT Specialist', '9342664122', 'dr..ravi.kumar@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '08:00-17:00', 'Friday, Monday, Wednesday, Saturday, Thursday', '3.0') ,
+    ('3406', 'Dr. Prashant Sharma', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9297828155', 'dr..prashant.sharma@hospital.com', 'JSS Hospital', 'MG Road\nMysuru, Karnataka 570004\nIndia', '09:00-19:00', 'Friday, Sunday, Saturday', '0.0') ,
+    ('5761', 'Dr. Sunita Naik', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9525889655', 'dr..sunita.naik@hospital.com', 'Shimoga Institute of Medical Sciences', 'Sagar Road\nShivamogga, Karnataka 577201\nIndia', '10:00-18:00', 'Monday, Tuesday, Sunday', '0.6') ,
+    ('4666', 'Dr. Arjun Rao', 'fever, body aches, colds, cough, flu, stomach pain, headaches, fatigue, minor injuries, allergies, infections, high blood pressure, diabetes symptoms, general weakness, preventive health care', 'General Physician', '9911704807', 'dr..arjun.rao@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '08:00-18:00', 'Monday, Tuesday, Saturday, Sunday, Wednesday', '0.6') ,
+    ('2470', 'Dr. V. Mohan', 'acne, skin rashes, dry skin, eczema, psoriasis, moles, skin discoloration, warts, hair loss, dandruff, nail problems, skin allergies, skin infections, wrinkles, scars', 'Dermatologist', '9508058600', 'dr..v..mohan@hospital.com', 'Sparsh Hospital', 'Infantry Road\nBengaluru, Karnataka 560001\nIndia', '08:00-16:00', 'Saturday, Tuesday, Sunday, Wednesday, Monday', '1.4') ,
+    ('1603', 'Dr. Sameer Reddy', 'ear pain, hearing loss, nasal congestion, throat pain, sinus infections, balance issues, snoring, voice problems, tonsillitis, tinnitus, allergies, deviated septum, speech difficulties, chronic cough, ear infections', 'ENT Specialist', '9466334544', 'dr..sameer.reddy@hospital.com', 'Shimoga Institute of Medical Sciences', 'Sagar Road\nShivamogga, Karnataka 577201\nIndia', '09:00-18:00', 'Wednesday, Saturday, Sunday, Friday, Monday', '1.3') ,
+    ('4159', 'Dr. S. K. Sarin', 'stomach pain, bloating, heartburn, indigestion, constipation, diarrhea, blood in stool, acid reflux, difficulty swallowing, nausea, vomiting, gas issues, ulcers, liver problems, gallstones', 'Gastroenterologist', '9295887352', 'dr..s..k..sarin@hospital.com', 'Apollo BGS Hospitals', 'Adichunchanagiri Road\nMysuru, Karnataka 570023\nIndia', '10:00-17:00', 'Friday, Thursday, Tuesday', '2.6') ,
+    ('6960', 'Dr. Meena Menon', 'toothache, gum bleeding, cavities, bad breath, sensitivity to hot or cold, oral infections, jaw pain, wisdom teeth issues, teeth cleaning, braces, mouth ulcers, dry mouth, broken teeth, missing teeth, tooth decay', 'Dentist', '9322233642', 'dr..meena.menon@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '10:00-16:00', 'Friday, Saturday, Monday', '0.3') ,
+    ('9612', 'Dr. Sunita Naik', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9426518518', 'dr..sunita.naik@hospital.com', 'Apollo BGS Hospitals', 'Adichunchanagiri Road\nMysuru, Karnataka 570023\nIndia', '09:00-18:00', 'Tuesday, Monday, Friday', '4.9') ,
+    ('3187', 'Dr. Meena Menon', 'persistent cough, shortness of breath, chest tightness, wheezing, asthma symptoms, chronic bronchitis, pneumonia, sleep apnea, lung infections, coughing up blood, fatigue from breathing issues, chest pain, COPD, tuberculosis, lung cancer symptoms', 'Pulmonologist', '9316251683', 'dr..meena.menon@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '10:00-17:00', 'Saturday, Thursday, Monday, Sunday', '3.3') ,
+    ('7483', 'Dr. K. K. Aggarwal', 'frequent infections, allergic reactions, autoimmune diseases, asthma, eczema, hay fever, hives, immunodeficiency disorders, food allergies, swelling after insect bites, recurrent colds, chronic sinus infections, fatigue from weak immunity, unusual infections, vaccine-related issues', 'Immunologist', '9774025137', 'dr..k..k..aggarwal@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '09:00-18:00', 'Sunday, Friday, Thursday', '1.4') ,
+    ('2909', 'Dr. Gagandeep Kang', 'fever, body aches, colds, cough, flu, stomach pain, headaches, fatigue, minor injuries, allergies, infections, high blood pressure, diabetes symptoms, general weakness, preventive health care', 'General Physician', '9680679885', 'dr..gagandeep.kang@hospital.com', 'Father Muller Medical College Hospital', 'Kankanady\nMangalore, Karnataka 575002\nIndia', '10:00-16:00', 'Friday, Sunday, Saturday', '1.4') ,
+    ('9719', 'Dr. A. Velumani', 'chest pain, breathlessness, fatigue, irregular heartbeats, high blood pressure, dizziness, fainting, chest tightness, heart failure, swollen ankles or feet, palpitations, heart attack symptoms, angina, heart murmurs, hypertension', 'Cardiologist', '9796990901', 'dr..a..velumani@hospital.com', 'St. John’s Medical College and Hospital', 'Sarjapur Road\nBengaluru, Karnataka 560034\nIndia', '09:00-17:00', 'Sunday, Saturday, Friday, Wednesday, Thursday', '3.1') ,
+    ('8638', 'Dr. Vandana Shiva', 'swelling in legs or feet, blood in urine, foamy urine, high blood pressure, kidney stones, fatigue, nausea, frequent urination at night, chronic kidney disease, difficulty concentrating, decreased appetite, back pain near kidneys, electrolyte imbalance, kidney infections, dialysis needs', 'Nephrologist', '9829300166', 'dr..vandana.shiva@hospital.com', 'Manipal Hospital', 'HAL Old Airport Road\nBengaluru, Karnataka 560017\nIndia', '08:00-16:00', 'Monday, Sunday, Tuesday, Thursday', '0.0') ,
+    ('7989', 'Dr. A. Velumani', 'chest pain, breathlessness, fatigue, irregular heartbeats, high blood pressure, dizziness, fainting, chest tightness, heart failure, swollen ankles or feet, palpitations, heart attack symptoms, angina, heart murmurs, hypertension', 'Cardiologist', '9975984986', 'dr..a..velumani@hospital.com', 'JSS Hospital', 'MG Road\nMysuru, Karnataka 570004\nIndia', '10:00-18:00', 'Friday, Wednesday, Thursday, Sunday', '2.0') ,
+    ('7145', 'Dr. Swati Piramal', 'swelling in legs or feet, blood in urine, foamy urine, high blood pressure, kidney stones, fatigue, nausea, frequent urination at night, chronic kidney disease, difficulty concentrating, decreased appetite, back pain near kidneys, electrolyte imbalance, kidney infections, dialysis needs', 'Nephrologist', '9805178184', 'dr..swati.piramal@hospital.com', 'St. John’s Medical College and Hospital', 'Sarjapur Road\nBengaluru, Karnataka 560034\nIndia', '09:00-19:00', 'Friday, Saturday, Thursday, Monday', '2.1') ,
+    ('1448', 'Dr. Anjali Kulkarni', 'chest pain, breathlessness, fatigue, irregular heartbeats, high blood pressure, dizziness, fainting, chest tightness, heart failure, swollen ankles or feet, palpitations, heart attack symptoms, angina, heart murmurs, hypertension', 'Cardiologist', '9824463207', 'dr..anjali.kulkarni@hospital.com', 'KMC Hospital', 'Ambedkar Circle\nMangalore, Karnataka 575001\nIndia', '10:00-19:00', 'Sunday, Thursday, Monday, Wednesday, Friday', '4.0') ,
+    ('6316', 'Dr. Sudhansu Bhattacharyya', 'disease diagnosis, biopsy analysis, abnormal blood test results, cancer detection, infections, chronic diseases, tissue analysis, organ dysfunction, laboratory testing issues, unexplained symptoms, genetic disorders, disease progression monitoring, infections in organs, rare conditions, tumor evaluation', 'Pathologist', '9728560116', 'dr..sudhansu.bhattacharyya@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '08:00-18:00', 'Sunday, Thursday, Tuesday, Wednesday', '4.6') ,
+    ('5513', 'Dr. Mahesh Gowda', 'pain management needs, pre-surgery assessments, post-surgery recovery, chronic pain issues, numbness for surgery, sedation, monitoring during operations, spinal anesthesia, epidurals, critical care, pain relief during labor, nerve blocks, emergency pain relief, breathing support, anesthesia for dental procedures', 'Anesthesiologist', '9498263358', 'dr..mahesh.gowda@hospital.com', 'BGS Gleneagles Global Hospital', 'Kengeri\nBengaluru, Karnataka 560060\nIndia', '10:00-18:00', 'Saturday, Tuesday, Wednesday, Thursday', '1.0') ,
+    ('4545', 'Dr. B. C. Roy', 'disease diagnosis, biopsy analysis, abnormal blood test results, cancer detection, infections, chronic diseases, tissue analysis, organ dysfunction, laboratory testing issues, unexplained symptoms, genetic disorders, disease progression monitoring, infections in organs, rare conditions, tumor evaluation', 'Pathologist', '9318001263', 'dr..b..c..roy@hospital.com', 'Narayana Health City', 'Bommasandra Industrial Area\nBengaluru, Karnataka 560099\nIndia', '10:00-16:00', 'Sunday, Tuesday, Friday, Wednesday', '3.8') ,
+    ('4701', 'Dr. K. K. Aggarwal', 'joint pain, stiffness, swelling, fatigue, arthritis, lupus, gout, back pain, connective tissue disorders, autoimmune diseases, fibromyalgia, joint inflammation, muscle weakness, chronic pain, swollen fingers or toes', 'Rheumatologist', '9521410161', 'dr..k..k..aggarwal@hospital.com', 'Victoria Hospital', 'K.R. Market\nBengaluru, Karnataka 560002\nIndia', '09:00-19:00', 'Friday, Sunday, Wednesday, Saturday, Monday', '1.3') ,
+    ('5855', 'Dr. Sudhansu Bhattacharyya', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9151399825', 'dr..sudhansu.bhattacharyya@hospital.com', 'Apollo BGS Hospitals', 'Adichunchanagiri Road\nMysuru, Karnataka 570023\nIndia', '08:00-19:00', 'Wednesday, Saturday, Tuesday, Thursday', '1.3') ,
+    ('8204', 'Dr. Mahesh Gowda', 'stomach pain, bloating, heartburn, indigestion, constipation, diarrhea, blood in stool, acid reflux, difficulty swallowing, nausea, vomiting, gas issues, ulcers, liver problems, gallstones', 'Gastroenterologist', '9374852159', 'dr..mahesh.gowda@hospital.com', 'Manipal Hospital', 'HAL Old Airport Road\nBengaluru, Karnataka 560017\nIndia', '08:00-16:00', 'Tuesday, Wednesday, Thursday', '4.9') ,
+    ('2157', 'Dr. Meena Menon', 'toothache, gum bleeding, cavities, bad breath, sensitivity to hot or cold, oral infections, jaw pain, wisdom teeth issues, teeth cleaning, braces, mouth ulcers, dry mouth, broken teeth, missing teeth, tooth decay', 'Dentist', '9783725221', 'dr..meena.menon@hospital.com', 'JSS Hospital', 'MG Road\nMysuru, Karnataka 570004\nIndia', '09:00-16:00', 'Saturday, Friday, Thursday, Monday', '1.0') ,
+    ('2392', 'Dr. B. C. Roy', 'persistent cough, shortness of breath, chest tightness, wheezing, asthma symptoms, chronic bronchitis, pneumonia, sleep apnea, lung infections, coughing up blood, fatigue from breathing issues, chest pain, COPD, tuberculosis, lung cancer symptoms', 'Pulmonologist', '9901468830', 'dr..b..c..roy@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '10:00-18:00', 'Wednesday, Thursday, Sunday', '3.1') ,
+    ('3998', 'Dr. Devi Prasad Shetty', 'persistent cough, shortness of breath, chest tightness, wheezing, asthma symptoms, chronic bronchitis, pneumonia, sleep apnea, lung infections, coughing up blood, fatigue from breathing issues, chest pain, COPD, tuberculosis, lung cancer symptoms', 'Pulmonologist', '9660881942', 'dr..devi.prasad.shetty@hospital.com', 'Kasturba Medical College and Hospital', 'Tiger Circle Road\nManipal, Karnataka 576104\nIndia', '10:00-18:00', 'Saturday, Sunday, Friday', '1.8') ,
+    ('1046', 'Dr. K. K. Aggarwal', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9351953743', 'dr..k..k..aggarwal@hospital.com', 'JSS Hospital', 'MG Road\nMysuru, Karnataka 570004\nIndia', '08:00-17:00', 'Friday, Saturday, Monday', '2.2') ,
+    ('5911', 'Dr. K. K. Aggarwal', 'mobility issues, memory loss, frequent falls, arthritis, chronic diseases, osteoporosis, frailty, depression in the elderly, hearing problems, visual impairments, medication management, dementia, sleep issues, urinary incontinence, cardiovascular diseases', 'Geriatrician', '9151876293', 'dr..k..k..aggarwal@hospital.com', 'Shimoga Institute of Medical Sciences', 'Sagar Road\nShivamogga, Karnataka 577201\nIndia', '10:00-16:00', 'Wednesday, Thursday, Sunday, Saturday, Monday', '4.7') ,
+    ('4227', 'Dr. A. Velumani', 'fever in children, ear infections, cough, colds, flu, developmental delays, skin rashes, stomach pain, vomiting, diarrhea, asthma symptoms, behavioral issues, vaccination needs, growth concerns, allergies in children', 'Pediatrician', '9391888863', 'dr..a..velumani@hospital.com', 'Victoria Hospital', 'K.R. Market\nBengaluru, Karnataka 560002\nIndia', '08:00-18:00', 'Sunday, Friday, Monday', '3.2') ,
+    ('3265', 'Dr. Vandana Shiva', 'frequent infections, allergic reactions, autoimmune diseases, asthma, eczema, hay fever, hives, immunodeficiency disorders, food allergies, swelling after insect bites, recurrent colds, chronic sinus infections, fatigue from weak immunity, unusual infections, vaccine-related issues', 'Immunologist', '9142224529', 'dr..vandana.shiva@hospital.com', 'Kasturba Medical College and Hospital', 'Tiger Circle Road\nManipal, Karnataka 576104\nIndia', '08:00-18:00', 'Monday, Tuesday, Friday, Wednesday, Sunday', '3.5') ,
+    ('6768', 'Dr. Sudhansu Bhattacharyya', 'fractures, internal injuries, tumors, abnormal growths, infections, lung conditions, heart conditions, brain abnormalities, gastrointestinal issues, spinal problems, cancer screening, bone density issues, unexplained pain, swollen organs, imaging needs', 'Radiologist', '9545013045', 'dr..sudhansu.bhattacharyya@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '09:00-19:00', 'Tuesday, Friday, Sunday, Thursday', '3.8') ,
+    ('7479', 'Dr. Anjali Kulkarni', 'chest pain, breathlessness, fatigue, irregular heartbeats, high blood pressure, dizziness, fainting, chest tightness, heart failure, swollen ankles or feet, palpitations, heart attack symptoms, angina, heart murmurs, hypertension', 'Cardiologist', '9571448424', 'dr..anjali.kulkarni@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '08:00-18:00', 'Friday, Thursday, Wednesday, Sunday', '4.0') ,
+    ('6030', 'Dr. Arjun Rao', 'irregular periods, pelvic pain, vaginal discharge, urinary infections, infertility, pregnancy care, menopause symptoms, hormonal imbalances, breast lumps, painful periods, endometriosis, PCOS, abnormal bleeding, pelvic infections, sexual health concerns', 'Gynecologist', '9445505100', 'dr..arjun.rao@hospital.com', 'Dr. TMA Pai Hospital', 'Udupi-Manipal Highway\nManipal, Karnataka 576104\nIndia', '09:00-17:00', 'Friday, Saturday, Sunday, Wednesday', '0.3') ,
+    ('1933', 'Dr. Arun Kurian Thomas', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9859015164', 'dr..arun.kurian.thomas@hospital.com', 'Dr. TMA Pai Hospital', 'Udupi-Manipal Highway\nManipal, Karnataka 576104\nIndia', '10:00-17:00', 'Wednesday, Friday, Saturday, Thursday', '3.3') ,
+    ('3603', 'Dr. Anjali Kulkarni', 'frequent infections, allergic reactions, autoimmune diseases, asthma, eczema, hay fever, hives, immunodeficiency disorders, food allergies, swelling after insect bites, recurrent colds, chronic sinus infections, fatigue from weak immunity, unusual infections, vaccine-related issues', 'Immunologist', '9813548953', 'dr..anjali.kulkarni@hospital.com', 'Apollo BGS Hospitals', 'Adichunchanagiri Road\nMysuru, Karnataka 570023\nIndia', '10:00-16:00', 'Tuesday, Wednesday, Friday', '3.2') ,
+    ('6513', 'Dr. Mahesh Gowda', 'blurry vision, eye pain, red eyes, dry eyes, watery eyes, sensitivity to light, floaters, double vision, loss of vision, eyelid problems, cataracts, glaucoma, macular degeneration, eye injuries, eye infections', 'Ophthalmologist', '9984417361', 'dr..mahesh.gowda@hospital.com', 'BGS Gleneagles Global Hospital', 'Kengeri\nBengaluru, Karnataka 560060\nIndia', '10:00-19:00', 'Tuesday, Sunday, Saturday, Thursday', '0.5') ,
+    ('8070', 'Dr. Sunita Naik', 'fever, body aches, colds, cough, flu, stomach pain, headaches, fatigue, minor injuries, allergies, infections, high blood pressure, diabetes symptoms, general weakness, preventive health care', 'General Physician', '9818768927', 'dr..sunita.naik@hospital.com', 'KLE Hospital', 'Nehru Nagar\nBelagavi, Karnataka 590010\nIndia', '09:00-16:00', 'Wednesday, Friday, Sunday', '2.5') ,
+    ('1140', 'Dr. Anjali Kulkarni', 'ear pain, hearing loss, nasal congestion, throat pain, sinus infections, balance issues, snoring, voice problems, tonsillitis, tinnitus, allergies, deviated septum, speech difficulties, chronic cough, ear infections', 'ENT Specialist', '9702704315', 'dr..anjali.kulkarni@hospital.com', 'Narayana Health City', 'Bommasandra Industrial Area\nBengaluru, Karnataka 560099\nIndia', '09:00-18:00', 'Wednesday, Tuesday, Saturday, Sunday, Thursday', '1.3') ,
+    ('2104', 'Dr. Vikas Iyer', 'mobility issues, memory loss, frequent falls, arthritis, chronic diseases, osteoporosis, frailty, depression in the elderly, hearing problems, visual impairments, medication management, dementia, sleep issues, urinary incontinence, cardiovascular diseases', 'Geriatrician', '9607978029', 'dr..vikas.iyer@hospital.com', 'Vinayaka Hospital', 'Vinoba Nagar\nShivamogga, Karnataka 577204\nIndia', '10:00-19:00', 'Tuesday, Wednesday, Saturday', '4.5') ,
+    ('7431', 'Dr. Devi Prasad Shetty', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9611036811', 'dr..devi.prasad.shetty@hospital.com', 'Manipal Hospital', 'HAL Old Airport Road\nBengaluru, Karnataka 560017\nIndia', '09:00-16:00', 'Monday, Tuesday, Friday, Sunday, Thursday', '4.4') ,
+    ('3385', 'Dr. Sudhansu Bhattacharyya', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9506942645', 'dr..sudhansu.bhattacharyya@hospital.com', 'Sparsh Hospital', 'Infantry Road\nBengaluru, Karnataka 560001\nIndia', '08:00-18:00', 'Tuesday, Friday, Wednesday, Monday, Sunday', '4.0') ,
+    ('1173', 'Dr. Arjun Rao', 'irregular periods, pelvic pain, vaginal discharge, urinary infections, infertility, pregnancy care, menopause symptoms, hormonal imbalances, breast lumps, painful periods, endometriosis, PCOS, abnormal bleeding, pelvic infections, sexual health concerns', 'Gynecologist', '9820328793', 'dr..arjun.rao@hospital.com', 'KLE Hospital', 'Nehru Nagar\nBelagavi, Karnataka 590010\nIndia', '09:00-16:00', 'Sunday, Wednesday, Thursday, Tuesday', '3.4') ,
+    ('6597', 'Dr. K. K. Aggarwal', 'joint pain, stiffness, swelling, fatigue, arthritis, lupus, gout, back pain, connective tissue disorders, autoimmune diseases, fibromyalgia, joint inflammation, muscle weakness, chronic pain, swollen fingers or toes', 'Rheumatologist', '9172370181', 'dr..k..k..aggarwal@hospital.com', 'BGS Gleneagles Global Hospital', 'Kengeri\nBengaluru, Karnataka 560060\nIndia', '10:00-19:00', 'Thursday, Monday, Friday', '4.0') ,
+    ('2644', 'Dr. Kavita Patil', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9478576639', 'dr..kavita.patil@hospital.com', 'Shimoga Institute of Medical Sciences', 'Sagar Road\nShivamogga, Karnataka 577201\nIndia', '08:00-16:00', 'Wednesday, Saturday, Thursday, Sunday', '3.1') ,
+    ('9779', 'Dr. Devi Prasad Shetty', 'persistent cough, shortness of breath, chest tightness, wheezing, asthma symptoms, chronic bronchitis, pneumonia, sleep apnea, lung infections, coughing up blood, fatigue from breathing issues, chest pain, COPD, tuberculosis, lung cancer symptoms', 'Pulmonologist', '9714347508', 'dr..devi.prasad.shetty@hospital.com', 'Dr. TMA Pai Hospital', 'Udupi-Manipal Highway\nManipal, Karnataka 576104\nIndia', '08:00-19:00', 'Friday, Thursday, Wednesday, Saturday', '3.2') ,
+    ('6358', 'Dr. Randeep Guleria', 'stomach pain, bloating, heartburn, indigestion, constipation, diarrhea, blood in stool, acid reflux, difficulty swallowing, nausea, vomiting, gas issues, ulcers, liver problems, gallstones', 'Gastroenterologist', '9252490815', 'dr..randeep.guleria@hospital.com', 'Victoria Hospital', 'K.R. Market\nBengaluru, Karnataka 560002\nIndia', '09:00-17:00', 'Sunday, Saturday, Monday, Wednesday, Friday', '4.8') ,
+    ('7990', 'Dr. Padmavati Sivaramakrishna Iyer', 'urinary tract infections, difficulty urinating, blood in urine, kidney stones, incontinence, prostate problems, pain during urination, frequent urination, bladder control issues, male infertility, testicular pain, urinary retention, urinary infections, pelvic pain, erectile dysfunction', 'Urologist', '9778844673', 'dr..padmavati.sivaramakrishna.iyer@hospital.com', 'Vinayaka Hospital', 'Vinoba Nagar\nShivamogga, Karnataka 577204\nIndia', '08:00-17:00', 'Saturday, Friday, Tuesday', '2.2') ,
+    ('4696', 'Dr. Arun Kurian Thomas', 'blurry vision, eye pain, red eyes, dry eyes, watery eyes, sensitivity to light, floaters, double vision, loss of vision, eyelid problems, cataracts, glaucoma, macular degeneration, eye injuries, eye infections', 'Ophthalmologist', '9897554439', 'dr..arun.kurian.thomas@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '10:00-19:00', 'Wednesday, Friday, Monday', '0.4') ,
+    ('9217', 'Dr. A. Velumani', 'joint pain, stiffness, swelling, fatigue, arthritis, lupus, gout, back pain, connective tissue disorders, autoimmune diseases, fibromyalgia, joint inflammation, muscle weakness, chronic pain, swollen fingers or toes', 'Rheumatologist', '9658700091', 'dr..a..velumani@hospital.com', 'BGS Gleneagles Global Hospital', 'Kengeri\nBengaluru, Karnataka 560060\nIndia', '09:00-17:00', 'Saturday, Sunday, Wednesday, Monday, Tuesday', '1.9') ,
+    ('2329', 'Dr. Meena Menon', 'swelling in legs or feet, blood in urine, foamy urine, high blood pressure, kidney stones, fatigue, nausea, frequent urination at night, chronic kidney disease, difficulty concentrating, decreased appetite, back pain near kidneys, electrolyte imbalance, kidney infections, dialysis needs', 'Nephrologist', '9781287222', 'dr..meena.menon@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '10:00-16:00', 'Saturday, Monday, Wednesday, Tuesday, Thursday', '1.0') ,
+    ('2107', 'Dr. Prathap C. Reddy', 'frequent infections, allergic reactions, autoimmune diseases, asthma, eczema, hay fever, hives, immunodeficiency disorders, food allergies, swelling after insect bites, recurrent colds, chronic sinus infections, fatigue from weak immunity, unusual infections, vaccine-related issues', 'Immunologist', '9285050453', 'dr..prathap.c..reddy@hospital.com', 'St. John’s Medical College and Hospital', 'Sarjapur Road\nBengaluru, Karnataka 560034\nIndia', '10:00-19:00', 'Thursday, Wednesday, Monday, Sunday', '4.8') ,
+    ('1460', 'Dr. Randeep Guleria', 'persistent cough, shortness of breath, chest tightness, wheezing, asthma symptoms, chronic bronchitis, pneumonia, sleep apnea, lung infections, coughing up blood, fatigue from breathing issues, chest pain, COPD, tuberculosis, lung cancer symptoms', 'Pulmonologist', '9160076735', 'dr..randeep.guleria@hospital.com', 'Kasturba Medical College and Hospital', 'Tiger Circle Road\nManipal, Karnataka 576104\nIndia', '10:00-19:00', 'Monday, Sunday, Wednesday', '2.2')
+]
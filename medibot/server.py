@@ -0,0 +1,125 @@
+# JSON API over the recommendation engine, for kiosks and other clients that have no use for
+# the Streamlit pages. Only the standard library is used, and nothing heavier than SQLite is
+# loaded until a request needs it (the model SDK only for the first summary).
+#
+#   python -m medibot.server [--host 127.0.0.1] [--port 8080] [--db PATH]
+#
+#   GET  /health            {"status": "ok", "doctors": 200, "catalog_version": 3}
+#   GET  /specializations   ["Anesthesiologist", ...]
+#   GET  /metrics           per-stage timings and response cache counters in the Prometheus
+#                           text format
+#   POST /recommend         {"symptoms": "fever, cough", "day": "Monday", "time": "10:30",
+#                            "location": "560001", "radius_km": 25, "nearest_first": false,
+#                            "limit": 20, "offset": 0, "summary": false}
+#   POST /doctors           {"specialization": "Cardiologist", ...same filters, limit and offset}
+#
+# Bad requests get status 400 and {"error": "..."}; anything that fails while answering gets
+# status 500 and {"error": "internal error"}, with the traceback logged on the server.
+import argparse
+import json
+import traceback
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from medibot.database import DB_PATH
+from medibot.metrics import METRICS
+from medibot.recommender import InvalidRequest, Recommender
+
+# Largest request body accepted, in bytes
+MAX_BODY_BYTES = 64 * 1024
+
+
+class RecommendationHandler(BaseHTTPRequestHandler):
+    server_version = "MediBot/1.0"
+
+    def _send(self, status, payload, content_type="application/json"):
+        body = (payload if isinstance(payload, str) else json.dumps(payload)).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_request(self):
+        length = (self.headers.get("Content-Length") or "0").strip()
+        if not length.isascii() or not length.isdigit():
+            raise InvalidRequest("Content-Length must be a non-negative whole number")
+        length = int(length)
+        if length > MAX_BODY_BYTES:
+            raise InvalidRequest(f"request body is larger than {MAX_BODY_BYTES} bytes")
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise InvalidRequest("request body is not valid JSON") from None
+        if not isinstance(request, dict):
+            raise InvalidRequest("request body is not a JSON object")
+        return request
+
+    # Answer with `handle`, turning a bad request into 400 and any other failure into 500
+    def _answer(self, handle):
+        try:
+            handle()
+        except InvalidRequest as error:
+            self._send(400, {"error": str(error)})
+        except Exception:
+            traceback.print_exc()
+            self._send(500, {"error": "internal error"})
+
+    def do_GET(self):
+        self._answer(self._get)
+
+    def do_POST(self):
+        self._answer(self._post)
+
+    def _get(self):
+        recommender = self.server.recommender
+        if self.path == "/health":
+            catalog = recommender.catalog
+            self._send(200, {"status": "ok", "doctors": len(catalog.doctors), "catalog_version": catalog.version})
+        elif self.path == "/specializations":
+            self._send(200, recommender.specializations())
+        elif self.path == "/metrics":
+            self._send(
+                200, METRICS.prometheus_text() + recommender.cache.prometheus_text(),
+                "text/plain; version=0.0.4; charset=utf-8"
+            )
+        else:
+            self._send(404, {"error": f"no such endpoint: {self.path}"})
+
+    def _post(self):
+        recommender = self.server.recommender
+        routes = {"/recommend": recommender.recommend, "/doctors": recommender.doctors}
+        if self.path not in routes:
+            self._send(404, {"error": f"no such endpoint: {self.path}"})
+            return
+        self._send(200, routes[self.path](self._read_request()))
+
+
+# HTTP server answering from one shared Recommender, a thread per connection
+def make_server(host="127.0.0.1", port=8080, recommender=None):
+    server = ThreadingHTTPServer((host, port), RecommendationHandler)
+    server.daemon_threads = True
+    server.recommender = recommender or Recommender()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve doctor recommendations as JSON over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8080, help="port to listen on")
+    parser.add_argument("--db", default=DB_PATH, help="SQLite database to serve from")
+    args = parser.parse_args(argv)
+
+    server = make_server(args.host, args.port, Recommender(args.db))
+    # Build the catalog before the first request arrives
+    server.recommender.catalog
+    print(f"Serving on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
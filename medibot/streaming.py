@@ -0,0 +1,66 @@
+import statistics
+import threading
+import time
+from collections import deque
+
+# Number of recent responses kept for latency statistics
+LATENCY_LOG_SIZE = 1000
+
+
+# Turns a streamed model response into text chunks for st.write_stream, timing it on the way.
+# `started_at` is the perf_counter() value taken just before the request was sent. on_complete
+# runs only for a response that finished: not when no chunk arrived, nor when the source (a
+# BackgroundStream) stopped at its deadline or on an error.
+class TimedStream:
+    def __init__(self, chunks, started_at, kind, on_complete=None):
+        self.chunks = chunks
+        self.started_at = started_at
+        self.kind = kind
+        self.on_complete = on_complete
+        self.time_to_first_token = None
+        self.total_latency = None
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            if self.time_to_first_token is None:
+                self.time_to_first_token = time.perf_counter() - self.started_at
+            yield chunk.text
+        self.total_latency = time.perf_counter() - self.started_at
+        if self.completed and self.on_complete:
+            self.on_complete(self)
+
+    @property
+    def completed(self):
+        return (
+            self.total_latency is not None and self.time_to_first_token is not None
+            and not getattr(self.chunks, "timed_out", False) and getattr(self.chunks, "error", None) is None
+        )
+
+
+# Time-to-first-token and total latency of recent responses, per kind of request
+class LatencyLog:
+    def __init__(self, size=LATENCY_LOG_SIZE):
+        self._records = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def record(self, stream):
+        with self._lock:
+            self._records.append((stream.kind, stream.time_to_first_token, stream.total_latency))
+
+    # {kind: {"count", "ttft_p50", "total_p50"}} in seconds
+    def summary(self):
+        with self._lock:
+            records = list(self._records)
+        by_kind = {}
+        for kind, ttft, total in records:
+            by_kind.setdefault(kind, ([], []))
+            by_kind[kind][0].append(ttft)
+            by_kind[kind][1].append(total)
+        return {
+            kind: {
+                "count": len(ttfts),
+                "ttft_p50": statistics.median(ttfts),
+                "total_p50": statistics.median(totals),
+            }
+            for kind, (ttfts, totals) in by_kind.items()
+        }
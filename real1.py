@@ -1,308 +1,160 @@
 from dotenv import load_dotenv
 import streamlit as st
 import os
-import sqlite3
+import time
+from collections import deque
+from datetime import datetime
+from itertools import islice
+from zoneinfo import ZoneInfo
 import pandas as pd
-import google.generativeai as genai
 
-# Load environment variables
+# Load environment variables (before importing medibot, which reads its settings on import)
 load_dotenv()
 
-# Configure Gemini Pro API key
-genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
+from medibot import database
+from medibot.catalog import DoctorCatalog
+from medibot.database import DB_PATH, WEEKDAYS
+from medibot.geo import DEFAULT_RADIUS_KM, haversine_km, locate
+from medibot.llm import load_backend
+from medibot.metrics import METRICS
+from medibot.pipeline import LLMWorkerPool
+from medibot.recommender import model_response
+from medibot.response_cache import ResponseCache
+from medibot.search import query_database
+from medibot.streaming import LatencyLog, TimedStream
 
-# Load the Gemini Pro model
-model = genai.GenerativeModel("gemini-pro")
-chat = model.start_chat(history=[])
 
-# Initialize SQLite database for Doctor Recommendation Chatbot
+# Model backend chosen by MEDIBOT_LLM_BACKEND (Gemini Pro unless set to "fake"), created once per process
+@st.cache_resource(show_spinner=False)
+def get_llm_backend():
+    return load_backend()
+
+
+# Runs once per server process; later reruns reuse the cached result instead of touching the database
+@st.cache_resource(show_spinner=False)
 def initialize_database():
-    # Connect to the SQLite database
-    conn = sqlite3.connect("doctor_recommendations.db")
-    cursor = conn.cursor()
-
-    # Drop the existing doctors table if it exists (to avoid schema mismatches)
-    cursor.execute("DROP TABLE IF EXISTS doctors")
-
-    # Recreate the doctors table with the correct columns
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS doctors (
-        doctor_id INTEGER PRIMARY KEY,
-        doctor_identity_number TEXT NOT NULL,
-        doctor_name TEXT NOT NULL,
-        symptom_name TEXT NOT NULL,
-        specialization TEXT NOT NULL,
-        contact TEXT NOT NULL,
-        email TEXT NOT NULL,
-        hospital_name TEXT NOT NULL,
-        hospital_location TEXT NOT NULL,
-        availability TEXT NOT NULL,
-        working_days TEXT NOT NULL,
-        rating TEXT NOT NULL
+    database.initialize_database(DB_PATH)
+
+
+# Columns shown on the specialization page
+SPECIALIZATION_COLUMNS = (
+    "doctor_identity_number", "doctor_name", "symptom_name", "contact", "email",
+    "hospital_name", "hospital_location", "availability", "working_days", "rating"
+)
+
+
+# Built once per server process and shared by every session
+@st.cache_resource(show_spinner=False)
+def load_catalog():
+    return DoctorCatalog.from_database(DB_PATH)
+
+
+# Drop the shared catalog so the next get_catalog() reloads it from the database
+def invalidate_catalog():
+    load_catalog.clear()
+
+
+# Shared catalog, reloaded when the database has changed since it was built
+def get_catalog():
+    catalog = load_catalog()
+    if catalog.is_stale():
+        invalidate_catalog()
+        catalog = load_catalog()
+    return catalog
+
+
+# Doctors' working hours are local to the hospitals, so "now" is taken in this timezone
+TIMEZONE = ZoneInfo(os.getenv("MEDIBOT_TIMEZONE", "Asia/Kolkata"))
+
+
+# Availability controls shared by the search pages. Returns (weekday, minute of the day),
+# either of which may be None to leave that part unfiltered.
+def availability_filter(key):
+    mode = st.radio(
+        "Availability:", ["Any time", "Available now", "Choose a day and time"],
+        horizontal=True, key=f"{key}_availability"
     )
-    ''')
-
-    # Add sample data if the table is empty (preventing duplicates)
-    cursor.execute("SELECT COUNT(*) FROM doctors")
-    if cursor.fetchone()[0] == 0:
-        cursor.executemany('''
-        INSERT INTO doctors (
-            doctor_identity_number, doctor_name, symptom_name, specialization, 
-            contact, email, hospital_name, hospital_location, availability, working_days, rating
-        ) 
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', [
-            ('1017', 'Dr. Shanta V.', 'fractures, internal injuries, tumors, abnormal growths, infections, lung conditions, heart conditions, brain abnormalities, gastrointestinal issues, spinal problems, cancer screening, bone density issues, unexplained pain, swollen organs, imaging needs', 'Radiologist', '9853398615', 'dr..shanta.v.@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '09:00-18:00', 'Wednesday, Thursday, Tuesday, Saturday', '1.6') ,
-('4925', 'Dr. Vandana Shiva', 'mobility issues, memory loss, frequent falls, arthritis, chronic diseases, osteoporosis, frailty, depression in the elderly, hearing problems, visual impairments, medication management, dementia, sleep issues, urinary incontinence, cardiovascular diseases', 'Geriatrician', '9655368054', 'dr..vandana.shiva@hospital.com', 'Shimoga Institute of Medical Sciences', 'Sagar Road\nShivamogga, Karnataka 577201\nIndia', '09:00-19:00', 'Wednesday, Saturday, Friday', '1.2') ,
-('8429', 'Dr. K. K. Aggarwal', 'joint pain, stiffness, swelling, fatigue, arthritis, lupus, gout, back pain, connective tissue disorders, autoimmune diseases, fibromyalgia, joint inflammation, muscle weakness, chronic pain, swollen fingers or toes', 'Rheumatologist', '9972973251', 'dr..k..k..aggarwal@hospital.com', 'Sparsh Hospital', 'Infantry Road\nBengaluru, Karnataka 560001\nIndia', '09:00-17:00', 'Saturday, Friday, Wednesday, Tuesday, Thursday', '4.0') ,
-('1919', 'Dr. V. Mohan', 'severe headaches, brain tumors, dizziness, seizures, memory loss, numbness or tingling, paralysis, tremors, migraines, muscle weakness, speech difficulties, cognitive problems, movement disorders, difficulty walking, stroke symptoms', 'Neurologist', '9802793639', 'dr..v..mohan@hospital.com', 'SDM College of Medical Sciences & Hospital', 'Manjushree Nagar\nDharwad, Karnataka 580009\nIndia', '10:00-18:00', 'Thursday, Tuesday, Wednesday, Friday', '0.2') ,
-('5263', 'Dr. Kavita Patil', 'joint pain, stiffness, swelling, fatigue, arthritis, lupus, gout, back pain, connective tissue disorders, autoimmune diseases, fibromyalgia, joint inflammation, muscle weakness, chronic pain, swollen fingers or toes', 'Rheumatologist', '9677762484', 'dr..kavita.patil@hospital.com', 'KMC Hospital', 'Ambedkar Circle\nMangalore, Karnataka 575001\nIndia', '10:00-17:00', 'Sunday, Thursday, Tuesday, Monday', '3.7') ,
-('3140', 'Dr. Sunita Naik', 'ear pain, hearing loss, nasal congestion, throat pain, sinus infections, balance issues, snoring, voice problems, tonsillitis, tinnitus, allergies, deviated septum, speech difficulties, chronic cough, ear infections', 'ENT Specialist', '9709815461', 'dr..sunita.naik@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '09:00-18:00', 'Wednesday, Saturday, Sunday', '3.4') ,
-('1861', 'Dr. Anjali Kulkarni', 'joint pain, broken bones, arthritis, back pain, sports injuries, sprains, ligament tears, bone deformities, dislocations, scoliosis, knee pain, hip pain, tendon injuries, carpal tunnel syndrome, shoulder stiffness', 'Orthopedic Surgeon', '9983003423', 'dr..anjali.kulkarni@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '09:00-19:00', 'Thursday, Saturday, Sunday, Wednesday, Tuesday', '4.0') ,
-('8023', 'Dr. Anjali Kulkarni', 'mobility issues, memory loss, frequent falls, arthritis, chronic diseases, osteoporosis, frailty, depression in the elderly, hearing problems, visual impairments, medication management, dementia, sleep issues, urinary incontinence, cardiovascular diseases', 'Geriatrician', '9833043645', 'dr..anjali.kulkarni@hospital.com', 'JSS Hospital', 'MG Road\nMysuru, Karnataka 570004\nIndia', '08:00-17:00', 'Thursday, Friday, Saturday, Tuesday, Monday', '4.8') ,
-('1588', 'Dr. Sudhansu Bhattacharyya', 'stomach pain, bloating, heartburn, indigestion, constipation, diarrhea, blood in stool, acid reflux, difficulty swallowing, nausea, vomiting, gas issues, ulcers, liver problems, gallstones', 'Gastroenterologist', '9693616480', 'dr..sudhansu.bhattacharyya@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '09:00-18:00', 'Tuesday, Wednesday, Monday, Saturday, Sunday', '3.1') ,
-('3021', 'Dr. Gagandeep Kang', 'anemia, fatigue, pale skin, easy bruising, excessive bleeding, blood clots, swollen lymph nodes, infections, low platelet count, bone marrow problems, leukemia, sickle cell disease, thalassemia, bleeding disorders, iron deficiency', 'Hematologist', '9874790705', 'dr..gagandeep.kang@hospital.com', 'Vinayaka Hospital', 'Vinoba Nagar\nShivamogga, Karnataka 577204\nIndia', '10:00-17:00', 'Sunday, Saturday, Tuesday', '4.3') ,
-('7357', 'Dr. Shanta V.', 'acne, skin rashes, dry skin, eczema, psoriasis, moles, skin discoloration, warts, hair loss, dandruff, nail problems, skin allergies, skin infections, wrinkles, scars', 'Dermatologist', '9481611082', 'dr..shanta.v.@hospital.com', 'Apollo BGS Hospitals', 'Adichunchanagiri Road\nMysuru, Karnataka 570023\nIndia', '10:00-18:00', 'Wednesday, Sunday, Saturday', '1.6') ,
-('6955', 'Dr. P. Raghuram', 'mobility issues, memory loss, frequent falls, arthritis, chronic diseases, osteoporosis, frailty, depression in the elderly, hearing problems, visual impairments, medication management, dementia, sleep issues, urinary incontinence, cardiovascular diseases', 'Geriatrician', '9306063157', 'dr..p..raghuram@hospital.com', 'Narayana Health City', 'Bommasandra Industrial Area\nBengaluru, Karnataka 560099\nIndia', '09:00-16:00', 'Friday, Monday, Sunday, Saturday, Wednesday', '2.5') ,
-('6699', 'Dr. Swati Piramal', 'irregular periods, pelvic pain, vaginal discharge, urinary infections, infertility, pregnancy care, menopause symptoms, hormonal imbalances, breast lumps, painful periods, endometriosis, PCOS, abnormal bleeding, pelvic infections, sexual health concerns', 'Gynecologist', '9688985704', 'dr..swati.piramal@hospital.com', 'St. John’s Medical College and Hospital', 'Sarjapur Road\nBengaluru, Karnataka 560034\nIndia', '09:00-17:00', 'Sunday, Saturday, Friday', '3.1') ,
-('8767', 'Dr. Mammen Chandy', 'acne, skin rashes, dry skin, eczema, psoriasis, moles, skin discoloration, warts, hair loss, dandruff, nail problems, skin allergies, skin infections, wrinkles, scars', 'Dermatologist', '9163883071', 'dr..mammen.chandy@hospital.com', 'Father Muller Medical College Hospital', 'Kankanady\nMangalore, Karnataka 575002\nIndia', '09:00-18:00', 'Friday, Monday, Tuesday, Sunday, Saturday', '3.5') ,
-('3048', 'Dr. Randeep Guleria', 'disease diagnosis, biopsy analysis, abnormal blood test results, cancer detection, infections, chronic diseases, tissue analysis, organ dysfunction, laboratory testing issues, unexplained symptoms, genetic disorders, disease progression monitoring, infections in organs, rare conditions, tumor evaluation', 'Pathologist', '9898884213', 'dr..randeep.guleria@hospital.com', 'Father Muller Medical College Hospital', 'Kankanady\nMangalore, Karnataka 575002\nIndia', '10:00-16:00', 'Friday, Wednesday, Monday, Sunday, Tuesday', '1.3') ,
-('9632', 'Dr. Prashant Sharma', 'persistent cough, shortness of breath, chest tightness, wheezing, asthma symptoms, chronic bronchitis, pneumonia, sleep apnea, lung infections, coughing up blood, fatigue from breathing issues, chest pain, COPD, tuberculosis, lung cancer symptoms', 'Pulmonologist', '9800696597', 'dr..prashant.sharma@hospital.com', 'KLE Hospital', 'Nehru Nagar\nBelagavi, Karnataka 590010\nIndia', '10:00-16:00', 'Friday, Saturday, Wednesday, Tuesday, Thursday', '2.4') ,
-('5084', 'Dr. Shanta V.', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9729661450', 'dr..shanta.v.@hospital.com', 'SDM College of Medical Sciences & Hospital', 'Manjushree Nagar\nDharwad, Karnataka 580009\nIndia', '08:00-19:00', 'Tuesday, Saturday, Sunday, Wednesday', '4.2') ,
-('7723', 'Dr. Naresh Trehan', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9355557353', 'dr..naresh.trehan@hospital.com', 'BGS Gleneagles Global Hospital', 'Kengeri\nBengaluru, Karnataka 560060\nIndia', '08:00-19:00', 'Monday, Sunday, Tuesday, Friday, Saturday', '3.6') ,
-('8115', 'Dr. Randeep Guleria', 'swelling in legs or feet, blood in urine, foamy urine, high blood pressure, kidney stones, fatigue, nausea, frequent urination at night, chronic kidney disease, difficulty concentrating, decreased appetite, back pain near kidneys, electrolyte imbalance, kidney infections, dialysis needs', 'Nephrologist', '9258615528', 'dr..randeep.guleria@hospital.com', 'Vinayaka Hospital', 'Vinoba Nagar\nShivamogga, Karnataka 577204\nIndia', '10:00-16:00', 'Monday, Wednesday, Friday, Saturday', '1.0') ,
-('8693', 'Dr. Ashok Seth', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9606217711', 'dr..ashok.seth@hospital.com', 'St. John’s Medical College and Hospital', 'Sarjapur Road\nBengaluru, Karnataka 560034\nIndia', '09:00-18:00', 'Friday, Monday, Saturday', '1.2') ,
-('2596', 'Dr. Prashant Sharma', 'fractures, internal injuries, tumors, abnormal growths, infections, lung conditions, heart conditions, brain abnormalities, gastrointestinal issues, spinal problems, cancer screening, bone density issues, unexplained pain, swollen organs, imaging needs', 'Radiologist', '9848084382', 'dr..prashant.sharma@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '09:00-18:00', 'Monday, Wednesday, Saturday, Tuesday, Thursday', '4.4') ,
-('5427', 'Dr. Balamurali Ambati', 'fractures, internal injuries, tumors, abnormal growths, infections, lung conditions, heart conditions, brain abnormalities, gastrointestinal issues, spinal problems, cancer screening, bone density issues, unexplained pain, swollen organs, imaging needs', 'Radiologist', '9932762075', 'dr..balamurali.ambati@hospital.com', 'BGS Gleneagles Global Hospital', 'Kengeri\nBengaluru, Karnataka 560060\nIndia', '09:00-19:00', 'Sunday, Saturday, Monday, Thursday, Tuesday', '0.6') ,
-('6175', 'Dr. B. C. Roy', 'frequent infections, allergic reactions, autoimmune diseases, asthma, eczema, hay fever, hives, immunodeficiency disorders, food allergies, swelling after insect bites, recurrent colds, chronic sinus infections, fatigue from weak immunity, unusual infections, vaccine-related issues', 'Immunologist', '9973478998', 'dr..b..c..roy@hospital.com', 'SDM College of Medical Sciences & Hospital', 'Manjushree Nagar\nDharwad, Karnataka 580009\nIndia', '10:00-18:00', 'Thursday, Friday, Monday, Sunday', '3.4') ,
-('5894', 'Dr. Meena Menon', 'joint pain, stiffness, swelling, fatigue, arthritis, lupus, gout, back pain, connective tissue disorders, autoimmune diseases, fibromyalgia, joint inflammation, muscle weakness, chronic pain, swollen fingers or toes', 'Rheumatologist', '9391465479', 'dr..meena.menon@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '08:00-16:00', 'Friday, Tuesday, Saturday, Thursday', '0.7') ,
-('3690', 'Dr. Sameer Reddy', 'fractures, internal injuries, tumors, abnormal growths, infections, lung conditions, heart conditions, brain abnormalities, gastrointestinal issues, spinal problems, cancer screening, bone density issues, unexplained pain, swollen organs, imaging needs', 'Radiologist', '9607661997', 'dr..sameer.reddy@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '08:00-18:00', 'Thursday, Wednesday, Monday, Tuesday, Saturday', '3.9') ,
-('7044', 'Dr. B. C. Roy', 'severe headaches, brain tumors, dizziness, seizures, memory loss, numbness or tingling, paralysis, tremors, migraines, muscle weakness, speech difficulties, cognitive problems, movement disorders, difficulty walking, stroke symptoms', 'Neurologist', '9958789460', 'dr..b..c..roy@hospital.com', 'Shimoga Institute of Medical Sciences', 'Sagar Road\nShivamogga, Karnataka 577201\nIndia', '09:00-18:00', 'Saturday, Sunday, Tuesday', '2.5') ,
-('3654', 'Dr. Sameer Reddy', 'stomach pain, bloating, heartburn, indigestion, constipation, diarrhea, blood in stool, acid reflux, difficulty swallowing, nausea, vomiting, gas issues, ulcers, liver problems, gallstones', 'Gastroenterologist', '9657909606', 'dr..sameer.reddy@hospital.com', 'Vinayaka Hospital', 'Vinoba Nagar\nShivamogga, Karnataka 577204\nIndia', '10:00-16:00', 'Sunday, Tuesday, Friday', '0.5') ,
-('9565', 'Dr. Gagandeep Kang', 'mobility issues, memory loss, frequent falls, arthritis, chronic diseases, osteoporosis, frailty, depression in the elderly, hearing problems, visual impairments, medication management, dementia, sleep issues, urinary incontinence, cardiovascular diseases', 'Geriatrician', '9447197491', 'dr..gagandeep.kang@hospital.com', 'SDM College of Medical Sciences & Hospital', 'Manjushree Nagar\nDharwad, Karnataka 580009\nIndia', '10:00-16:00', 'Friday, Wednesday, Saturday, Thursday', '2.6') ,
-('9295', 'Dr. Gagandeep Kang', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9737799885', 'dr..gagandeep.kang@hospital.com', 'Sparsh Hospital', 'Infantry Road\nBengaluru, Karnataka 560001\nIndia', '09:00-16:00', 'Wednesday, Monday, Sunday', '0.5') ,
-('8164', 'Dr. Devi Prasad Shetty', 'frequent infections, allergic reactions, autoimmune diseases, asthma, eczema, hay fever, hives, immunodeficiency disorders, food allergies, swelling after insect bites, recurrent colds, chronic sinus infections, fatigue from weak immunity, unusual infections, vaccine-related issues', 'Immunologist', '9878017360', 'dr..devi.prasad.shetty@hospital.com', 'Sparsh Hospital', 'Infantry Road\nBengaluru, Karnataka 560001\nIndia', '10:00-19:00', 'Saturday, Thursday, Monday, Friday, Tuesday', '0.2') ,
-('3613', 'Dr. Mahesh Gowda', 'chest pain, breathlessness, fatigue, irregular heartbeats, high blood pressure, dizziness, fainting, chest tightness, heart failure, swollen ankles or feet, palpitations, heart attack symptoms, angina, heart murmurs, hypertension', 'Cardiologist', '9910453520', 'dr..mahesh.gowda@hospital.com', 'SDM College of Medical Sciences & Hospital', 'Manjushree Nagar\nDharwad, Karnataka 580009\nIndia', '09:00-17:00', 'Sunday, Wednesday, Monday, Friday', '2.6') ,
-('1685', 'Dr. Prathap C. Reddy', 'stomach pain, bloating, heartburn, indigestion, constipation, diarrhea, blood in stool, acid reflux, difficulty swallowing, nausea, vomiting, gas issues, ulcers, liver problems, gallstones', 'Gastroenterologist', '9986720356', 'dr..prathap.c..reddy@hospital.com', 'Vinayaka Hospital', 'Vinoba Nagar\nShivamogga, Karnataka 577204\nIndia', '09:00-16:00', 'Monday, Sunday, Thursday, Wednesday, Friday', '3.8') ,
-('9840', 'Dr. Swati Piramal', 'fractures, internal injuries, tumors, abnormal growths, infections, lung conditions, heart conditions, brain abnormalities, gastrointestinal issues, spinal problems, cancer screening, bone density issues, unexplained pain, swollen organs, imaging needs', 'Radiologist', '9855652939', 'dr..swati.piramal@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '10:00-16:00', 'Saturday, Sunday, Monday, Wednesday', '1.3') ,
-('7965', 'Dr. Ravi Kumar', 'stomach pain, bloating, heartburn, indigestion, constipation, diarrhea, blood in stool, acid reflux, difficulty swallowing, nausea, vomiting, gas issues, ulcers, liver problems, gallstones', 'Gastroenterologist', '9256948222', 'dr..ravi.kumar@hospital.com', 'Kasturba Medical College and Hospital', 'Tiger Circle Road\nManipal, Karnataka 576104\nIndia', '09:00-16:00', 'Saturday, Tuesday, Friday, Wednesday', '1.1') ,
-('5513', 'Dr. Anjali Kulkarni', 'persistent cough, shortness of breath, chest tightness, wheezing, asthma symptoms, chronic bronchitis, pneumonia, sleep apnea, lung infections, coughing up blood, fatigue from breathing issues, chest pain, COPD, tuberculosis, lung cancer symptoms', 'Pulmonologist', '9354527503', 'dr..anjali.kulkarni@hospital.com', 'Vinayaka Hospital', 'Vinoba Nagar\nShivamogga, Karnataka 577204\nIndia', '10:00-16:00', 'Sunday, Saturday, Friday, Wednesday, Monday', '4.7') ,
-('3598', 'Dr. Mahesh Gowda', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9591608558', 'dr..mahesh.gowda@hospital.com', 'BGS Gleneagles Global Hospital', 'Kengeri\nBengaluru, Karnataka 560060\nIndia', '09:00-18:00', 'Wednesday, Friday, Thursday, Monday', '1.3') ,
-('5655', 'Dr. V. Mohan', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9695189880', 'dr..v..mohan@hospital.com', 'KMC Hospital', 'Ambedkar Circle\nMangalore, Karnataka 575001\nIndia', '08:00-19:00', 'Sunday, Thursday, Monday', '0.2') ,
-('7312', 'Dr. S. K. Sarin', 'joint pain, stiffness, swelling, fatigue, arthritis, lupus, gout, back pain, connective tissue disorders, autoimmune diseases, fibromyalgia, joint inflammation, muscle weakness, chronic pain, swollen fingers or toes', 'Rheumatologist', '9982715560', 'dr..s..k..sarin@hospital.com', 'KMC Hospital', 'Ambedkar Circle\nMangalore, Karnataka 575001\nIndia', '09:00-18:00', 'Tuesday, Thursday, Monday, Wednesday, Friday', '2.1') ,
-('3149', 'Dr. Devi Prasad Shetty', 'acne, skin rashes, dry skin, eczema, psoriasis, moles, skin discoloration, warts, hair loss, dandruff, nail problems, skin allergies, skin infections, wrinkles, scars', 'Dermatologist', '9864356254', 'dr..devi.prasad.shetty@hospital.com', 'Kasturba Medical College and Hospital', 'Tiger Circle Road\nManipal, Karnataka 576104\nIndia', '10:00-16:00', 'Thursday, Monday, Wednesday', '0.8') ,
-('2393', 'Dr. Meena Menon', 'disease diagnosis, biopsy analysis, abnormal blood test results, cancer detection, infections, chronic diseases, tissue analysis, organ dysfunction, laboratory testing issues, unexplained symptoms, genetic disorders, disease progression monitoring, infections in organs, rare conditions, tumor evaluation', 'Pathologist', '9619852342', 'dr..meena.menon@hospital.com', 'Vinayaka Hospital', 'Vinoba Nagar\nShivamogga, Karnataka 577204\nIndia', '08:00-17:00', 'Monday, Saturday, Wednesday, Thursday, Sunday', '2.4') ,
-('4396', 'Dr. Mahesh Gowda', 'fever, body aches, colds, cough, flu, stomach pain, headaches, fatigue, minor injuries, allergies, infections, high blood pressure, diabetes symptoms, general weakness, preventive health care', 'General Physician', '9469240430', 'dr..mahesh.gowda@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '09:00-18:00', 'Tuesday, Sunday, Thursday', '4.7') ,
-('4697', 'Dr. Prathap C. Reddy', 'joint pain, stiffness, swelling, fatigue, arthritis, lupus, gout, back pain, connective tissue disorders, autoimmune diseases, fibromyalgia, joint inflammation, muscle weakness, chronic pain, swollen fingers or toes', 'Rheumatologist', '9548090742', 'dr..prathap.c..reddy@hospital.com', 'BGS Gleneagles Global Hospital', 'Kengeri\nBengaluru, Karnataka 560060\nIndia', '09:00-16:00', 'Tuesday, Wednesday, Friday, Sunday', '4.5') ,
-('9674', 'Dr. K. K. Aggarwal', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9519323272', 'dr..k..k..aggarwal@hospital.com', 'Narayana Health City', 'Bommasandra Industrial Area\nBengaluru, Karnataka 560099\nIndia', '09:00-17:00', 'Wednesday, Saturday, Friday, Sunday, Tuesday', '4.6') ,
-('5926', 'Dr. A. Velumani', 'scars, burns, deformities, nose reshaping, breast reconstruction, facial reconstruction, cleft lip or palate, cosmetic issues, skin grafting, excess skin removal, liposuction, wrinkles, hand injuries, ear reshaping, facial asymmetry', 'Plastic Surgeon', '9218900855', 'dr..a..velumani@hospital.com', 'Kasturba Medical College and Hospital', 'Tiger Circle Road\nManipal, Karnataka 576104\nIndia', '10:00-18:00', 'Saturday, Sunday, Friday, Monday, Wednesday', '1.4') ,
-('7814', 'Dr. Ashok Seth', 'chest pain, breathlessness, fatigue, irregular heartbeats, high blood pressure, dizziness, fainting, chest tightness, heart failure, swollen ankles or feet, palpitations, heart attack symptoms, angina, heart murmurs, hypertension', 'Cardiologist', '9306590286', 'dr..ashok.seth@hospital.com', 'St. John’s Medical College and Hospital', 'Sarjapur Road\nBengaluru, Karnataka 560034\nIndia', '08:00-18:00', 'Monday, Sunday, Tuesday, Wednesday', '4.2') ,
-('1832', 'Dr. Kavita Patil', 'disease diagnosis, biopsy analysis, abnormal blood test results, cancer detection, infections, chronic diseases, tissue analysis, organ dysfunction, laboratory testing issues, unexplained symptoms, genetic disorders, disease progression monitoring, infections in organs, rare conditions, tumor evaluation', 'Pathologist', '9395782278', 'dr..kavita.patil@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '10:00-17:00', 'Friday, Monday, Saturday, Sunday', '3.9') ,
-('9045', 'Dr. Randeep Guleria', 'fever in children, ear infections, cough, colds, flu, developmental delays, skin rashes, stomach pain, vomiting, diarrhea, asthma symptoms, behavioral issues, vaccination needs, growth concerns, allergies in children', 'Pediatrician', '9707315427', 'dr..randeep.guleria@hospital.com', 'Kasturba Medical College and Hospital', 'Tiger Circle Road\nManipal, Karnataka 576104\nIndia', '10:00-18:00', 'Saturday, Sunday, Friday, Tuesday, Monday', '0.6') ,
-('5229', 'Dr. Balamurali Ambati', 'chest pain, breathlessness, fatigue, irregular heartbeats, high blood pressure, dizziness, fainting, chest tightness, heart failure, swollen ankles or feet, palpitations, heart attack symptoms, angina, heart murmurs, hypertension', 'Cardiologist', '9739823624', 'dr..balamurali.ambati@hospital.com', 'Father Muller Medical College Hospital', 'Kankanady\nMangalore, Karnataka 575002\nIndia', '08:00-17:00', 'Saturday, Wednesday, Friday', '1.9') ,
-('9171', 'Dr. Arjun Rao', 'scars, burns, deformities, nose reshaping, breast reconstruction, facial reconstruction, cleft lip or palate, cosmetic issues, skin grafting, excess skin removal, liposuction, wrinkles, hand injuries, ear reshaping, facial asymmetry', 'Plastic Surgeon', '9979701093', 'dr..arjun.rao@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '09:00-16:00', 'Saturday, Sunday, Friday, Thursday, Monday', '2.7') ,
-('2435', 'Dr. B. C. Roy', 'irregular periods, pelvic pain, vaginal discharge, urinary infections, infertility, pregnancy care, menopause symptoms, hormonal imbalances, breast lumps, painful periods, endometriosis, PCOS, abnormal bleeding, pelvic infections, sexual health concerns', 'Gynecologist', '9475322318', 'dr..b..c..roy@hospital.com', 'Sparsh Hospital', 'Infantry Road\nBengaluru, Karnataka 560001\nIndia', '10:00-17:00', 'Monday, Friday, Saturday', '0.4') ,
-('3492', 'Dr. Gagandeep Kang', 'stomach pain, bloating, heartburn, indigestion, constipation, diarrhea, blood in stool, acid reflux, difficulty swallowing, nausea, vomiting, gas issues, ulcers, liver problems, gallstones', 'Gastroenterologist', '9843770533', 'dr..gagandeep.kang@hospital.com', 'Narayana Health City', 'Bommasandra Industrial Area\nBengaluru, Karnataka 560099\nIndia', '09:00-17:00', 'Thursday, Friday, Saturday, Wednesday', '0.2') ,
-('9396', 'Dr. Kavita Patil', 'fever in children, ear infections, cough, colds, flu, developmental delays, skin rashes, stomach pain, vomiting, diarrhea, asthma symptoms, behavioral issues, vaccination needs, growth concerns, allergies in children', 'Pediatrician', '9287922783', 'dr..kavita.patil@hospital.com', 'Apollo BGS Hospitals', 'Adichunchanagiri Road\nMysuru, Karnataka 570023\nIndia', '08:00-18:00', 'Monday, Friday, Tuesday', '3.1') ,
-('4203', 'Dr. Kavita Patil', 'chest pain, breathlessness, fatigue, irregular heartbeats, high blood pressure, dizziness, fainting, chest tightness, heart failure, swollen ankles or feet, palpitations, heart attack symptoms, angina, heart murmurs, hypertension', 'Cardiologist', '9301849274', 'dr..kavita.patil@hospital.com', 'JSS Hospital', 'MG Road\nMysuru, Karnataka 570004\nIndia', '08:00-18:00', 'Saturday, Monday, Wednesday', '0.9') ,
-('3958', 'Dr. Sunita Naik', 'severe headaches, brain tumors, dizziness, seizures, memory loss, numbness or tingling, paralysis, tremors, migraines, muscle weakness, speech difficulties, cognitive problems, movement disorders, difficulty walking, stroke symptoms', 'Neurologist', '9301030819', 'dr..sunita.naik@hospital.com', 'KLE Hospital', 'Nehru Nagar\nBelagavi, Karnataka 590010\nIndia', '10:00-19:00', 'Sunday, Tuesday, Monday', '2.7') ,
-('3079', 'Dr. Prashant Sharma', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9397102826', 'dr..prashant.sharma@hospital.com', 'Manipal Hospital', 'HAL Old Airport Road\nBengaluru, Karnataka 560017\nIndia', '08:00-17:00', 'Saturday, Friday, Tuesday, Monday', '3.4') ,
-('7782', 'Dr. Naresh Trehan', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9777527597', 'dr..naresh.trehan@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '10:00-16:00', 'Tuesday, Sunday, Friday', '2.6') ,
-('8101', 'Dr. Meena Menon', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9575474945', 'dr..meena.menon@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '09:00-19:00', 'Wednesday, Thursday, Tuesday, Sunday', '4.0') ,
-('9808', 'Dr. Swati Piramal', 'acne, skin rashes, dry skin, eczema, psoriasis, moles, skin discoloration, warts, hair loss, dandruff, nail problems, skin allergies, skin infections, wrinkles, scars', 'Dermatologist', '9871438657', 'dr..swati.piramal@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '10:00-17:00', 'Wednesday, Tuesday, Saturday', '4.2') ,
-('8167', 'Dr. Shanta V.', 'disease diagnosis, biopsy analysis, abnormal blood test results, cancer detection, infections, chronic diseases, tissue analysis, organ dysfunction, laboratory testing issues, unexplained symptoms, genetic disorders, disease progression monitoring, infections in organs, rare conditions, tumor evaluation', 'Pathologist', '9732904847', 'dr..shanta.v.@hospital.com', 'Apollo BGS Hospitals', 'Adichunchanagiri Road\nMysuru, Karnataka 570023\nIndia', '10:00-17:00', 'Saturday, Thursday, Tuesday, Monday', '2.7') ,
-('1501', 'Dr. Meena Menon', 'stomach pain, bloating, heartburn, indigestion, constipation, diarrhea, blood in stool, acid reflux, difficulty swallowing, nausea, vomiting, gas issues, ulcers, liver problems, gallstones', 'Gastroenterologist', '9406223908', 'dr..meena.menon@hospital.com', 'Sparsh Hospital', 'Infantry Road\nBengaluru, Karnataka 560001\nIndia', '08:00-17:00', 'Tuesday, Monday, Saturday', '2.0') ,
-('3561', 'Dr. Shalini Desai', 'joint pain, stiffness, swelling, fatigue, arthritis, lupus, gout, back pain, connective tissue disorders, autoimmune diseases, fibromyalgia, joint inflammation, muscle weakness, chronic pain, swollen fingers or toes', 'Rheumatologist', '9829766608', 'dr..shalini.desai@hospital.com', 'S. S. Institute of Medical Sciences', 'NH-4 Bypass\nDavangere, Karnataka 577005\nIndia', '10:00-19:00', 'Thursday, Wednesday, Monday', '3.1') ,
-('1904', 'Dr. Balamurali Ambati', 'blurry vision, eye pain, red eyes, dry eyes, watery eyes, sensitivity to light, floaters, double vision, loss of vision, eyelid problems, cataracts, glaucoma, macular degeneration, eye injuries, eye infections', 'Ophthalmologist', '9339710477', 'dr..balamurali.ambati@hospital.com', 'Victoria Hospital', 'K.R. Market\nBengaluru, Karnataka 560002\nIndia', '09:00-16:00', 'Wednesday, Sunday, Friday, Monday, Tuesday', '1.3') ,
-('2297', 'Dr. Sunita Naik', 'joint pain, broken bones, arthritis, back pain, sports injuries, sprains, ligament tears, bone deformities, dislocations, scoliosis, knee pain, hip pain, tendon injuries, carpal tunnel syndrome, shoulder stiffness', 'Orthopedic Surgeon', '9443391445', 'dr..sunita.naik@hospital.com', 'SDM College of Medical Sciences & Hospital', 'Manjushree Nagar\nDharwad, Karnataka 580009\nIndia', '10:00-16:00', 'Thursday, Tuesday, Friday, Saturday, Monday', '3.1') ,
-('9285', 'Dr. B. C. Roy', 'fever, body aches, colds, cough, flu, stomach pain, headaches, fatigue, minor injuries, allergies, infections, high blood pressure, diabetes symptoms, general weakness, preventive health care', 'General Physician', '9716058263', 'dr..b..c..roy@hospital.com', 'Victoria Hospital', 'K.R. Market\nBengaluru, Karnataka 560002\nIndia', '10:00-16:00', 'Saturday, Monday, Sunday', '0.6') ,
-('9646', 'Dr. Prathap C. Reddy', 'swelling in legs or feet, blood in urine, foamy urine, high blood pressure, kidney stones, fatigue, nausea, frequent urination at night, chronic kidney disease, difficulty concentrating, decreased appetite, back pain near kidneys, electrolyte imbalance, kidney infections, dialysis needs', 'Nephrologist', '9785950576', 'dr..prathap.c..reddy@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '09:00-18:00', 'Saturday, Sunday, Friday', '3.8') ,
-('8820', 'Dr. Shalini Desai', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9559661312', 'dr..shalini.desai@hospital.com', 'St. John’s Medical College and Hospital', 'Sarjapur Road\nBengaluru, Karnataka 560034\nIndia', '09:00-18:00', 'Saturday, Wednesday, Sunday, Friday', '4.9') ,
-('2555', 'Dr. Shanta V.', 'irregular periods, pelvic pain, vaginal discharge, urinary infections, infertility, pregnancy care, menopause symptoms, hormonal imbalances, breast lumps, painful periods, endometriosis, PCOS, abnormal bleeding, pelvic infections, sexual health concerns', 'Gynecologist', '9850627535', 'dr..shanta.v.@hospital.com', 'S. S. Institute of Medical Sciences', 'NH-4 Bypass\nDavangere, Karnataka 577005\nIndia', '09:00-18:00', 'Friday, Sunday, Saturday', '2.0') ,
-('6950', 'Dr. Vikas Iyer', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9956679525', 'dr..vikas.iyer@hospital.com', 'KMC Hospital', 'Ambedkar Circle\nMangalore, Karnataka 575001\nIndia', '08:00-17:00', 'Saturday, Thursday, Friday, Sunday, Monday', '2.3') ,
-('4493', 'Dr. Anjali Kulkarni', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9810870623', 'dr..anjali.kulkarni@hospital.com', 'Father Muller Medical College Hospital', 'Kankanady\nMangalore, Karnataka 575002\nIndia', '08:00-16:00', 'Wednesday, Friday, Tuesday, Saturday', '1.1') ,
-('7565', 'Dr. Sudhansu Bhattacharyya', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9883578106', 'dr..sudhansu.bhattacharyya@hospital.com', 'Manipal Hospital', 'HAL Old Airport Road\nBengaluru, Karnataka 560017\nIndia', '08:00-16:00', 'Monday, Tuesday, Thursday, Wednesday, Friday', '3.2') ,
-('8820', 'Dr. Sunita Naik', 'ear pain, hearing loss, nasal congestion, throat pain, sinus infections, balance issues, snoring, voice problems, tonsillitis, tinnitus, allergies, deviated septum, speech difficulties, chronic cough, ear infections', 'ENT Specialist', '9779696836', 'dr..sunita.naik@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '08:00-17:00', 'Monday, Friday, Wednesday', '2.7') ,
-('8230', 'Dr. Priya Shetty', 'chest pain, breathlessness, fatigue, irregular heartbeats, high blood pressure, dizziness, fainting, chest tightness, heart failure, swollen ankles or feet, palpitations, heart attack symptoms, angina, heart murmurs, hypertension', 'Cardiologist', '9577106040', 'dr..priya.shetty@hospital.com', 'KMC Hospital', 'Ambedkar Circle\nMangalore, Karnataka 575001\nIndia', '08:00-19:00', 'Saturday, Sunday, Tuesday, Monday, Thursday', '2.6') ,
-('9723', 'Dr. Balamurali Ambati', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9311203216', 'dr..balamurali.ambati@hospital.com', 'Victoria Hospital', 'K.R. Market\nBengaluru, Karnataka 560002\nIndia', '10:00-17:00', 'Tuesday, Thursday, Wednesday', '1.2') ,
-('5990', 'Dr. P. Raghuram', 'scars, burns, deformities, nose reshaping, breast reconstruction, facial reconstruction, cleft lip or palate, cosmetic issues, skin grafting, excess skin removal, liposuction, wrinkles, hand injuries, ear reshaping, facial asymmetry', 'Plastic Surgeon', '9496585880', 'dr..p..raghuram@hospital.com', 'Shimoga Institute of Medical Sciences', 'Sagar Road\nShivamogga, Karnataka 577201\nIndia', '09:00-17:00', 'Wednesday, Saturday, Friday, Monday', '1.3') ,
-('8798', 'Dr. Sudhansu Bhattacharyya', 'severe headaches, brain tumors, dizziness, seizures, memory loss, numbness or tingling, paralysis, tremors, migraines, muscle weakness, speech difficulties, cognitive problems, movement disorders, difficulty walking, stroke symptoms', 'Neurologist', '9334436634', 'dr..sudhansu.bhattacharyya@hospital.com', 'St. John’s Medical College and Hospital', 'Sarjapur Road\nBengaluru, Karnataka 560034\nIndia', '09:00-17:00', 'Friday, Saturday, Monday, Thursday, Sunday', '3.4') ,
-('9195', 'Dr. Anjali Kulkarni', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9347865551', 'dr..anjali.kulkarni@hospital.com', 'SDM College of Medical Sciences & Hospital', 'Manjushree Nagar\nDharwad, Karnataka 580009\nIndia', '09:00-16:00', 'Tuesday, Sunday, Saturday, Friday', '1.5') ,
-('5113', 'Dr. Randeep Guleria', 'toothache, gum bleeding, cavities, bad breath, sensitivity to hot or cold, oral infections, jaw pain, wisdom teeth issues, teeth cleaning, braces, mouth ulcers, dry mouth, broken teeth, missing teeth, tooth decay', 'Dentist', '9664584524', 'dr..randeep.guleria@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '10:00-17:00', 'Tuesday, Monday, Friday', '1.5') ,
-('9398', 'Dr. Padmavati Sivaramakrishna Iyer', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9944887165', 'dr..padmavati.sivaramakrishna.iyer@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '10:00-16:00', 'Monday, Saturday, Wednesday, Tuesday', '1.1') ,
-('3716', 'Dr. Mammen Chandy', 'mobility issues, memory loss, frequent falls, arthritis, chronic diseases, osteoporosis, frailty, depression in the elderly, hearing problems, visual impairments, medication management, dementia, sleep issues, urinary incontinence, cardiovascular diseases', 'Geriatrician', '9871221793', 'dr..mammen.chandy@hospital.com', 'Kasturba Medical College and Hospital', 'Tiger Circle Road\nManipal, Karnataka 576104\nIndia', '10:00-16:00', 'Monday, Saturday, Tuesday, Wednesday, Sunday', '2.2') ,
-('7347', 'Dr. S. K. Sarin', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9392724660', 'dr..s..k..sarin@hospital.com', 'Sparsh Hospital', 'Infantry Road\nBengaluru, Karnataka 560001\nIndia', '08:00-19:00', 'Tuesday, Monday, Thursday, Sunday, Friday', '4.0') ,
-('3469', 'Dr. Kavita Patil', 'swelling in legs or feet, blood in urine, foamy urine, high blood pressure, kidney stones, fatigue, nausea, frequent urination at night, chronic kidney disease, difficulty concentrating, decreased appetite, back pain near kidneys, electrolyte imbalance, kidney infections, dialysis needs', 'Nephrologist', '9362845502', 'dr..kavita.patil@hospital.com', 'Kasturba Medical College and Hospital', 'Tiger Circle Road\nManipal, Karnataka 576104\nIndia', '08:00-16:00', 'Friday, Thursday, Tuesday, Saturday', '4.2') ,
-('5551', 'Dr. Ashok Seth', 'disease diagnosis, biopsy analysis, abnormal blood test results, cancer detection, infections, chronic diseases, tissue analysis, organ dysfunction, laboratory testing issues, unexplained symptoms, genetic disorders, disease progression monitoring, infections in organs, rare conditions, tumor evaluation', 'Pathologist', '9750428249', 'dr..ashok.seth@hospital.com', 'Father Muller Medical College Hospital', 'Kankanady\nMangalore, Karnataka 575002\nIndia', '10:00-16:00', 'Monday, Friday, Sunday, Saturday', '3.8') ,
-('7986', 'Dr. K. K. Aggarwal', 'scars, burns, deformities, nose reshaping, breast reconstruction, facial reconstruction, cleft lip or palate, cosmetic issues, skin grafting, excess skin removal, liposuction, wrinkles, hand injuries, ear reshaping, facial asymmetry', 'Plastic Surgeon', '9580755514', 'dr..k..k..aggarwal@hospital.com', 'KLE Hospital', 'Nehru Nagar\nBelagavi, Karnataka 590010\nIndia', '09:00-17:00', 'Friday, Sunday, Monday', '3.9') ,
-('8089', 'Dr. Arjun Rao', 'pain management needs, pre-surgery assessments, post-surgery recovery, chronic pain issues, numbness for surgery, sedation, monitoring during operations, spinal anesthesia, epidurals, critical care, pain relief during labor, nerve blocks, emergency pain relief, breathing support, anesthesia for dental procedures', 'Anesthesiologist', '9249180386', 'dr..arjun.rao@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '09:00-18:00', 'Friday, Monday, Sunday', '0.9') ,
-('7705', 'Dr. V. Mohan', 'anemia, fatigue, pale skin, easy bruising, excessive bleeding, blood clots, swollen lymph nodes, infections, low platelet count, bone marrow problems, leukemia, sickle cell disease, thalassemia, bleeding disorders, iron deficiency', 'Hematologist', '9288459527', 'dr..v..mohan@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '08:00-19:00', 'Friday, Saturday, Thursday', '3.7') ,
-('4122', 'Dr. Padmavati Sivaramakrishna Iyer', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9989204331', 'dr..padmavati.sivaramakrishna.iyer@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '08:00-17:00', 'Wednesday, Friday, Sunday', '5.0') ,
-('1293', 'Dr. S. K. Sarin', 'persistent cough, shortness of breath, chest tightness, wheezing, asthma symptoms, chronic bronchitis, pneumonia, sleep apnea, lung infections, coughing up blood, fatigue from breathing issues, chest pain, COPD, tuberculosis, lung cancer symptoms', 'Pulmonologist', '9634346050', 'dr..s..k..sarin@hospital.com', 'Apollo BGS Hospitals', 'Adichunchanagiri Road\nMysuru, Karnataka 570023\nIndia', '10:00-18:00', 'Thursday, Friday, Monday, Wednesday', '4.1') ,
-('3793', 'Dr. Balamurali Ambati', 'acne, skin rashes, dry skin, eczema, psoriasis, moles, skin discoloration, warts, hair loss, dandruff, nail problems, skin allergies, skin infections, wrinkles, scars', 'Dermatologist', '9390430016', 'dr..balamurali.ambati@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '09:00-19:00', 'Sunday, Saturday, Monday, Wednesday, Thursday', '0.2') ,
-('3209', 'Dr. Vikas Iyer', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9806374949', 'dr..vikas.iyer@hospital.com', 'Father Muller Medical College Hospital', 'Kankanady\nMangalore, Karnataka 575002\nIndia', '10:00-18:00', 'Wednesday, Tuesday, Saturday, Thursday', '0.5') ,
-('6209', 'Dr. Kavita Patil', 'acne, skin rashes, dry skin, eczema, psoriasis, moles, skin discoloration, warts, hair loss, dandruff, nail problems, skin allergies, skin infections, wrinkles, scars', 'Dermatologist', '9682319453', 'dr..kavita.patil@hospital.com', 'Victoria Hospital', 'K.R. Market\nBengaluru, Karnataka 560002\nIndia', '08:00-16:00', 'Thursday, Saturday, Monday, Friday', '1.0') ,
-('9175', 'Dr. Prashant Sharma', 'anemia, fatigue, pale skin, easy bruising, excessive bleeding, blood clots, swollen lymph nodes, infections, low platelet count, bone marrow problems, leukemia, sickle cell disease, thalassemia, bleeding disorders, iron deficiency', 'Hematologist', '9304102743', 'dr..prashant.sharma@hospital.com', 'Narayana Health City', 'Bommasandra Industrial Area\nBengaluru, Karnataka 560099\nIndia', '08:00-17:00', 'Thursday, Tuesday, Wednesday, Friday', '0.7') ,
-('6076', 'Dr. Vikas Iyer', 'chest pain, breathlessness, fatigue, irregular heartbeats, high blood pressure, dizziness, fainting, chest tightness, heart failure, swollen ankles or feet, palpitations, heart attack symptoms, angina, heart murmurs, hypertension', 'Cardiologist', '9552276500', 'dr..vikas.iyer@hospital.com', 'KLE Hospital', 'Nehru Nagar\nBelagavi, Karnataka 590010\nIndia', '08:00-17:00', 'Monday, Friday, Saturday, Thursday, Wednesday', '4.2') ,
-('6108', 'Dr. Mammen Chandy', 'pain management needs, pre-surgery assessments, post-surgery recovery, chronic pain issues, numbness for surgery, sedation, monitoring during operations, spinal anesthesia, epidurals, critical care, pain relief during labor, nerve blocks, emergency pain relief, breathing support, anesthesia for dental procedures', 'Anesthesiologist', '9689430332', 'dr..mammen.chandy@hospital.com', 'St. John’s Medical College and Hospital', 'Sarjapur Road\nBengaluru, Karnataka 560034\nIndia', '10:00-16:00', 'Saturday, Friday, Thursday, Wednesday, Tuesday', '0.4') ,
-('5147', 'Dr. A. Velumani', 'scars, burns, deformities, nose reshaping, breast reconstruction, facial reconstruction, cleft lip or palate, cosmetic issues, skin grafting, excess skin removal, liposuction, wrinkles, hand injuries, ear reshaping, facial asymmetry', 'Plastic Surgeon', '9416161252', 'dr..a..velumani@hospital.com', 'St. John’s Medical College and Hospital', 'Sarjapur Road\nBengaluru, Karnataka 560034\nIndia', '09:00-19:00', 'Tuesday, Wednesday, Sunday, Monday', '3.4') ,
-('8298', 'Dr. Devi Prasad Shetty', 'stomach pain, bloating, heartburn, indigestion, constipation, diarrhea, blood in stool, acid reflux, difficulty swallowing, nausea, vomiting, gas issues, ulcers, liver problems, gallstones', 'Gastroenterologist', '9708267417', 'dr..devi.prasad.shetty@hospital.com', 'KMC Hospital', 'Ambedkar Circle\nMangalore, Karnataka 575001\nIndia', '08:00-18:00', 'Tuesday, Friday, Monday, Wednesday, Sunday', '0.7') ,
-('3972', 'Dr. P. Raghuram', 'stomach pain, bloating, heartburn, indigestion, constipation, diarrhea, blood in stool, acid reflux, difficulty swallowing, nausea, vomiting, gas issues, ulcers, liver problems, gallstones', 'Gastroenterologist', '9247771320', 'dr..p..raghuram@hospital.com', 'SDM College of Medical Sciences & Hospital', 'Manjushree Nagar\nDharwad, Karnataka 580009\nIndia', '10:00-19:00', 'Friday, Thursday, Monday', '4.0') ,
-('6188', 'Dr. Mammen Chandy', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9239857797', 'dr..mammen.chandy@hospital.com', 'Shimoga Institute of Medical Sciences', 'Sagar Road\nShivamogga, Karnataka 577201\nIndia', '08:00-16:00', 'Sunday, Thursday, Saturday, Wednesday', '2.2') ,
-('1957', 'Dr. Priya Shetty', 'chest pain, breathlessness, fatigue, irregular heartbeats, high blood pressure, dizziness, fainting, chest tightness, heart failure, swollen ankles or feet, palpitations, heart attack symptoms, angina, heart murmurs, hypertension', 'Cardiologist', '9100742578', 'dr..priya.shetty@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '08:00-18:00', 'Thursday, Monday, Tuesday, Saturday', '3.9') ,
-('4493', 'Dr. Arjun Rao', 'anemia, fatigue, pale skin, easy bruising, excessive bleeding, blood clots, swollen lymph nodes, infections, low platelet count, bone marrow problems, leukemia, sickle cell disease, thalassemia, bleeding disorders, iron deficiency', 'Hematologist', '9793965467', 'dr..arjun.rao@hospital.com', 'Manipal Hospital', 'HAL Old Airport Road\nBengaluru, Karnataka 560017\nIndia', '10:00-16:00', 'Thursday, Tuesday, Saturday, Wednesday', '3.5') ,
-('3889', 'Dr. Prathap C. Reddy', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9411922157', 'dr..prathap.c..reddy@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '09:00-19:00', 'Wednesday, Saturday, Thursday, Friday, Monday', '4.9') ,
-('3671', 'Dr. Sameer Reddy', 'disease diagnosis, biopsy analysis, abnormal blood test results, cancer detection, infections, chronic diseases, tissue analysis, organ dysfunction, laboratory testing issues, unexplained symptoms, genetic disorders, disease progression monitoring, infections in organs, rare conditions, tumor evaluation', 'Pathologist', '9145618247', 'dr..sameer.reddy@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '09:00-19:00', 'Monday, Sunday, Friday, Saturday, Tuesday', '4.9') ,
-('7536', 'Dr. A. Velumani', 'fever, body aches, colds, cough, flu, stomach pain, headaches, fatigue, minor injuries, allergies, infections, high blood pressure, diabetes symptoms, general weakness, preventive health care', 'General Physician', '9500980314', 'dr..a..velumani@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '08:00-18:00', 'Wednesday, Thursday, Saturday, Sunday, Tuesday', '3.6') ,
-('8634', 'Dr. Vandana Shiva', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9681521939', 'dr..vandana.shiva@hospital.com', 'Manipal Hospital', 'HAL Old Airport Road\nBengaluru, Karnataka 560017\nIndia', '09:00-17:00', 'Saturday, Wednesday, Thursday', '2.9') ,
-('1616', 'Dr. Mammen Chandy', 'fractures, internal injuries, tumors, abnormal growths, infections, lung conditions, heart conditions, brain abnormalities, gastrointestinal issues, spinal problems, cancer screening, bone density issues, unexplained pain, swollen organs, imaging needs', 'Radiologist', '9612000974', 'dr..mammen.chandy@hospital.com', 'Victoria Hospital', 'K.R. Market\nBengaluru, Karnataka 560002\nIndia', '10:00-17:00', 'Saturday, Sunday, Thursday', '0.9') ,
-('2052', 'Dr. Mammen Chandy', 'pain management needs, pre-surgery assessments, post-surgery recovery, chronic pain issues, numbness for surgery, sedation, monitoring during operations, spinal anesthesia, epidurals, critical care, pain relief during labor, nerve blocks, emergency pain relief, breathing support, anesthesia for dental procedures', 'Anesthesiologist', '9898178245', 'dr..mammen.chandy@hospital.com', 'Narayana Health City', 'Bommasandra Industrial Area\nBengaluru, Karnataka 560099\nIndia', '10:00-18:00', 'Monday, Friday, Wednesday', '1.0') ,
-('9922', 'Dr. Priya Shetty', 'disease diagnosis, biopsy analysis, abnormal blood test results, cancer detection, infections, chronic diseases, tissue analysis, organ dysfunction, laboratory testing issues, unexplained symptoms, genetic disorders, disease progression monitoring, infections in organs, rare conditions, tumor evaluation', 'Pathologist', '9437372281', 'dr..priya.shetty@hospital.com', 'Father Muller Medical College Hospital', 'Kankanady\nMangalore, Karnataka 575002\nIndia', '09:00-18:00', 'Monday, Friday, Tuesday, Wednesday, Saturday', '0.1') ,
-('7833', 'Dr. Meena Menon', 'anemia, fatigue, pale skin, easy bruising, excessive bleeding, blood clots, swollen lymph nodes, infections, low platelet count, bone marrow problems, leukemia, sickle cell disease, thalassemia, bleeding disorders, iron deficiency', 'Hematologist', '9674821570', 'dr..meena.menon@hospital.com', 'S. S. Institute of Medical Sciences', 'NH-4 Bypass\nDavangere, Karnataka 577005\nIndia', '09:00-18:00', 'Friday, Monday, Sunday', '4.7') ,
-('5388', 'Dr. Vikas Iyer', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9101135923', 'dr..vikas.iyer@hospital.com', 'SDM College of Medical Sciences & Hospital', 'Manjushree Nagar\nDharwad, Karnataka 580009\nIndia', '08:00-19:00', 'Saturday, Tuesday, Friday', '2.5') ,
-('5422', 'Dr. A. Velumani', 'fever, body aches, colds, cough, flu, stomach pain, headaches, fatigue, minor injuries, allergies, infections, high blood pressure, diabetes symptoms, general weakness, preventive health care', 'General Physician', '9522087984', 'dr..a..velumani@hospital.com', 'Father Muller Medical College Hospital', 'Kankanady\nMangalore, Karnataka 575002\nIndia', '08:00-19:00', 'Sunday, Friday, Thursday', '4.5') ,
-('5806', 'Dr. Prathap C. Reddy', 'acne, skin rashes, dry skin, eczema, psoriasis, moles, skin discoloration, warts, hair loss, dandruff, nail problems, skin allergies, skin infections, wrinkles, scars', 'Dermatologist', '9777285111', 'dr..prathap.c..reddy@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '08:00-16:00', 'Thursday, Saturday, Monday, Tuesday', '2.0') ,
-('3851', 'Dr. Anjali Kulkarni', 'disease diagnosis, biopsy analysis, abnormal blood test results, cancer detection, infections, chronic diseases, tissue analysis, organ dysfunction, laboratory testing issues, unexplained symptoms, genetic disorders, disease progression monitoring, infections in organs, rare conditions, tumor evaluation', 'Pathologist', '9614087114', 'dr..anjali.kulkarni@hospital.com', 'SDM College of Medical Sciences & Hospital', 'Manjushree Nagar\nDharwad, Karnataka 580009\nIndia', '09:00-16:00', 'Thursday, Monday, Tuesday, Friday', '1.7') ,
-('6998', 'Dr. Mammen Chandy', 'acne, skin rashes, dry skin, eczema, psoriasis, moles, skin discoloration, warts, hair loss, dandruff, nail problems, skin allergies, skin infections, wrinkles, scars', 'Dermatologist', '9912789870', 'dr..mammen.chandy@hospital.com', 'BGS Gleneagles Global Hospital', 'Kengeri\nBengaluru, Karnataka 560060\nIndia', '09:00-17:00', 'Monday, Sunday, Tuesday, Wednesday', '0.8') ,
-('3342', 'Dr. Padmavati Sivaramakrishna Iyer', 'joint pain, broken bones, arthritis, back pain, sports injuries, sprains, ligament tears, bone deformities, dislocations, scoliosis, knee pain, hip pain, tendon injuries, carpal tunnel syndrome, shoulder stiffness', 'Orthopedic Surgeon', '9946646829', 'dr..padmavati.sivaramakrishna.iyer@hospital.com', 'Kasturba Medical College and Hospital', 'Tiger Circle Road\nManipal, Karnataka 576104\nIndia', '08:00-19:00', 'Sunday, Friday, Wednesday, Saturday', '1.6') ,
-('1613', 'Dr. V. Mohan', 'frequent infections, allergic reactions, autoimmune diseases, asthma, eczema, hay fever, hives, immunodeficiency disorders, food allergies, swelling after insect bites, recurrent colds, chronic sinus infections, fatigue from weak immunity, unusual infections, vaccine-related issues', 'Immunologist', '9543008356', 'dr..v..mohan@hospital.com', 'JSS Hospital', 'MG Road\nMysuru, Karnataka 570004\nIndia', '10:00-18:00', 'Thursday, Monday, Friday', '1.2') ,
-('5149', 'Dr. Sudhansu Bhattacharyya', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9948140463', 'dr..sudhansu.bhattacharyya@hospital.com', 'Apollo BGS Hospitals', 'Adichunchanagiri Road\nMysuru, Karnataka 570023\nIndia', '10:00-16:00', 'Sunday, Friday, Thursday, Monday', '2.4') ,
-('8859', 'Dr. Naresh Trehan', 'ear pain, hearing loss, nasal congestion, throat pain, sinus infections, balance issues, snoring, voice problems, tonsillitis, tinnitus, allergies, deviated septum, speech difficulties, chronic cough, ear infections', 'ENT Specialist', '9644910827', 'dr..naresh.trehan@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '10:00-16:00', 'Tuesday, Sunday, Thursday', '2.3') ,
-('1539', 'Dr. Prashant Sharma', 'joint pain, broken bones, arthritis, back pain, sports injuries, sprains, ligament tears, bone deformities, dislocations, scoliosis, knee pain, hip pain, tendon injuries, carpal tunnel syndrome, shoulder stiffness', 'Orthopedic Surgeon', '9946902475', 'dr..prashant.sharma@hospital.com', 'Victoria Hospital', 'K.R. Market\nBengaluru, Karnataka 560002\nIndia', '10:00-18:00', 'Saturday, Friday, Tuesday, Wednesday', '3.3') ,
-('9884', 'Dr. Prathap C. Reddy', 'severe headaches, brain tumors, dizziness, seizures, memory loss, numbness or tingling, paralysis, tremors, migraines, muscle weakness, speech difficulties, cognitive problems, movement disorders, difficulty walking, stroke symptoms', 'Neurologist', '9726082287', 'dr..prathap.c..reddy@hospital.com', 'SDM College of Medical Sciences & Hospital', 'Manjushree Nagar\nDharwad, Karnataka 580009\nIndia', '10:00-17:00', 'Wednesday, Monday, Friday', '2.8') ,
-('3922', 'Dr. Padmavati Sivaramakrishna Iyer', 'disease diagnosis, biopsy analysis, abnormal blood test results, cancer detection, infections, chronic diseases, tissue analysis, organ dysfunction, laboratory testing issues, unexplained symptoms, genetic disorders, disease progression monitoring, infections in organs, rare conditions, tumor evaluation', 'Pathologist', '9711560827', 'dr..padmavati.sivaramakrishna.iyer@hospital.com', 'Narayana Health City', 'Bommasandra Industrial Area\nBengaluru, Karnataka 560099\nIndia', '10:00-19:00', 'Sunday, Friday, Thursday, Monday', '1.4') ,
-('2060', 'Dr. Padmavati Sivaramakrishna Iyer', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9440717889', 'dr..padmavati.sivaramakrishna.iyer@hospital.com', 'Manipal Hospital', 'HAL Old Airport Road\nBengaluru, Karnataka 560017\nIndia', '09:00-19:00', 'Tuesday, Thursday, Sunday, Monday, Friday', '2.1') ,
-('4905', 'Dr. A. Velumani', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9451071661', 'dr..a..velumani@hospital.com', 'JSS Hospital', 'MG Road\nMysuru, Karnataka 570004\nIndia', '08:00-16:00', 'Tuesday, Sunday, Thursday', '0.3') ,
-('8023', 'Dr. Shalini Desai', 'swelling in legs or feet, blood in urine, foamy urine, high blood pressure, kidney stones, fatigue, nausea, frequent urination at night, chronic kidney disease, difficulty concentrating, decreased appetite, back pain near kidneys, electrolyte imbalance, kidney infections, dialysis needs', 'Nephrologist', '9252287604', 'dr..shalini.desai@hospital.com', 'KMC Hospital', 'Ambedkar Circle\nMangalore, Karnataka 575001\nIndia', '09:00-18:00', 'Thursday, Friday, Saturday', '4.6') ,
-('7074', 'Dr. P. Raghuram', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9898139891', 'dr..p..raghuram@hospital.com', 'Apollo BGS Hospitals', 'Adichunchanagiri Road\nMysuru, Karnataka 570023\nIndia', '10:00-18:00', 'Monday, Wednesday, Tuesday, Thursday', '3.2') ,
-('4061', 'Dr. S. K. Sarin', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9342307372', 'dr..s..k..sarin@hospital.com', 'Apollo BGS Hospitals', 'Adichunchanagiri Road\nMysuru, Karnataka 570023\nIndia', '08:00-17:00', 'Sunday, Friday, Tuesday, Thursday', '3.9') ,
-('8591', 'Dr. Ashok Seth', 'fractures, internal injuries, tumors, abnormal growths, infections, lung conditions, heart conditions, brain abnormalities, gastrointestinal issues, spinal problems, cancer screening, bone density issues, unexplained pain, swollen organs, imaging needs', 'Radiologist', '9222294011', 'dr..ashok.seth@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '10:00-16:00', 'Monday, Thursday, Sunday, Wednesday, Saturday', '1.2') ,
-('8046', 'Dr. Naresh Trehan', 'anemia, fatigue, pale skin, easy bruising, excessive bleeding, blood clots, swollen lymph nodes, infections, low platelet count, bone marrow problems, leukemia, sickle cell disease, thalassemia, bleeding disorders, iron deficiency', 'Hematologist', '9379774779', 'dr..naresh.trehan@hospital.com', 'JSS Hospital', 'MG Road\nMysuru, Karnataka 570004\nIndia', '09:00-16:00', 'Saturday, Sunday, Thursday', '2.7') ,
-('7805', 'Dr. Balamurali Ambati', 'acne, skin rashes, dry skin, eczema, psoriasis, moles, skin discoloration, warts, hair loss, dandruff, nail problems, skin allergies, skin infections, wrinkles, scars', 'Dermatologist', '9804438417', 'dr..balamurali.ambati@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '09:00-17:00', 'Sunday, Wednesday, Monday', '3.7') ,
-('1334', 'Dr. Mahesh Gowda', 'frequent infections, allergic reactions, autoimmune diseases, asthma, eczema, hay fever, hives, immunodeficiency disorders, food allergies, swelling after insect bites, recurrent colds, chronic sinus infections, fatigue from weak immunity, unusual infections, vaccine-related issues', 'Immunologist', '9402759195', 'dr..mahesh.gowda@hospital.com', 'SDM College of Medical Sciences & Hospital', 'Manjushree Nagar\nDharwad, Karnataka 580009\nIndia', '10:00-18:00', 'Wednesday, Friday, Thursday', '4.8') ,
-('4508', 'Dr. Sudhansu Bhattacharyya', 'fever in children, ear infections, cough, colds, flu, developmental delays, skin rashes, stomach pain, vomiting, diarrhea, asthma symptoms, behavioral issues, vaccination needs, growth concerns, allergies in children', 'Pediatrician', '9297365998', 'dr..sudhansu.bhattacharyya@hospital.com', 'Manipal Hospital', 'HAL Old Airport Road\nBengaluru, Karnataka 560017\nIndia', '10:00-16:00', 'Tuesday, Wednesday, Saturday, Friday, Monday', '3.2') ,
-('6537', 'Dr. Vikas Iyer', 'acne, skin rashes, dry skin, eczema, psoriasis, moles, skin discoloration, warts, hair loss, dandruff, nail problems, skin allergies, skin infections, wrinkles, scars', 'Dermatologist', '9174938696', 'dr..vikas.iyer@hospital.com', 'S. S. Institute of Medical Sciences', 'NH-4 Bypass\nDavangere, Karnataka 577005\nIndia', '09:00-19:00', 'Friday, Thursday, Wednesday, Tuesday', '4.8') ,
-('6530', 'Dr. Anjali Kulkarni', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9161559492', 'dr..anjali.kulkarni@hospital.com', 'Victoria Hospital', 'K.R. Market\nBengaluru, Karnataka 560002\nIndia', '10:00-18:00', 'Saturday, Tuesday, Thursday', '3.1') ,
-('6820', 'Dr. Devi Prasad Shetty', 'mobility issues, memory loss, frequent falls, arthritis, chronic diseases, osteoporosis, frailty, depression in the elderly, hearing problems, visual impairments, medication management, dementia, sleep issues, urinary incontinence, cardiovascular diseases', 'Geriatrician', '9606195842', 'dr..devi.prasad.shetty@hospital.com', 'Sparsh Hospital', 'Infantry Road\nBengaluru, Karnataka 560001\nIndia', '10:00-18:00', 'Monday, Friday, Saturday', '4.1') ,
-('9950', 'Dr. P. Raghuram', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9581154255', 'dr..p..raghuram@hospital.com', 'Manipal Hospital', 'HAL Old Airport Road\nBengaluru, Karnataka 560017\nIndia', '08:00-18:00', 'Sunday, Friday, Monday, Tuesday, Saturday', '4.0') ,
-('4952', 'Dr. B. C. Roy', 'irregular periods, pelvic pain, vaginal discharge, urinary infections, infertility, pregnancy care, menopause symptoms, hormonal imbalances, breast lumps, painful periods, endometriosis, PCOS, abnormal bleeding, pelvic infections, sexual health concerns', 'Gynecologist', '9660468395', 'dr..b..c..roy@hospital.com', 'KMC Hospital', 'Ambedkar Circle\nMangalore, Karnataka 575001\nIndia', '08:00-17:00', 'Thursday, Wednesday, Monday', '2.1') ,
-('9490', 'Dr. Ravi Kumar', 'stomach pain, bloating, heartburn, indigestion, constipation, diarrhea, blood in stool, acid reflux, difficulty swallowing, nausea, vomiting, gas issues, ulcers, liver problems, gallstones', 'Gastroenterologist', '9203813650', 'dr..ravi.kumar@hospital.com', 'Shimoga Institute of Medical Sciences', 'Sagar Road\nShivamogga, Karnataka 577201\nIndia', '10:00-16:00', 'Wednesday, Friday, Saturday, Sunday', '2.6') ,
-('1216', 'Dr. Devi Prasad Shetty', 'acne, skin rashes, dry skin, eczema, psoriasis, moles, skin discoloration, warts, hair loss, dandruff, nail problems, skin allergies, skin infections, wrinkles, scars', 'Dermatologist', '9145476271', 'dr..devi.prasad.shetty@hospital.com', 'Vinayaka Hospital', 'Vinoba Nagar\nShivamogga, Karnataka 577204\nIndia', '08:00-18:00', 'Tuesday, Monday, Saturday, Thursday, Friday', '4.6') ,
-('6841', 'Dr. Priya Shetty', 'anemia, fatigue, pale skin, easy bruising, excessive bleeding, blood clots, swollen lymph nodes, infections, low platelet count, bone marrow problems, leukemia, sickle cell disease, thalassemia, bleeding disorders, iron deficiency', 'Hematologist', '9435895058', 'dr..priya.shetty@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '09:00-17:00', 'Friday, Monday, Thursday, Sunday', '1.4') ,
-('4710', 'Dr. S. K. Sarin', 'chest pain, breathlessness, fatigue, irregular heartbeats, high blood pressure, dizziness, fainting, chest tightness, heart failure, swollen ankles or feet, palpitations, heart attack symptoms, angina, heart murmurs, hypertension', 'Cardiologist', '9698279707', 'dr..s..k..sarin@hospital.com', 'Shimoga Institute of Medical Sciences', 'Sagar Road\nShivamogga, Karnataka 577201\nIndia', '09:00-19:00', 'Monday, Saturday, Wednesday, Thursday, Sunday', '4.1') ,
-('3228', 'Dr. V. Mohan', 'persistent cough, shortness of breath, chest tightness, wheezing, asthma symptoms, chronic bronchitis, pneumonia, sleep apnea, lung infections, coughing up blood, fatigue from breathing issues, chest pain, COPD, tuberculosis, lung cancer symptoms', 'Pulmonologist', '9995209503', 'dr..v..mohan@hospital.com', 'Narayana Health City', 'Bommasandra Industrial Area\nBengaluru, Karnataka 560099\nIndia', '09:00-19:00', 'Wednesday, Thursday, Tuesday', '0.7') ,
-('9248', 'Dr. K. K. Aggarwal', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9994687910', 'dr..k..k..aggarwal@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '08:00-17:00', 'Wednesday, Saturday, Sunday, Thursday', '4.2') ,
-('5147', 'Dr. Mahesh Gowda', 'fever, body aches, colds, cough, flu, stomach pain, headaches, fatigue, minor injuries, allergies, infections, high blood pressure, diabetes symptoms, general weakness, preventive health care', 'General Physician', '9561591420', 'dr..mahesh.gowda@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '10:00-19:00', 'Monday, Sunday, Wednesday, Thursday', '1.5') ,
-('4499', 'Dr. Padmavati Sivaramakrishna Iyer', 'joint pain, stiffness, swelling, fatigue, arthritis, lupus, gout, back pain, connective tissue disorders, autoimmune diseases, fibromyalgia, joint inflammation, muscle weakness, chronic pain, swollen fingers or toes', 'Rheumatologist', '9329093455', 'dr..padmavati.sivaramakrishna.iyer@hospital.com', 'Dr. TMA Pai Hospital', 'Udupi-Manipal Highway\nManipal, Karnataka 576104\nIndia', '08:00-18:00', 'Monday, Saturday, Wednesday, Sunday, Thursday', '2.4') ,
-('4929', 'Dr. Prathap C. Reddy', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9649327580', 'dr..prathap.c..reddy@hospital.com', 'Dr. TMA Pai Hospital', 'Udupi-Manipal Highway\nManipal, Karnataka 576104\nIndia', '08:00-19:00', 'Thursday, Monday, Tuesday, Wednesday', '0.5') ,
-('8217', 'Dr. Prashant Sharma', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9850002075', 'dr..prashant.sharma@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '10:00-18:00', 'Sunday, Saturday, Tuesday, Friday', '2.2') ,
-('2573', 'Dr. Ashok Seth', 'irregular periods, pelvic pain, vaginal discharge, urinary infections, infertility, pregnancy care, menopause symptoms, hormonal imbalances, breast lumps, painful periods, endometriosis, PCOS, abnormal bleeding, pelvic infections, sexual health concerns', 'Gynecologist', '9590856281', 'dr..ashok.seth@hospital.com', 'Vinayaka Hospital', 'Vinoba Nagar\nShivamogga, Karnataka 577204\nIndia', '09:00-18:00', 'Tuesday, Sunday, Monday', '0.0') ,
-('8625', 'Dr. Gagandeep Kang', 'severe headaches, brain tumors, dizziness, seizures, memory loss, numbness or tingling, paralysis, tremors, migraines, muscle weakness, speech difficulties, cognitive problems, movement disorders, difficulty walking, stroke symptoms', 'Neurologist', '9441738269', 'dr..gagandeep.kang@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '08:00-18:00', 'Saturday, Wednesday, Sunday', '1.7') ,
-('5616', 'Dr. Vandana Shiva', 'ear pain, hearing loss, nasal congestion, throat pain, sinus infections, balance issues, snoring, voice problems, tonsillitis, tinnitus, allergies, deviated septum, speech difficulties, chronic cough, ear infections', 'ENT Specialist', '9686457877', 'dr..vandana.shiva@hospital.com', 'Father Muller Medical College Hospital', 'Kankanady\nMangalore, Karnataka 575002\nIndia', '10:00-17:00', 'Wednesday, Sunday, Monday, Saturday, Friday', '1.5') ,
-('2272', 'Dr. Priya Shetty', 'anemia, fatigue, pale skin, easy bruising, excessive bleeding, blood clots, swollen lymph nodes, infections, low platelet count, bone marrow problems, leukemia, sickle cell disease, thalassemia, bleeding disorders, iron deficiency', 'Hematologist', '9948289212', 'dr..priya.shetty@hospital.com', 'Shimoga Institute of Medical Sciences', 'Sagar Road\nShivamogga, Karnataka 577201\nIndia', '10:00-19:00', 'Friday, Sunday, Monday', '4.2') ,
-('1975', 'Dr. Ravi Kumar', 'ear pain, hearing loss, nasal congestion, throat pain, sinus infections, balance issues, snoring, voice problems, tonsillitis, tinnitus, allergies, deviated septum, speech difficulties, chronic cough, ear infections', 'ENT Specialist', '9342664122', 'dr..ravi.kumar@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '08:00-17:00', 'Friday, Monday, Wednesday, Saturday, Thursday', '3.0') ,
-('3406', 'Dr. Prashant Sharma', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9297828155', 'dr..prashant.sharma@hospital.com', 'JSS Hospital', 'MG Road\nMysuru, Karnataka 570004\nIndia', '09:00-19:00', 'Friday, Sunday, Saturday', '0.0') ,
-('5761', 'Dr. Sunita Naik', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9525889655', 'dr..sunita.naik@hospital.com', 'Shimoga Institute of Medical Sciences', 'Sagar Road\nShivamogga, Karnataka 577201\nIndia', '10:00-18:00', 'Monday, Tuesday, Sunday', '0.6') ,
-('4666', 'Dr. Arjun Rao', 'fever, body aches, colds, cough, flu, stomach pain, headaches, fatigue, minor injuries, allergies, infections, high blood pressure, diabetes symptoms, general weakness, preventive health care', 'General Physician', '9911704807', 'dr..arjun.rao@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '08:00-18:00', 'Monday, Tuesday, Saturday, Sunday, Wednesday', '0.6') ,
-('2470', 'Dr. V. Mohan', 'acne, skin rashes, dry skin, eczema, psoriasis, moles, skin discoloration, warts, hair loss, dandruff, nail problems, skin allergies, skin infections, wrinkles, scars', 'Dermatologist', '9508058600', 'dr..v..mohan@hospital.com', 'Sparsh Hospital', 'Infantry Road\nBengaluru, Karnataka 560001\nIndia', '08:00-16:00', 'Saturday, Tuesday, Sunday, Wednesday, Monday', '1.4') ,
-('1603', 'Dr. Sameer Reddy', 'ear pain, hearing loss, nasal congestion, throat pain, sinus infections, balance issues, snoring, voice problems, tonsillitis, tinnitus, allergies, deviated septum, speech difficulties, chronic cough, ear infections', 'ENT Specialist', '9466334544', 'dr..sameer.reddy@hospital.com', 'Shimoga Institute of Medical Sciences', 'Sagar Road\nShivamogga, Karnataka 577201\nIndia', '09:00-18:00', 'Wednesday, Saturday, Sunday, Friday, Monday', '1.3') ,
-('4159', 'Dr. S. K. Sarin', 'stomach pain, bloating, heartburn, indigestion, constipation, diarrhea, blood in stool, acid reflux, difficulty swallowing, nausea, vomiting, gas issues, ulcers, liver problems, gallstones', 'Gastroenterologist', '9295887352', 'dr..s..k..sarin@hospital.com', 'Apollo BGS Hospitals', 'Adichunchanagiri Road\nMysuru, Karnataka 570023\nIndia', '10:00-17:00', 'Friday, Thursday, Tuesday', '2.6') ,
-('6960', 'Dr. Meena Menon', 'toothache, gum bleeding, cavities, bad breath, sensitivity to hot or cold, oral infections, jaw pain, wisdom teeth issues, teeth cleaning, braces, mouth ulcers, dry mouth, broken teeth, missing teeth, tooth decay', 'Dentist', '9322233642', 'dr..meena.menon@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '10:00-16:00', 'Friday, Saturday, Monday', '0.3') ,
-('9612', 'Dr. Sunita Naik', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9426518518', 'dr..sunita.naik@hospital.com', 'Apollo BGS Hospitals', 'Adichunchanagiri Road\nMysuru, Karnataka 570023\nIndia', '09:00-18:00', 'Tuesday, Monday, Friday', '4.9') ,
-('3187', 'Dr. Meena Menon', 'persistent cough, shortness of breath, chest tightness, wheezing, asthma symptoms, chronic bronchitis, pneumonia, sleep apnea, lung infections, coughing up blood, fatigue from breathing issues, chest pain, COPD, tuberculosis, lung cancer symptoms', 'Pulmonologist', '9316251683', 'dr..meena.menon@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '10:00-17:00', 'Saturday, Thursday, Monday, Sunday', '3.3') ,
-('7483', 'Dr. K. K. Aggarwal', 'frequent infections, allergic reactions, autoimmune diseases, asthma, eczema, hay fever, hives, immunodeficiency disorders, food allergies, swelling after insect bites, recurrent colds, chronic sinus infections, fatigue from weak immunity, unusual infections, vaccine-related issues', 'Immunologist', '9774025137', 'dr..k..k..aggarwal@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '09:00-18:00', 'Sunday, Friday, Thursday', '1.4') ,
-('2909', 'Dr. Gagandeep Kang', 'fever, body aches, colds, cough, flu, stomach pain, headaches, fatigue, minor injuries, allergies, infections, high blood pressure, diabetes symptoms, general weakness, preventive health care', 'General Physician', '9680679885', 'dr..gagandeep.kang@hospital.com', 'Father Muller Medical College Hospital', 'Kankanady\nMangalore, Karnataka 575002\nIndia', '10:00-16:00', 'Friday, Sunday, Saturday', '1.4') ,
-('9719', 'Dr. A. Velumani', 'chest pain, breathlessness, fatigue, irregular heartbeats, high blood pressure, dizziness, fainting, chest tightness, heart failure, swollen ankles or feet, palpitations, heart attack symptoms, angina, heart murmurs, hypertension', 'Cardiologist', '9796990901', 'dr..a..velumani@hospital.com', 'St. John’s Medical College and Hospital', 'Sarjapur Road\nBengaluru, Karnataka 560034\nIndia', '09:00-17:00', 'Sunday, Saturday, Friday, Wednesday, Thursday', '3.1') ,
-('8638', 'Dr. Vandana Shiva', 'swelling in legs or feet, blood in urine, foamy urine, high blood pressure, kidney stones, fatigue, nausea, frequent urination at night, chronic kidney disease, difficulty concentrating, decreased appetite, back pain near kidneys, electrolyte imbalance, kidney infections, dialysis needs', 'Nephrologist', '9829300166', 'dr..vandana.shiva@hospital.com', 'Manipal Hospital', 'HAL Old Airport Road\nBengaluru, Karnataka 560017\nIndia', '08:00-16:00', 'Monday, Sunday, Tuesday, Thursday', '0.0') ,
-('7989', 'Dr. A. Velumani', 'chest pain, breathlessness, fatigue, irregular heartbeats, high blood pressure, dizziness, fainting, chest tightness, heart failure, swollen ankles or feet, palpitations, heart attack symptoms, angina, heart murmurs, hypertension', 'Cardiologist', '9975984986', 'dr..a..velumani@hospital.com', 'JSS Hospital', 'MG Road\nMysuru, Karnataka 570004\nIndia', '10:00-18:00', 'Friday, Wednesday, Thursday, Sunday', '2.0') ,
-('7145', 'Dr. Swati Piramal', 'swelling in legs or feet, blood in urine, foamy urine, high blood pressure, kidney stones, fatigue, nausea, frequent urination at night, chronic kidney disease, difficulty concentrating, decreased appetite, back pain near kidneys, electrolyte imbalance, kidney infections, dialysis needs', 'Nephrologist', '9805178184', 'dr..swati.piramal@hospital.com', 'St. John’s Medical College and Hospital', 'Sarjapur Road\nBengaluru, Karnataka 560034\nIndia', '09:00-19:00', 'Friday, Saturday, Thursday, Monday', '2.1') ,
-('1448', 'Dr. Anjali Kulkarni', 'chest pain, breathlessness, fatigue, irregular heartbeats, high blood pressure, dizziness, fainting, chest tightness, heart failure, swollen ankles or feet, palpitations, heart attack symptoms, angina, heart murmurs, hypertension', 'Cardiologist', '9824463207', 'dr..anjali.kulkarni@hospital.com', 'KMC Hospital', 'Ambedkar Circle\nMangalore, Karnataka 575001\nIndia', '10:00-19:00', 'Sunday, Thursday, Monday, Wednesday, Friday', '4.0') ,
-('6316', 'Dr. Sudhansu Bhattacharyya', 'disease diagnosis, biopsy analysis, abnormal blood test results, cancer detection, infections, chronic diseases, tissue analysis, organ dysfunction, laboratory testing issues, unexplained symptoms, genetic disorders, disease progression monitoring, infections in organs, rare conditions, tumor evaluation', 'Pathologist', '9728560116', 'dr..sudhansu.bhattacharyya@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '08:00-18:00', 'Sunday, Thursday, Tuesday, Wednesday', '4.6') ,
-('5513', 'Dr. Mahesh Gowda', 'pain management needs, pre-surgery assessments, post-surgery recovery, chronic pain issues, numbness for surgery, sedation, monitoring during operations, spinal anesthesia, epidurals, critical care, pain relief during labor, nerve blocks, emergency pain relief, breathing support, anesthesia for dental procedures', 'Anesthesiologist', '9498263358', 'dr..mahesh.gowda@hospital.com', 'BGS Gleneagles Global Hospital', 'Kengeri\nBengaluru, Karnataka 560060\nIndia', '10:00-18:00', 'Saturday, Tuesday, Wednesday, Thursday', '1.0') ,
-('4545', 'Dr. B. C. Roy', 'disease diagnosis, biopsy analysis, abnormal blood test results, cancer detection, infections, chronic diseases, tissue analysis, organ dysfunction, laboratory testing issues, unexplained symptoms, genetic disorders, disease progression monitoring, infections in organs, rare conditions, tumor evaluation', 'Pathologist', '9318001263', 'dr..b..c..roy@hospital.com', 'Narayana Health City', 'Bommasandra Industrial Area\nBengaluru, Karnataka 560099\nIndia', '10:00-16:00', 'Sunday, Tuesday, Friday, Wednesday', '3.8') ,
-('4701', 'Dr. K. K. Aggarwal', 'joint pain, stiffness, swelling, fatigue, arthritis, lupus, gout, back pain, connective tissue disorders, autoimmune diseases, fibromyalgia, joint inflammation, muscle weakness, chronic pain, swollen fingers or toes', 'Rheumatologist', '9521410161', 'dr..k..k..aggarwal@hospital.com', 'Victoria Hospital', 'K.R. Market\nBengaluru, Karnataka 560002\nIndia', '09:00-19:00', 'Friday, Sunday, Wednesday, Saturday, Monday', '1.3') ,
-('5855', 'Dr. Sudhansu Bhattacharyya', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9151399825', 'dr..sudhansu.bhattacharyya@hospital.com', 'Apollo BGS Hospitals', 'Adichunchanagiri Road\nMysuru, Karnataka 570023\nIndia', '08:00-19:00', 'Wednesday, Saturday, Tuesday, Thursday', '1.3') ,
-('8204', 'Dr. Mahesh Gowda', 'stomach pain, bloating, heartburn, indigestion, constipation, diarrhea, blood in stool, acid reflux, difficulty swallowing, nausea, vomiting, gas issues, ulcers, liver problems, gallstones', 'Gastroenterologist', '9374852159', 'dr..mahesh.gowda@hospital.com', 'Manipal Hospital', 'HAL Old Airport Road\nBengaluru, Karnataka 560017\nIndia', '08:00-16:00', 'Tuesday, Wednesday, Thursday', '4.9') ,
-('2157', 'Dr. Meena Menon', 'toothache, gum bleeding, cavities, bad breath, sensitivity to hot or cold, oral infections, jaw pain, wisdom teeth issues, teeth cleaning, braces, mouth ulcers, dry mouth, broken teeth, missing teeth, tooth decay', 'Dentist', '9783725221', 'dr..meena.menon@hospital.com', 'JSS Hospital', 'MG Road\nMysuru, Karnataka 570004\nIndia', '09:00-16:00', 'Saturday, Friday, Thursday, Monday', '1.0') ,
-('2392', 'Dr. B. C. Roy', 'persistent cough, shortness of breath, chest tightness, wheezing, asthma symptoms, chronic bronchitis, pneumonia, sleep apnea, lung infections, coughing up blood, fatigue from breathing issues, chest pain, COPD, tuberculosis, lung cancer symptoms', 'Pulmonologist', '9901468830', 'dr..b..c..roy@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '10:00-18:00', 'Wednesday, Thursday, Sunday', '3.1') ,
-('3998', 'Dr. Devi Prasad Shetty', 'persistent cough, shortness of breath, chest tightness, wheezing, asthma symptoms, chronic bronchitis, pneumonia, sleep apnea, lung infections, coughing up blood, fatigue from breathing issues, chest pain, COPD, tuberculosis, lung cancer symptoms', 'Pulmonologist', '9660881942', 'dr..devi.prasad.shetty@hospital.com', 'Kasturba Medical College and Hospital', 'Tiger Circle Road\nManipal, Karnataka 576104\nIndia', '10:00-18:00', 'Saturday, Sunday, Friday', '1.8') ,
-('1046', 'Dr. K. K. Aggarwal', 'anxiety, depression, mood swings, stress, insomnia, panic attacks, phobias, PTSD, OCD, bipolar disorder, hallucinations, suicidal thoughts, eating disorders, personality disorders, anger issues', 'Psychiatrist', '9351953743', 'dr..k..k..aggarwal@hospital.com', 'JSS Hospital', 'MG Road\nMysuru, Karnataka 570004\nIndia', '08:00-17:00', 'Friday, Saturday, Monday', '2.2') ,
-('5911', 'Dr. K. K. Aggarwal', 'mobility issues, memory loss, frequent falls, arthritis, chronic diseases, osteoporosis, frailty, depression in the elderly, hearing problems, visual impairments, medication management, dementia, sleep issues, urinary incontinence, cardiovascular diseases', 'Geriatrician', '9151876293', 'dr..k..k..aggarwal@hospital.com', 'Shimoga Institute of Medical Sciences', 'Sagar Road\nShivamogga, Karnataka 577201\nIndia', '10:00-16:00', 'Wednesday, Thursday, Sunday, Saturday, Monday', '4.7') ,
-('4227', 'Dr. A. Velumani', 'fever in children, ear infections, cough, colds, flu, developmental delays, skin rashes, stomach pain, vomiting, diarrhea, asthma symptoms, behavioral issues, vaccination needs, growth concerns, allergies in children', 'Pediatrician', '9391888863', 'dr..a..velumani@hospital.com', 'Victoria Hospital', 'K.R. Market\nBengaluru, Karnataka 560002\nIndia', '08:00-18:00', 'Sunday, Friday, Monday', '3.2') ,
-('3265', 'Dr. Vandana Shiva', 'frequent infections, allergic reactions, autoimmune diseases, asthma, eczema, hay fever, hives, immunodeficiency disorders, food allergies, swelling after insect bites, recurrent colds, chronic sinus infections, fatigue from weak immunity, unusual infections, vaccine-related issues', 'Immunologist', '9142224529', 'dr..vandana.shiva@hospital.com', 'Kasturba Medical College and Hospital', 'Tiger Circle Road\nManipal, Karnataka 576104\nIndia', '08:00-18:00', 'Monday, Tuesday, Friday, Wednesday, Sunday', '3.5') ,
-('6768', 'Dr. Sudhansu Bhattacharyya', 'fractures, internal injuries, tumors, abnormal growths, infections, lung conditions, heart conditions, brain abnormalities, gastrointestinal issues, spinal problems, cancer screening, bone density issues, unexplained pain, swollen organs, imaging needs', 'Radiologist', '9545013045', 'dr..sudhansu.bhattacharyya@hospital.com', 'Chigateri District Hospital', 'Near Davangere University\nDavangere, Karnataka 577002\nIndia', '09:00-19:00', 'Tuesday, Friday, Sunday, Thursday', '3.8') ,
-('7479', 'Dr. Anjali Kulkarni', 'chest pain, breathlessness, fatigue, irregular heartbeats, high blood pressure, dizziness, fainting, chest tightness, heart failure, swollen ankles or feet, palpitations, heart attack symptoms, angina, heart murmurs, hypertension', 'Cardiologist', '9571448424', 'dr..anjali.kulkarni@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '08:00-18:00', 'Friday, Thursday, Wednesday, Sunday', '4.0') ,
-('6030', 'Dr. Arjun Rao', 'irregular periods, pelvic pain, vaginal discharge, urinary infections, infertility, pregnancy care, menopause symptoms, hormonal imbalances, breast lumps, painful periods, endometriosis, PCOS, abnormal bleeding, pelvic infections, sexual health concerns', 'Gynecologist', '9445505100', 'dr..arjun.rao@hospital.com', 'Dr. TMA Pai Hospital', 'Udupi-Manipal Highway\nManipal, Karnataka 576104\nIndia', '09:00-17:00', 'Friday, Saturday, Sunday, Wednesday', '0.3') ,
-('1933', 'Dr. Arun Kurian Thomas', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9859015164', 'dr..arun.kurian.thomas@hospital.com', 'Dr. TMA Pai Hospital', 'Udupi-Manipal Highway\nManipal, Karnataka 576104\nIndia', '10:00-17:00', 'Wednesday, Friday, Saturday, Thursday', '3.3') ,
-('3603', 'Dr. Anjali Kulkarni', 'frequent infections, allergic reactions, autoimmune diseases, asthma, eczema, hay fever, hives, immunodeficiency disorders, food allergies, swelling after insect bites, recurrent colds, chronic sinus infections, fatigue from weak immunity, unusual infections, vaccine-related issues', 'Immunologist', '9813548953', 'dr..anjali.kulkarni@hospital.com', 'Apollo BGS Hospitals', 'Adichunchanagiri Road\nMysuru, Karnataka 570023\nIndia', '10:00-16:00', 'Tuesday, Wednesday, Friday', '3.2') ,
-('6513', 'Dr. Mahesh Gowda', 'blurry vision, eye pain, red eyes, dry eyes, watery eyes, sensitivity to light, floaters, double vision, loss of vision, eyelid problems, cataracts, glaucoma, macular degeneration, eye injuries, eye infections', 'Ophthalmologist', '9984417361', 'dr..mahesh.gowda@hospital.com', 'BGS Gleneagles Global Hospital', 'Kengeri\nBengaluru, Karnataka 560060\nIndia', '10:00-19:00', 'Tuesday, Sunday, Saturday, Thursday', '0.5') ,
-('8070', 'Dr. Sunita Naik', 'fever, body aches, colds, cough, flu, stomach pain, headaches, fatigue, minor injuries, allergies, infections, high blood pressure, diabetes symptoms, general weakness, preventive health care', 'General Physician', '9818768927', 'dr..sunita.naik@hospital.com', 'KLE Hospital', 'Nehru Nagar\nBelagavi, Karnataka 590010\nIndia', '09:00-16:00', 'Wednesday, Friday, Sunday', '2.5') ,
-('1140', 'Dr. Anjali Kulkarni', 'ear pain, hearing loss, nasal congestion, throat pain, sinus infections, balance issues, snoring, voice problems, tonsillitis, tinnitus, allergies, deviated septum, speech difficulties, chronic cough, ear infections', 'ENT Specialist', '9702704315', 'dr..anjali.kulkarni@hospital.com', 'Narayana Health City', 'Bommasandra Industrial Area\nBengaluru, Karnataka 560099\nIndia', '09:00-18:00', 'Wednesday, Tuesday, Saturday, Sunday, Thursday', '1.3') ,
-('2104', 'Dr. Vikas Iyer', 'mobility issues, memory loss, frequent falls, arthritis, chronic diseases, osteoporosis, frailty, depression in the elderly, hearing problems, visual impairments, medication management, dementia, sleep issues, urinary incontinence, cardiovascular diseases', 'Geriatrician', '9607978029', 'dr..vikas.iyer@hospital.com', 'Vinayaka Hospital', 'Vinoba Nagar\nShivamogga, Karnataka 577204\nIndia', '10:00-19:00', 'Tuesday, Wednesday, Saturday', '4.5') ,
-('7431', 'Dr. Devi Prasad Shetty', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9611036811', 'dr..devi.prasad.shetty@hospital.com', 'Manipal Hospital', 'HAL Old Airport Road\nBengaluru, Karnataka 560017\nIndia', '09:00-16:00', 'Monday, Tuesday, Friday, Sunday, Thursday', '4.4') ,
-('3385', 'Dr. Sudhansu Bhattacharyya', 'frequent urination, excessive thirst, weight gain, weight loss, hair thinning, fatigue, hormonal imbalances, slow growth, irregular periods, diabetes symptoms, thyroid problems, infertility, osteoporosis, excessive sweating, adrenal issues', 'Endocrinologist', '9506942645', 'dr..sudhansu.bhattacharyya@hospital.com', 'Sparsh Hospital', 'Infantry Road\nBengaluru, Karnataka 560001\nIndia', '08:00-18:00', 'Tuesday, Friday, Wednesday, Monday, Sunday', '4.0') ,
-('1173', 'Dr. Arjun Rao', 'irregular periods, pelvic pain, vaginal discharge, urinary infections, infertility, pregnancy care, menopause symptoms, hormonal imbalances, breast lumps, painful periods, endometriosis, PCOS, abnormal bleeding, pelvic infections, sexual health concerns', 'Gynecologist', '9820328793', 'dr..arjun.rao@hospital.com', 'KLE Hospital', 'Nehru Nagar\nBelagavi, Karnataka 590010\nIndia', '09:00-16:00', 'Sunday, Wednesday, Thursday, Tuesday', '3.4') ,
-('6597', 'Dr. K. K. Aggarwal', 'joint pain, stiffness, swelling, fatigue, arthritis, lupus, gout, back pain, connective tissue disorders, autoimmune diseases, fibromyalgia, joint inflammation, muscle weakness, chronic pain, swollen fingers or toes', 'Rheumatologist', '9172370181', 'dr..k..k..aggarwal@hospital.com', 'BGS Gleneagles Global Hospital', 'Kengeri\nBengaluru, Karnataka 560060\nIndia', '10:00-19:00', 'Thursday, Monday, Friday', '4.0') ,
-('2644', 'Dr. Kavita Patil', 'lumps, unexplained weight loss, persistent fatigue, abnormal bleeding, chronic pain, swelling, skin changes, difficulty swallowing, persistent cough, night sweats, frequent infections, anemia, persistent indigestion, abnormal test results, swollen lymph nodes', 'Oncologist', '9478576639', 'dr..kavita.patil@hospital.com', 'Shimoga Institute of Medical Sciences', 'Sagar Road\nShivamogga, Karnataka 577201\nIndia', '08:00-16:00', 'Wednesday, Saturday, Thursday, Sunday', '3.1') ,
-('9779', 'Dr. Devi Prasad Shetty', 'persistent cough, shortness of breath, chest tightness, wheezing, asthma symptoms, chronic bronchitis, pneumonia, sleep apnea, lung infections, coughing up blood, fatigue from breathing issues, chest pain, COPD, tuberculosis, lung cancer symptoms', 'Pulmonologist', '9714347508', 'dr..devi.prasad.shetty@hospital.com', 'Dr. TMA Pai Hospital', 'Udupi-Manipal Highway\nManipal, Karnataka 576104\nIndia', '08:00-19:00', 'Friday, Thursday, Wednesday, Saturday', '3.2') ,
-('6358', 'Dr. Randeep Guleria', 'stomach pain, bloating, heartburn, indigestion, constipation, diarrhea, blood in stool, acid reflux, difficulty swallowing, nausea, vomiting, gas issues, ulcers, liver problems, gallstones', 'Gastroenterologist', '9252490815', 'dr..randeep.guleria@hospital.com', 'Victoria Hospital', 'K.R. Market\nBengaluru, Karnataka 560002\nIndia', '09:00-17:00', 'Sunday, Saturday, Monday, Wednesday, Friday', '4.8') ,
-('7990', 'Dr. Padmavati Sivaramakrishna Iyer', 'urinary tract infections, difficulty urinating, blood in urine, kidney stones, incontinence, prostate problems, pain during urination, frequent urination, bladder control issues, male infertility, testicular pain, urinary retention, urinary infections, pelvic pain, erectile dysfunction', 'Urologist', '9778844673', 'dr..padmavati.sivaramakrishna.iyer@hospital.com', 'Vinayaka Hospital', 'Vinoba Nagar\nShivamogga, Karnataka 577204\nIndia', '08:00-17:00', 'Saturday, Friday, Tuesday', '2.2') ,
-('4696', 'Dr. Arun Kurian Thomas', 'blurry vision, eye pain, red eyes, dry eyes, watery eyes, sensitivity to light, floaters, double vision, loss of vision, eyelid problems, cataracts, glaucoma, macular degeneration, eye injuries, eye infections', 'Ophthalmologist', '9897554439', 'dr..arun.kurian.thomas@hospital.com', 'Karnataka Institute of Medical Sciences', 'PB Road\nHubballi, Karnataka 580022\nIndia', '10:00-19:00', 'Wednesday, Friday, Monday', '0.4') ,
-('9217', 'Dr. A. Velumani', 'joint pain, stiffness, swelling, fatigue, arthritis, lupus, gout, back pain, connective tissue disorders, autoimmune diseases, fibromyalgia, joint inflammation, muscle weakness, chronic pain, swollen fingers or toes', 'Rheumatologist', '9658700091', 'dr..a..velumani@hospital.com', 'BGS Gleneagles Global Hospital', 'Kengeri\nBengaluru, Karnataka 560060\nIndia', '09:00-17:00', 'Saturday, Sunday, Wednesday, Monday, Tuesday', '1.9') ,
-('2329', 'Dr. Meena Menon', 'swelling in legs or feet, blood in urine, foamy urine, high blood pressure, kidney stones, fatigue, nausea, frequent urination at night, chronic kidney disease, difficulty concentrating, decreased appetite, back pain near kidneys, electrolyte imbalance, kidney infections, dialysis needs', 'Nephrologist', '9781287222', 'dr..meena.menon@hospital.com', 'Adichunchanagiri Institute of Medical Sciences', 'B.G. Nagara\nMandya, Karnataka 571448\nIndia', '10:00-16:00', 'Saturday, Monday, Wednesday, Tuesday, Thursday', '1.0') ,
-('2107', 'Dr. Prathap C. Reddy', 'frequent infections, allergic reactions, autoimmune diseases, asthma, eczema, hay fever, hives, immunodeficiency disorders, food allergies, swelling after insect bites, recurrent colds, chronic sinus infections, fatigue from weak immunity, unusual infections, vaccine-related issues', 'Immunologist', '9285050453', 'dr..prathap.c..reddy@hospital.com', 'St. John’s Medical College and Hospital', 'Sarjapur Road\nBengaluru, Karnataka 560034\nIndia', '10:00-19:00', 'Thursday, Wednesday, Monday, Sunday', '4.8') ,
-('1460', 'Dr. Randeep Guleria', 'persistent cough, shortness of breath, chest tightness, wheezing, asthma symptoms, chronic bronchitis, pneumonia, sleep apnea, lung infections, coughing up blood, fatigue from breathing issues, chest pain, COPD, tuberculosis, lung cancer symptoms', 'Pulmonologist', '9160076735', 'dr..randeep.guleria@hospital.com', 'Kasturba Medical College and Hospital', 'Tiger Circle Road\nManipal, Karnataka 576104\nIndia', '10:00-19:00', 'Monday, Sunday, Wednesday', '2.2') 
-        ])
-        conn.commit()
-    conn.close()
-
-# Query the database for doctor details based on symptoms
-def query_database(symptoms):
-    conn = sqlite3.connect("doctor_recommendations.db")
-    cursor = conn.cursor()
-    cursor.execute(
-        '''
-        SELECT doctor_identity_number, doctor_name, specialization, contact, 
-               email, hospital_name, hospital_location, availability, working_days, rating
-        FROM doctors 
-        WHERE symptom_name LIKE ?
-        ''',
-        ('%' + symptoms + '%',)
+    if mode == "Available now":
+        now = datetime.now(TIMEZONE)
+        return now.weekday(), now.hour * 60 + now.minute
+    if mode == "Choose a day and time":
+        day = st.selectbox("Day:", WEEKDAYS, key=f"{key}_day")
+        at = st.time_input("Time (leave empty for any time that day):", value=None, key=f"{key}_time")
+        return WEEKDAYS.index(day), None if at is None else at.hour * 60 + at.minute
+    return None, None
+
+
+# Search radius choices offered next to the location box, in km
+RADIUS_CHOICES_KM = (5, 10, 25, 50, 100, 250)
+
+
+# Location controls shared by the search pages. Returns ((latitude, longitude) or None,
+# radius in km, whether to sort nearest first).
+def location_filter(key):
+    place = st.text_input("Your location (PIN code or city, optional):", key=f"{key}_location")
+    radius_km = st.select_slider(
+        "Within (km):", RADIUS_CHOICES_KM, value=DEFAULT_RADIUS_KM, key=f"{key}_radius"
     )
-    result = cursor.fetchall()
-    conn.close()
+    nearest_first = st.radio(
+        "Sort by:", ["Best match", "Nearest first"], horizontal=True, key=f"{key}_sort"
+    ) == "Nearest first"
+    if not place.strip():
+        return None, radius_km, nearest_first
+    near = locate(place)
+    if near is None:
+        st.warning(f"Could not find {place!r}; showing doctors at any distance.")
+    return near, radius_km, nearest_first
+
+
+# Model answers shared by every session in the process
+@st.cache_resource(show_spinner=False)
+def get_response_cache():
+    return ResponseCache()
+
+
+# Time-to-first-token and total latency of model responses across all sessions
+@st.cache_resource(show_spinner=False)
+def get_latency_log():
+    return LatencyLog()
+
+
+# Bounded pool of worker threads for model calls that run in the background
+@st.cache_resource(show_spinner=False)
+def get_llm_pool():
+    return LLMWorkerPool()
+
+
+# Rows per page in the result tables. Only the page on screen is fetched and turned into a DataFrame.
+RESULTS_PAGE_SIZE = int(os.getenv("MEDIBOT_RESULTS_PAGE_SIZE", "20"))
+
+# Messages kept in a session's chat history (oldest dropped first), and how many the sidebar shows
+CHAT_HISTORY_LIMIT = int(os.getenv("MEDIBOT_CHAT_HISTORY_LIMIT", "100"))
+CHAT_HISTORY_SHOWN = int(os.getenv("MEDIBOT_CHAT_HISTORY_SHOWN", "10"))
+
+# Show the per-stage performance panel in the sidebar (MEDIBOT_ADMIN=1)
+ADMIN_PANEL = os.getenv("MEDIBOT_ADMIN", "") == "1"
 
-    # Convert working_days string back to a list
-    if result:
-        result = [
-            list(row[:-1]) + [row[-1].split(', ')] for row in result
-        ]
-    return result if result else None
-
-# Get response from Gemini Pro
-def get_gemini_response(question, doctor_details=None):
-    if doctor_details:
-        # Doctor recommendation-specific response
-        context = (
-            f"You are a doctor recommendation chatbot. "
-            f"Based on the input '{question}', the following doctors are suitable for the symptoms:\n"
-        )
-        # Add doctor details to the context
-        for doctor in doctor_details:
-            context += (
-                f"Doctor Identity Number: {doctor[0]}, Name: {doctor[1]}, Specialization: {doctor[2]}, "
-                f"Contact: {doctor[3]}, Email: {doctor[4]}, Hospital: {doctor[5]}, Location: {doctor[6]}, "
-                f"Availability: {doctor[7]}, Working Days: {', '.join(doctor[8])}\n\n"
-            )
-        context += "Please provide a summary of the doctor details and why these doctors are suitable."
-    else:
-        # General question-answering
-        context = (
-            f"You are an intelligent chatbot. "
-            f"Answer the user's question '{question}' in under 200 words."
-        )
-    response = chat.send_message(context, stream=True)
-    return response
+
+def turn_page(key, step):
+    st.session_state[f"{key}_page"] += step
+
+
+# Previous/Next buttons under a paged table. The page number lives in session state and is
+# changed in the button callbacks, so the rerun that follows already fetches the new page.
+def page_controls(key, has_next, page_count=None):
+    page = st.session_state[f"{key}_page"]
+    previous_column, label_column, next_column = st.columns([1, 3, 1])
+    previous_column.button(
+        "Previous", key=f"{key}_previous", disabled=page == 0, on_click=turn_page, args=(key, -1)
+    )
+    label_column.caption(f"Page {page + 1}" + (f" of {page_count}" if page_count else ""))
+    next_column.button("Next", key=f"{key}_next", disabled=not has_next, on_click=turn_page, args=(key, 1))
+
+
+# Get response from Gemini Pro. Worker threads have no Streamlit session, so background
+# callers pass the backend and the shared cache in explicitly.
+def get_gemini_response(question, doctor_details=None, backend=None, cache=None):
+    return model_response(question, doctor_details, backend or get_llm_backend(), cache or get_response_cache())
 
 # Initialize the Streamlit app
 st.set_page_config(page_title="Chatbot Application", layout="wide")
@@ -314,40 +166,98 @@ menu_option = st.sidebar.selectbox("Choose a Chatbot:", ["Doctor Recommendation
 # Initialize the database for doctor recommendations
 initialize_database()
 
-# Manage chat history in session state
+# Manage chat history in session state, capped so long sessions use a fixed amount of memory
 if "chat_history" not in st.session_state:
-    st.session_state["chat_history"] = []
+    st.session_state["chat_history"] = deque(maxlen=CHAT_HISTORY_LIMIT)
 
 # Dcotor recommendation chatbot
 if menu_option == "Doctor Recommendation Chatbot":
     st.header("Doctor Recommendation Chatbot")
     user_input = st.text_input("Enter your symptoms:", key="doctor_input")
+    weekday, open_at = availability_filter("doctor")
+    near, radius_km, nearest_first = location_filter("doctor")
     submit_button = st.button("Get Recommendation")
 
+    # A rerun abandons the summary still being generated for the previous request
+    previous_summary = st.session_state.pop("summary_stream", None)
+    if previous_summary is not None:
+        previous_summary.cancel()
+
+    # The search is kept in session state so the Previous/Next reruns can fetch other pages of it
     if submit_button and user_input:
-        # Query the database for doctor details
-        doctor_details = query_database(user_input)
+        st.session_state["doctor_search"] = dict(
+            symptoms=user_input, weekday=weekday, open_at=open_at,
+            near=near, radius_km=radius_km, nearest_first=nearest_first
+        )
+        st.session_state["doctor_page"] = 0
+        st.session_state["doctor_summary"] = None
+
+    search = st.session_state.get("doctor_search")
+    if search:
+        # Query the database for this page of doctor details, plus one row to tell if there is a next page
+        page = st.session_state["doctor_page"]
+        doctor_details = query_database(
+            **search, catalog=get_catalog(),
+            limit=RESULTS_PAGE_SIZE + 1, offset=page * RESULTS_PAGE_SIZE
+        )
+        if not doctor_details and page:
+            # The results shrank since this page was opened (the catalog changed); start over
+            st.session_state["doctor_page"] = 0
+            st.rerun()
         if doctor_details:
+            has_next = len(doctor_details) > RESULTS_PAGE_SIZE
+            doctor_details = doctor_details[:RESULTS_PAGE_SIZE]
+
+            # Start the model summary of the best matches in the background so it generates
+            # while the table renders
+            if submit_button:
+                started_at = time.perf_counter()
+                backend, cache = get_llm_backend(), get_response_cache()
+                summary_stream = get_llm_pool().submit(
+                    lambda: get_gemini_response(search["symptoms"], doctor_details, backend, cache)
+                )
+                st.session_state["summary_stream"] = summary_stream
+
             st.subheader("Matching Doctors:")
             
-            # Create a DataFrame from the queried doctor details
-            doctor_df = pd.DataFrame(
-                doctor_details,
-                columns=[
-                    "Doctor Identity Number", "Doctor Name", "Specialization", 
-                    "Contact", "Email", "Hospital Name", "Hospital Location", 
-                    "Availability", "Working Days", "Rating"
-                ],
-            )
-            
-            # Sort the DataFrame in descending order by the Rating column
-            doctor_df = doctor_df.sort_values(by="Rating", ascending=False)
-            
-            # Display the sorted DataFrame
-            st.dataframe(doctor_df)
+            # Building and sending the table is timed as the "render_results" stage
+            with METRICS.timer("render_results"):
+                # Create a DataFrame from the queried doctor details
+                doctor_df = pd.DataFrame(
+                    doctor_details,
+                    columns=[
+                        "Doctor Identity Number", "Doctor Name", "Specialization", 
+                        "Contact", "Email", "Hospital Name", "Hospital Location", 
+                        "Availability", "Working Days", "Rating"
+                    ] + (["Distance (km)"] if search["near"] is not None else []),
+                )
+
+                # Rows arrive ranked by relevance (or distance), best match first
+                st.dataframe(doctor_df, hide_index=True)
+            page_controls("doctor", has_next)
 
-            # Store user input in chat history
-            st.session_state["chat_history"].append(("You", user_input))
+            st.subheader("Summary:")
+            if submit_button:
+                # Stream the model's summary of these doctors below the table as it arrives
+                summary = st.write_stream(TimedStream(
+                    summary_stream, started_at, "recommendation", get_latency_log().record
+                ))
+                if summary_stream.timed_out:
+                    st.warning("The summary is taking too long and was stopped. The matching doctors are listed above.")
+                elif summary_stream.error is not None:
+                    st.warning("The summary could not be generated right now. The matching doctors are listed above.")
+                st.session_state["doctor_summary"] = summary
+
+                # Store user input in chat history
+                st.session_state["chat_history"].append(("You", search["symptoms"]))
+                if summary and not summary_stream.timed_out and summary_stream.error is None:
+                    st.session_state["chat_history"].append(("Bot", summary))
+            elif st.session_state["doctor_summary"]:
+                st.write(st.session_state["doctor_summary"])
+        elif search["near"] is not None:
+            st.error(f"Sorry, no matching doctors are available within {search['radius_km']} km.")
+        elif search["weekday"] is not None:
+            st.error("Sorry, no matching doctors are available at that time.")
         else:
             st.error("Sorry, no matching doctors found in our database.")
 
@@ -359,72 +269,130 @@ elif menu_option == "Q&A Chatbot":
     submit_button = st.button("Get Answer")
 
     if submit_button and user_input:
-        response = get_gemini_response(user_input)
-        bot_response = "".join(chunk.text for chunk in response)
+        # Render the answer as it is generated rather than after the last chunk arrives
+        st.subheader("Response:")
+        started_at = time.perf_counter()
+        try:
+            bot_response = st.write_stream(TimedStream(
+                get_gemini_response(user_input), started_at, "qa", get_latency_log().record
+            ))
+        except Exception:
+            bot_response = None
+            st.warning("Sorry, the answer could not be generated right now. Please try again.")
 
         st.session_state["chat_history"].append(("You", user_input))
-        st.session_state["chat_history"].append(("Bot", bot_response))
-
-        st.subheader("Response:")
-        st.write(bot_response)
+        if bot_response:
+            st.session_state["chat_history"].append(("Bot", bot_response))
 
 # Find Doctors by Specialization Section
 elif menu_option == "Find Doctors by Specialization":
     st.header("Find Doctors by Specialization")
     
-    # Fetch specializations from the database
-    conn = sqlite3.connect("doctor_recommendations.db")
-    cursor = conn.cursor()
-    cursor.execute("SELECT DISTINCT specialization FROM doctors")
-    specializations = [row[0] for row in cursor.fetchall()]
-    conn.close()
+    # Specializations and doctors come from the in-memory catalog, not the database
+    catalog = get_catalog()
 
     # Select specialization from dropdown
-    specialization = st.selectbox("Select a specialization:", specializations)
+    specialization = st.selectbox("Select a specialization:", catalog.specializations)
+    weekday, open_at = availability_filter("specialization")
+    near, radius_km, nearest_first = location_filter("specialization")
     find_button = st.button("Find Doctors")
 
+    # Kept in session state so the Previous/Next reruns page through the same search
     if find_button and specialization:
-        conn = sqlite3.connect("doctor_recommendations.db")
-        cursor = conn.cursor()
-        
-        # Fetch doctor details sorted by rating in descending order
-        cursor.execute(
-            """
-            SELECT doctor_identity_number, doctor_name, symptom_name, contact, email, 
-                   hospital_name, hospital_location, availability, working_days, rating
-            FROM doctors 
-            WHERE specialization = ? 
-            ORDER BY rating DESC
-            """,
-            (specialization,)
+        st.session_state["specialization_search"] = dict(
+            specialization=specialization, weekday=weekday, open_at=open_at,
+            near=near, radius_km=radius_km, nearest_first=nearest_first
         )
-        specialization_doctors = cursor.fetchall()
-        conn.close()
-
-        if specialization_doctors:
-            st.subheader(f"Doctors specializing in {specialization} (sorted by Rating):")
-            specialization_df = pd.DataFrame(
-                specialization_doctors,
-                columns=[
-                    "Doctor Identity Number",
-                    "Doctor Name",
-                    "Symptoms Treated",
-                    "Contact",
-                    "Email",
-                    "Hospital Name",
-                    "Hospital Location",
-                    "Availability",
-                    "Working Days",
-                    "Rating"
-                ],
-            )
-            st.dataframe(specialization_df)
+        st.session_state["specialization_page"] = 0
+
+    search = st.session_state.get("specialization_search")
+    if search:
+        specialization, near = search["specialization"], search["near"]
+        # Doctors already sorted by rating in descending order (or by distance)
+        doctors = catalog.doctors_by_specialization(**search)
+
+        if doctors:
+            # Only the rows of the page on screen are built; the catalog shrinking since the
+            # page was opened moves the view back to its last page
+            page_count = -(-len(doctors) // RESULTS_PAGE_SIZE)
+            page = min(st.session_state["specialization_page"], page_count - 1)
+            st.session_state["specialization_page"] = page
+            with METRICS.timer("render_results"):
+                specialization_doctors = [
+                    doctor.row(SPECIALIZATION_COLUMNS)
+                    + ((round(haversine_km(near, (doctor.latitude, doctor.longitude)), 1),) if near is not None else ())
+                    for doctor in doctors[page * RESULTS_PAGE_SIZE:(page + 1) * RESULTS_PAGE_SIZE]
+                ]
+
+                order = "nearest first" if near is not None and search["nearest_first"] else "sorted by Rating"
+                st.subheader(f"Doctors specializing in {specialization} ({order}):")
+                specialization_df = pd.DataFrame(
+                    specialization_doctors,
+                    columns=[
+                        "Doctor Identity Number",
+                        "Doctor Name",
+                        "Symptoms Treated",
+                        "Contact",
+                        "Email",
+                        "Hospital Name",
+                        "Hospital Location",
+                        "Availability",
+                        "Working Days",
+                        "Rating"
+                    ] + (["Distance (km)"] if near is not None else []),
+                    index=range(page * RESULTS_PAGE_SIZE, page * RESULTS_PAGE_SIZE + len(specialization_doctors)),
+                )
+                st.dataframe(specialization_df)
+            page_controls("specialization", page + 1 < page_count, page_count)
+        elif near is not None:
+            st.error(f"No {specialization} doctors are available within {search['radius_km']} km.")
+        elif search["weekday"] is not None:
+            st.error(f"No {specialization} doctors are available at that time.")
         else:
             st.error(f"No doctors found for specialization: {specialization}.")
 
 
 
-# Display Chat History
+# Response latency across all sessions
+with st.sidebar.expander("Response Times"):
+    for kind, stats in get_latency_log().summary().items():
+        st.write(
+            f"{kind}: {stats['count']} responses, first token {stats['ttft_p50']:.2f}s, "
+            f"complete {stats['total_p50']:.2f}s (median)"
+        )
+
+# Per-stage timings for operators, with the same numbers in Prometheus format to download
+if ADMIN_PANEL:
+    with st.sidebar.expander("Performance (admin)"):
+        stage_rows = [
+            (stage, stats["count"], stats["errors"], stats["mean"] * 1000, stats["p50"] * 1000, stats["p99"] * 1000)
+            for stage, stats in METRICS.summary().items()
+        ]
+        if stage_rows:
+            st.dataframe(
+                pd.DataFrame(
+                    stage_rows, columns=["Stage", "Calls", "Errors", "Mean ms", "p50 ms", "p99 ms"]
+                ).round(2),
+                hide_index=True,
+            )
+        cache_stats = get_response_cache().stats()
+        lookups = cache_stats["hits"] + cache_stats["misses"]
+        st.write(
+            f"Response cache: {cache_stats['hits']} hits ({cache_stats['disk_hits']} from disk), "
+            f"{cache_stats['misses']} misses"
+            + (f", {cache_stats['hits'] / lookups:.0%} hit rate" if lookups else "")
+            + f", {cache_stats['entries']} answers held"
+        )
+        st.download_button(
+            "Download metrics (Prometheus)",
+            METRICS.prometheus_text() + get_response_cache().prometheus_text(),
+            file_name="medibot_metrics.txt",
+        )
+
+# Display Chat History, most recent messages only
 st.sidebar.subheader("Chat History")
-for role, text in st.session_state["chat_history"]:
+chat_history = st.session_state["chat_history"]
+if len(chat_history) > CHAT_HISTORY_SHOWN:
+    st.sidebar.caption(f"Showing the last {CHAT_HISTORY_SHOWN} of {len(chat_history)} messages")
+for role, text in islice(chat_history, max(len(chat_history) - CHAT_HISTORY_SHOWN, 0), None):
     st.sidebar.write(f"{role}: {text}")
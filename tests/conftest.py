@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+from medibot.database import DOCTOR_COLUMNS, initialize_database
+from medibot.repository import get_pool
+
+
+# Record for one imported doctor, in the shape medibot.ingest reads from a file
+def doctor_record(identity, **fields):
+    record = {
+        "doctor_identity_number": identity,
+        "doctor_name": f"Dr. Test {identity}",
+        "symptom_name": "fever, cough",
+        "specialization": "General Physician",
+        "contact": "9876543210",
+        "email": f"test.{identity}@hospital.com",
+        "hospital_name": "Test Hospital",
+        "hospital_location": "MG Road\nBengaluru, Karnataka 560001\nIndia",
+        "availability": "09:00-17:00",
+        "working_days": "Monday, Wednesday, Friday",
+        "rating": "4.0",
+    }
+    record.update(fields)
+    return record
+
+
+# A seed row (a tuple in DOCTOR_COLUMNS order) built from doctor_record
+def seed_row(identity, **fields):
+    record = doctor_record(identity, **fields)
+    return tuple(record[column] for column in DOCTOR_COLUMNS)
+
+
+# Empty path for a database, with its connection pool closed after the test
+@pytest.fixture
+def new_db_path(tmp_path):
+    path = str(tmp_path / "doctors.db")
+    yield path
+    get_pool(path).close()
+
+
+# Database created and seeded with the bundled seed data
+@pytest.fixture
+def db_path(new_db_path):
+    initialize_database(new_db_path)
+    return new_db_path
+
+
+# Writes records to a JSONL file for medibot.ingest and returns its path
+@pytest.fixture
+def import_file(tmp_path):
+    def write(*records, name="doctors.jsonl"):
+        path = tmp_path / name
+        path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+        return str(path)
+    return write
@@ -0,0 +1,61 @@
+import io
+import json
+import time
+
+from medibot.batch import read_queries, run_batch
+from medibot.recommender import InvalidRequest, Recommender
+
+
+# Recommender stand-in: earlier lines take longer, so answers finish out of input order
+class SlowRecommender:
+    def recommend(self, request):
+        symptoms = request["symptoms"]
+        if symptoms == "invalid":
+            raise InvalidRequest("symptoms is invalid")
+        if symptoms == "crash":
+            raise RuntimeError("database is on fire")
+        time.sleep(0.05 / int(symptoms))
+        return {"symptoms": symptoms}
+
+
+def batch_results(recommender, text, workers=4):
+    output = io.StringIO()
+    stats = run_batch(recommender, read_queries(io.StringIO(text), {"limit": 5}), output, workers)
+    return stats, [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+def test_read_queries_accepts_text_and_json_lines():
+    queries = list(read_queries(io.StringIO('fever\n\n{"symptoms": "cough", "limit": 2}\n{broken\n'), {"limit": 5}))
+    assert queries == [
+        (1, {"limit": 5, "symptoms": "fever"}),
+        (3, {"limit": 2, "symptoms": "cough"}),
+        (4, None),
+    ]
+
+
+def test_results_are_written_in_input_order():
+    stats, results = batch_results(SlowRecommender(), "".join(f"{n}\n" for n in range(1, 21)))
+    assert [result["symptoms"] for result in results] == [str(n) for n in range(1, 21)]
+    assert [result["line"] for result in results] == list(range(1, 21))
+    assert (stats["queries"], stats["errors"]) == (20, 0)
+
+
+def test_failed_queries_become_error_lines(capsys):
+    stats, results = batch_results(SlowRecommender(), '1\n{broken\ninvalid\ncrash\n2\n')
+    assert results == [
+        {"symptoms": "1", "line": 1},
+        {"error": "line is not valid JSON", "line": 2},
+        {"error": "symptoms is invalid", "line": 3},
+        {"error": "internal error: RuntimeError: database is on fire", "line": 4},
+        {"symptoms": "2", "line": 5},
+    ]
+    assert (stats["queries"], stats["errors"]) == (5, 3)
+    # Only the unexpected failure is logged, with its traceback
+    logged = capsys.readouterr().err
+    assert logged.startswith("line 4: Traceback") and "RuntimeError: database is on fire" in logged
+
+
+def test_batch_ranks_doctors_from_the_database(db_path):
+    _, results = batch_results(Recommender(db_path), "fever\nchest pain\n", workers=2)
+    assert [result["symptoms"] for result in results] == ["fever", "chest pain"]
+    assert all(result["doctors"] for result in results)
@@ -0,0 +1,56 @@
+from conftest import seed_row
+
+from medibot.catalog import DoctorCatalog
+from medibot.database import initialize_database
+from medibot.geo import haversine_km, locate
+from medibot.repository import connection
+from medibot.search import availability_condition
+
+
+def test_open_schedules_match_the_sql_filter_to_the_minute(new_db_path):
+    initialize_database(new_db_path, [
+        seed_row("1", availability="09:15-17:10", working_days="Monday"),
+        seed_row("2", availability="00:00-24:00", working_days="Sunday"),
+        seed_row("3", availability="17:10-18:00", working_days="Monday, Sunday"),
+    ])
+    catalog = DoctorCatalog.from_database(new_db_path)
+    with connection(new_db_path) as conn:
+        for weekday in range(7):
+            for open_at in [None] + list(range(0, 24 * 60, 5)) + [9 * 60 + 14, 17 * 60 + 9, 24 * 60 - 1]:
+                condition, params = availability_condition(weekday, open_at)
+                expected = {
+                    identity for (identity,) in
+                    conn.execute(f"SELECT doctor_identity_number FROM doctors WHERE {condition}", params)
+                }
+                open_schedules = catalog.open_schedules(weekday, open_at)
+                found = {doctor.doctor_identity_number for doctor in catalog.doctors if doctor.schedule in open_schedules}
+                assert found == expected, (weekday, open_at)
+
+
+def test_doctors_by_specialization_are_best_rated_first(db_path):
+    catalog = DoctorCatalog.from_database(db_path)
+    doctors = catalog.doctors_by_specialization("Cardiologist")
+    assert doctors
+    assert all(doctor.specialization == "Cardiologist" for doctor in doctors)
+    assert [doctor.rating for doctor in doctors] == sorted((doctor.rating for doctor in doctors), reverse=True)
+
+
+def test_doctors_by_specialization_near_a_location(db_path):
+    catalog = DoctorCatalog.from_database(db_path)
+    near = locate("Bengaluru")
+    doctors = catalog.doctors_by_specialization("General Physician", near=near, radius_km=30, nearest_first=True)
+    distances = [haversine_km(near, (doctor.latitude, doctor.longitude)) for doctor in doctors]
+    assert distances
+    assert distances == sorted(distances)
+    assert all(distance <= 30 for distance in distances)
+
+
+def test_catalog_notices_database_changes(new_db_path):
+    initialize_database(new_db_path, [seed_row("1")])
+    catalog = DoctorCatalog.from_database(new_db_path)
+    catalog.checked_at = float("-inf")
+    assert not catalog.is_stale()
+
+    initialize_database(new_db_path, [seed_row("1"), seed_row("2")])
+    catalog.checked_at = float("-inf")
+    assert catalog.is_stale()
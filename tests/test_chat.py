@@ -0,0 +1,74 @@
+import pytest
+
+from medibot.chat import ChatSession
+from medibot.llm import FakeBackend
+
+
+# Fake backend that remembers the history it was sent and every summary it was asked for
+class RecordingBackend(FakeBackend):
+    def __init__(self, fail_summaries=False):
+        super().__init__(first_token_latency=0, chunk_latency=0)
+        self.fail_summaries = fail_summaries
+        self.histories = []
+        self.summaries = 0
+
+    def send_message(self, history, content, stream=False):
+        self.histories.append(history)
+        return super().send_message(history, content, stream=stream)
+
+    def generate_content(self, prompt, stream=False):
+        self.summaries += 1
+        if self.fail_summaries:
+            raise RuntimeError("summary failed")
+        return super().generate_content(prompt, stream=stream)
+
+
+def test_history_window_must_keep_a_turn_after_condensing():
+    with pytest.raises(ValueError):
+        ChatSession(RecordingBackend(), history_window=1)
+
+
+def test_turns_are_replayed_until_the_window_is_full():
+    backend = RecordingBackend()
+    session = ChatSession(backend, history_window=4)
+    for number in range(4):
+        session.send_message(f"question {number}")
+    assert [message["parts"][0] for message in backend.histories[-1]][::2] == ["question 0", "question 1", "question 2"]
+    assert backend.summaries == 0
+
+
+def test_older_turns_are_summarized_before_the_next_send():
+    backend = RecordingBackend()
+    session = ChatSession(backend, history_window=4)
+    for number in range(5):
+        session.add_turn(f"question {number}", f"answer {number}")
+    # Adding a turn (e.g. at the end of a streamed answer) never calls the model
+    assert backend.summaries == 0
+
+    session.send_message("question 5")
+    assert backend.summaries == 1
+    assert session.summary
+    # The summary exchange, then the newest half of the window, then the new turn
+    assert len(backend.histories[-1]) == 2 + 2 * 2
+    assert [question for question, _ in session.turns] == ["question 3", "question 4", "question 5"]
+
+
+def test_streamed_answer_is_recorded_when_the_stream_ends():
+    backend = RecordingBackend()
+    session = ChatSession(backend, history_window=2)
+    for number in range(3):
+        session.add_turn(f"question {number}", f"answer {number}")
+    chunks = session.send_message("question 3", stream=True)
+    summaries_before_stream = backend.summaries
+    text = "".join(chunk.text for chunk in chunks)
+    assert session.turns[-1] == ("question 3", text)
+    assert backend.summaries == summaries_before_stream == 1
+
+
+def test_failed_summary_drops_the_old_turns_without_failing_the_send():
+    session = ChatSession(RecordingBackend(fail_summaries=True), history_window=2)
+    for number in range(3):
+        session.add_turn(f"question {number}", f"answer {number}")
+    assert session.send_message("question 3").text
+    assert session.summary == ""
+    assert [question for question, _ in session.turns] == ["question 2", "question 3"]
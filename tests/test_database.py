@@ -0,0 +1,96 @@
+import multiprocessing
+
+from conftest import seed_row
+
+from medibot.database import MIGRATIONS, catalog_version, initialize_database
+from medibot.repository import connection
+from medibot.seed_data import DOCTORS_SEED
+
+
+def doctor_count(db_path):
+    with connection(db_path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM doctors").fetchone()[0]
+
+
+def test_new_database_is_fully_migrated_and_seeded(db_path):
+    with connection(db_path) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == len(MIGRATIONS)
+        sources = conn.execute("SELECT DISTINCT source FROM doctors").fetchall()
+    assert doctor_count(db_path) == len(DOCTORS_SEED)
+    assert sources == [("seed",)]
+
+
+def test_unchanged_seed_is_not_applied_again(db_path):
+    with connection(db_path) as conn:
+        version = catalog_version(conn)
+    initialize_database(db_path)
+    with connection(db_path) as conn:
+        assert catalog_version(conn) == version
+    assert doctor_count(db_path) == len(DOCTORS_SEED)
+
+
+def test_seed_changes_are_applied_as_a_diff(new_db_path):
+    initialize_database(new_db_path, [seed_row("1"), seed_row("2"), seed_row("3")])
+    with connection(new_db_path) as conn:
+        kept_id = conn.execute("SELECT doctor_id FROM doctors WHERE doctor_identity_number = '1'").fetchone()[0]
+
+    initialize_database(new_db_path, [seed_row("1"), seed_row("2", rating="2.5"), seed_row("4")])
+    with connection(new_db_path) as conn:
+        rows = dict(conn.execute("SELECT doctor_identity_number, rating FROM doctors").fetchall())
+        unchanged_id = conn.execute("SELECT doctor_id FROM doctors WHERE doctor_identity_number = '1'").fetchone()[0]
+    assert rows == {"1": 4.0, "2": 2.5, "4": 4.0}
+    # Rows the seed did not change keep their ids
+    assert unchanged_id == kept_id
+
+
+def test_seed_sync_keeps_full_text_index_in_step(new_db_path):
+    initialize_database(new_db_path, [seed_row("1", symptom_name="migraine")])
+    initialize_database(new_db_path, [seed_row("1", symptom_name="toothache")])
+    with connection(new_db_path) as conn:
+        def matches(term):
+            return conn.execute("SELECT COUNT(*) FROM doctors_fts WHERE doctors_fts MATCH ?", [term]).fetchone()[0]
+        assert matches("migraine") == 0
+        assert matches("toothache") == 1
+
+
+def test_concurrent_initialization_seeds_once(new_db_path):
+    context = multiprocessing.get_context("spawn")
+    processes = [context.Process(target=initialize_database, args=(new_db_path,)) for _ in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(60)
+        assert process.exitcode == 0
+    assert doctor_count(new_db_path) == len(DOCTORS_SEED)
+
+
+def test_hospitals_are_geocoded_from_their_pin_code(new_db_path):
+    initialize_database(new_db_path, [seed_row("1"), seed_row("2", hospital_location="Nowhere 999999")])
+    with connection(new_db_path) as conn:
+        located = dict(
+            (identity, (latitude, longitude)) for identity, latitude, longitude in
+            conn.execute("SELECT doctor_identity_number, latitude, longitude FROM doctors")
+        )
+        pending = conn.execute(
+            "SELECT COUNT(*) FROM doctors WHERE geocoded_location IS NOT hospital_location"
+        ).fetchone()[0]
+    assert None not in located["1"]
+    assert located["2"] == (None, None)
+    # An unknown PIN code is remembered as tried rather than looked up on every start
+    assert pending == 0
+
+
+def test_location_index_follows_the_hospital_coordinates(new_db_path):
+    initialize_database(new_db_path, [seed_row("1"), seed_row("2"), seed_row("3", hospital_location="Nowhere 999999")])
+    initialize_database(new_db_path, [
+        seed_row("1", hospital_location="Hampankatta\nMangalore, Karnataka 575001\nIndia"),
+        seed_row("3", hospital_location="Nowhere 999999"),
+    ])
+    with connection(new_db_path) as conn:
+        # The R*Tree stores 32-bit floats, rounded outwards, so each box contains its doctor
+        assert conn.execute(
+            "SELECT doctors.doctor_identity_number FROM doctors JOIN doctors_location USING (doctor_id) "
+            "WHERE min_latitude <= latitude AND latitude <= max_latitude "
+            "AND min_longitude <= longitude AND longitude <= max_longitude"
+        ).fetchall() == [("1",)]
+        assert conn.execute("SELECT COUNT(*) FROM doctors_location").fetchone()[0] == 1
@@ -0,0 +1,44 @@
+import pytest
+
+from medibot.geo import SpatialGrid, bounding_box, geocode_address, haversine_km, locate, pincode_location
+
+
+def test_locate_pin_codes_and_place_names():
+    assert locate("560001") == pincode_location("560001")
+    assert locate("Bengaluru, Karnataka") is not None
+    assert locate("Bangalore") == locate("Bengaluru")
+    assert locate("Atlantis") is None
+
+
+def test_unknown_pin_code_falls_back_to_its_district():
+    assert pincode_location("560999") is not None
+    assert pincode_location("999999") is None
+
+
+def test_geocode_address_uses_the_pin_code_in_it():
+    assert geocode_address("MG Road\nBengaluru, Karnataka 560001\nIndia") == pincode_location("560001")
+    assert geocode_address("MG Road, Bengaluru") is None
+
+
+def test_haversine_km():
+    assert haversine_km((12.97, 77.59), (12.97, 77.59)) == 0
+    # Bengaluru to Mysuru is about 128 km in a straight line
+    assert haversine_km((12.9716, 77.5946), (12.2958, 76.6394)) == pytest.approx(128, abs=3)
+
+
+def test_bounding_box_contains_the_circle():
+    center = (12.97, 77.59)
+    min_lat, max_lat, min_lon, max_lon = bounding_box(center, 25)
+    for point in ((min_lat, center[1]), (max_lat, center[1]), (center[0], min_lon), (center[0], max_lon)):
+        assert haversine_km(center, point) == pytest.approx(25, rel=0.01)
+
+
+def test_spatial_grid_finds_items_within_the_radius_nearest_first():
+    grid = SpatialGrid()
+    center = (12.97, 77.59)
+    grid.add("a", (12.98, 77.60), "near")
+    grid.add("a", (13.20, 77.70), "further")
+    grid.add("a", (15.00, 75.00), "far")
+    grid.add("b", (12.97, 77.59), "other layer")
+    assert [item for _, item in grid.within("a", center, 40)] == ["near", "further"]
+    assert grid.within("c", center, 40) == []
@@ -0,0 +1,142 @@
+import pytest
+
+from conftest import doctor_record, seed_row
+
+from medibot.database import initialize_database
+from medibot.ingest import (
+    InvalidRow, ingest, normalize_availability, normalize_email, normalize_phone, normalize_rating,
+    normalize_row, normalize_working_days,
+)
+from medibot.repository import connection
+
+
+def run_ingest(db_path, path):
+    return ingest([path], db_path, log=lambda message: None)
+
+
+def doctors(db_path, identity):
+    with connection(db_path) as conn:
+        return conn.execute(
+            "SELECT doctor_name, source, hospital_location, latitude, longitude FROM doctors "
+            "WHERE doctor_identity_number = ?",
+            [identity]
+        ).fetchall()
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("98765 43210", "9876543210"),
+    ("+91 98765-43210", "9876543210"),
+    ("09876543210", "9876543210"),
+])
+def test_normalize_phone(value, expected):
+    assert normalize_phone(value) == expected
+
+
+@pytest.mark.parametrize("value", ["12345", "1234567890123"])
+def test_normalize_phone_rejects_wrong_length(value):
+    with pytest.raises(InvalidRow):
+        normalize_phone(value)
+
+
+def test_normalize_email():
+    assert normalize_email(" Dr.Rao@Hospital.COM ") == "dr.rao@hospital.com"
+    with pytest.raises(InvalidRow):
+        normalize_email("dr.rao at hospital")
+
+
+def test_normalize_working_days_orders_and_expands_names():
+    assert normalize_working_days("fri; MON, wednesday") == "Monday, Wednesday, Friday"
+    with pytest.raises(InvalidRow):
+        normalize_working_days("Mon, Funday")
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("9:00 - 17:30", "09:00-17:30"),
+    ("00:00-24:00", "00:00-24:00"),
+])
+def test_normalize_availability(value, expected):
+    assert normalize_availability(value) == expected
+
+
+@pytest.mark.parametrize("value", ["22:00-06:00", "09:00-09:00", "09:00-24:30", "24:00-24:00", "9am-5pm"])
+def test_normalize_availability_rejects_invalid_and_overnight_ranges(value):
+    with pytest.raises(InvalidRow):
+        normalize_availability(value)
+
+
+def test_normalize_rating():
+    assert normalize_rating("4.25") == 4.2
+    for value in ("five", "5.5"):
+        with pytest.raises(InvalidRow):
+            normalize_rating(value)
+
+
+def test_normalize_row_reports_missing_fields():
+    with pytest.raises(InvalidRow, match="email is missing"):
+        normalize_row(doctor_record("1", email=" "))
+
+
+def test_ingest_inserts_new_doctors_and_rejects_bad_rows(db_path, import_file):
+    path = import_file(doctor_record("9001"), doctor_record("9002", availability="22:00-06:00"))
+    stats = run_ingest(db_path, path)
+    assert (stats["inserted"], stats["updated"], stats["rejected"]) == (1, 0, 1)
+    assert doctors(db_path, "9001")[0][1] == f"import:{path}"
+    assert doctors(db_path, "9002") == []
+
+
+def test_import_collapses_copies_of_the_same_doctor(new_db_path, import_file):
+    initialize_database(new_db_path, [seed_row("1", doctor_name="Dr. One"), seed_row("1", doctor_name="dr.  one")])
+    messages = []
+    stats = ingest([import_file(doctor_record("1", doctor_name="Dr. One", rating="3.0"))], new_db_path, log=messages.append)
+    assert (stats["updated"], stats["removed"]) == (1, 1)
+    assert len(messages) == 1 and "removed doctor" in messages[0]
+    assert [row[0] for row in doctors(new_db_path, "1")] == ["Dr. One"]
+
+
+def test_import_keeps_different_doctors_sharing_an_identity_number(new_db_path, import_file):
+    initialize_database(new_db_path, [seed_row("1", doctor_name="Dr. One"), seed_row("1", doctor_name="Dr. Uno")])
+    path = import_file(doctor_record("1", doctor_name="Dr. Uno"))
+    stats = run_ingest(new_db_path, path)
+    assert (stats["updated"], stats["removed"]) == (1, 0)
+    assert sorted(row[:2] for row in doctors(new_db_path, "1")) == [("Dr. One", "seed"), ("Dr. Uno", f"import:{path}")]
+
+
+def test_ambiguous_identity_number_is_rejected(new_db_path, import_file):
+    initialize_database(new_db_path, [seed_row("1", doctor_name="Dr. One"), seed_row("1", doctor_name="Dr. Uno")])
+    messages = []
+    stats = ingest([import_file(doctor_record("1", doctor_name="Dr. Other"))], new_db_path, log=messages.append)
+    assert (stats["inserted"], stats["updated"], stats["rejected"]) == (0, 0, 1)
+    assert "shared by 2 doctors" in messages[0]
+    assert sorted(row[0] for row in doctors(new_db_path, "1")) == ["Dr. One", "Dr. Uno"]
+
+
+def test_seed_changes_leave_imported_doctors_alone(new_db_path, import_file):
+    initialize_database(new_db_path, [seed_row("1"), seed_row("2", doctor_name="Dr. Two"), seed_row("2", doctor_name="Dr. Deux")])
+    path = import_file(doctor_record("1", doctor_name="Dr. Renamed"), doctor_record("2", doctor_name="Dr. Two"))
+    run_ingest(new_db_path, path)
+
+    initialize_database(new_db_path, [
+        seed_row("1", rating="1.0"), seed_row("2", doctor_name="Dr. Two", rating="1.0"),
+        seed_row("2", doctor_name="Dr. Deux", rating="1.0"),
+    ])
+    assert [row[:2] for row in doctors(new_db_path, "1")] == [("Dr. Renamed", f"import:{path}")]
+    # The other doctor sharing number 2 is still a seed doctor and follows the seed change
+    with connection(new_db_path) as conn:
+        assert sorted(conn.execute(
+            "SELECT doctor_name, source, rating FROM doctors WHERE doctor_identity_number = '2'"
+        ).fetchall()) == [("Dr. Deux", "seed", 1.0), ("Dr. Two", f"import:{path}", 4.0)]
+
+
+def test_changed_address_is_geocoded_again(new_db_path, import_file):
+    initialize_database(new_db_path, [seed_row("1")])
+    bengaluru = doctors(new_db_path, "1")[0][3:]
+
+    run_ingest(new_db_path, import_file(doctor_record(
+        "1", hospital_location="Hampankatta\nMangalore, Karnataka 575001\nIndia"
+    )))
+    mangaluru = doctors(new_db_path, "1")[0][3:]
+    assert None not in mangaluru
+    assert mangaluru != bengaluru
+
+    run_ingest(new_db_path, import_file(doctor_record("1", hospital_location="Nowhere 999999"), name="moved.jsonl"))
+    assert doctors(new_db_path, "1")[0][3:] == (None, None)
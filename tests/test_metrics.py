@@ -0,0 +1,79 @@
+import re
+import threading
+
+import pytest
+
+from medibot.metrics import Histogram, Metrics
+
+
+def test_histogram_quantile_interpolates_inside_buckets():
+    histogram = Histogram(buckets=(1.0, 2.0, 4.0))
+    assert histogram.quantile(0.5) is None
+    for value in (0.5, 1.5, 1.5, 3.0):
+        histogram.observe(value)
+    assert histogram.quantile(0.25) == pytest.approx(1.0)
+    assert histogram.quantile(0.5) == pytest.approx(1.5)
+    assert histogram.quantile(1.0) == pytest.approx(4.0)
+    # Values above the largest bound are reported as that bound
+    histogram.observe(10.0)
+    assert histogram.quantile(1.0) == 4.0
+
+
+def test_prometheus_text_lists_cumulative_buckets_and_errors():
+    metrics = Metrics(buckets=(0.1, 1.0))
+    metrics.observe("search", 0.05)
+    metrics.observe("search", 0.5, error=True)
+    metrics.observe("search", 5.0)
+    text = metrics.prometheus_text()
+    assert 'medibot_stage_duration_seconds_bucket{stage="search",le="0.1"} 1' in text
+    assert 'medibot_stage_duration_seconds_bucket{stage="search",le="1.0"} 2' in text
+    assert 'medibot_stage_duration_seconds_bucket{stage="search",le="+Inf"} 3' in text
+    assert 'medibot_stage_duration_seconds_sum{stage="search"} 5.55' in text
+    assert 'medibot_stage_duration_seconds_count{stage="search"} 3' in text
+    assert 'medibot_stage_errors_total{stage="search"} 1' in text
+
+
+def test_prometheus_text_is_consistent_while_stages_are_observed():
+    metrics = Metrics(buckets=(0.1, 1.0))
+    stop = threading.Event()
+
+    def observe():
+        while not stop.is_set():
+            metrics.observe("search", 0.5)
+
+    threads = [threading.Thread(target=observe) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    try:
+        for _ in range(200):
+            text = metrics.prometheus_text()
+            infinite = re.search(r'le="\+Inf"} (\d+)', text)
+            count = re.search(r'_count{stage="search"} (\d+)', text)
+            if infinite:
+                assert infinite.group(1) == count.group(1)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+
+def test_timed_stream_records_complete_failed_and_cancelled_streams():
+    metrics = Metrics()
+
+    assert list(metrics.timed_stream("answer", iter("abc"))) == ["a", "b", "c"]
+
+    def failing():
+        yield "a"
+        raise RuntimeError("model unavailable")
+
+    with pytest.raises(RuntimeError):
+        list(metrics.timed_stream("answer", failing()))
+
+    stream = metrics.timed_stream("answer", iter("abc"))
+    next(stream)
+    stream.close()
+
+    summary = metrics.summary()
+    assert (summary["answer"]["count"], summary["answer"]["errors"]) == (2, 1)
+    assert (summary["answer_cancelled"]["count"], summary["answer_cancelled"]["errors"]) == (1, 0)
+    assert summary["answer_first_chunk"]["count"] == 3
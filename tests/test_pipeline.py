@@ -0,0 +1,24 @@
+from medibot.llm import FakeBackend
+from medibot.pipeline import LLMWorkerPool
+
+
+def fast_backend(**options):
+    return FakeBackend(first_token_latency=0, chunk_latency=0, **options)
+
+
+def test_background_stream_reports_a_timeout():
+    pool = LLMWorkerPool(timeout=0.05)
+    stream = pool.submit(lambda: FakeBackend(first_token_latency=1).send_message([], "hi", stream=True))
+    assert list(stream) == []
+    assert stream.timed_out and stream.error is None
+    pool.shutdown()
+
+
+def test_background_stream_reports_an_error_instead_of_raising():
+    pool = LLMWorkerPool(timeout=5)
+    stream = pool.submit(lambda: fast_backend(stream_failure_rate=1).send_message([], "hi", stream=True))
+    # The fake backend fails halfway through its reply
+    assert len(list(stream)) == 6
+    assert isinstance(stream.error, RuntimeError)
+    assert not stream.timed_out
+    pool.shutdown()
@@ -0,0 +1,60 @@
+import sqlite3
+import threading
+
+import pytest
+
+from medibot.repository import ConnectionPool
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "pool.db"), size=2, timeout=0.2)
+    yield pool
+    pool.close()
+
+
+def test_nested_blocks_on_one_thread_share_a_connection(pool):
+    with pool.connection() as outer:
+        with pool.connection() as inner:
+            assert inner is outer
+    # The connection goes back to the pool and is handed out again
+    with pool.connection() as again:
+        assert again is outer
+
+
+def test_connections_are_in_wal_mode(pool):
+    with pool.connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_pool_hands_out_at_most_size_connections(pool):
+    held, release = threading.Barrier(3), threading.Event()
+
+    def hold():
+        with pool.connection():
+            held.wait()
+            release.wait()
+
+    threads = [threading.Thread(target=hold) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    held.wait()
+    try:
+        with pytest.raises(sqlite3.OperationalError, match="timed out"):
+            with pool.connection():
+                pass
+    finally:
+        release.set()
+        for thread in threads:
+            thread.join()
+    with pool.connection():
+        pass
+
+
+def test_unfinished_transaction_is_rolled_back_on_release(pool):
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE items (name TEXT)")
+        conn.commit()
+        conn.execute("INSERT INTO items VALUES ('left open')")
+    with pool.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
@@ -0,0 +1,60 @@
+from medibot.llm import FakeBackend
+from medibot.recommender import model_response
+from medibot.response_cache import ResponseCache, cache_key
+
+
+def fast_backend(**options):
+    return FakeBackend(first_token_latency=0, chunk_latency=0, **options)
+
+
+def answer(question, backend, cache, doctors=None):
+    return "".join(chunk.text for chunk in model_response(question, doctors, backend, cache))
+
+
+def doctor(identity, contact="9876543210"):
+    return [identity, "Dr. Test", "Cardiologist", contact, "test@hospital.com", "Test Hospital",
+            "MG Road 560001", "09:00-17:00", ["Monday"], 4.5]
+
+
+def test_cache_key_ignores_formatting_but_not_doctor_details():
+    assert cache_key("What is flu?") == cache_key("  what IS flu ")
+    assert cache_key("fever", [doctor("1")]) == cache_key("fever", [doctor("1")])
+    assert cache_key("fever", [doctor("1")]) != cache_key("fever", [doctor("2")])
+    # Same identity number, different details
+    assert cache_key("fever", [doctor("1")]) != cache_key("fever", [doctor("1", contact="9000000000")])
+
+
+def test_repeat_questions_are_answered_from_the_cache():
+    backend, cache = fast_backend(), ResponseCache(ttl=60)
+    first = answer("what is flu", backend, cache)
+    assert answer("What is flu?", backend, cache) == first
+    assert answer("what is flu", backend, cache) == first
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 1
+
+
+def test_summary_is_generated_again_when_doctor_details_change():
+    backend, cache = fast_backend(), ResponseCache(ttl=60)
+    answer("chest pain", backend, cache, [doctor("1")])
+    answer("chest pain", backend, cache, [doctor("1", contact="9000000000")])
+    assert cache.stats()["hits"] == 0
+    answer("chest pain", backend, cache, [doctor("1", contact="9000000000")])
+    assert cache.stats()["hits"] == 1
+
+
+def test_cache_evicts_least_recently_used_and_expired_entries():
+    cache = ResponseCache(max_entries=2, ttl=60)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    cache.get("a")
+    cache.put("c", "C")
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == ("A", None, "C")
+
+    expired = ResponseCache(ttl=-1)
+    expired.put("a", "A")
+    assert expired.get("a") is None
+
+
+def test_cache_stats_in_prometheus_format():
+    cache = ResponseCache()
+    cache.get("missing")
+    assert "medibot_response_cache_misses_total 1" in cache.prometheus_text()
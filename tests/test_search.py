@@ -0,0 +1,109 @@
+import pytest
+
+from conftest import doctor_record
+
+from medibot.geo import locate
+from medibot.repository import connection
+from medibot import search
+from medibot.ingest import ingest
+from medibot.search import expand_unmatched_terms, parse_symptom_terms, query_database
+
+
+@pytest.mark.parametrize("text, terms", [
+    ("fever, cough", [["fever"], ["cough"]]),
+    ("I have a fever and a sore throat", [["fever"], ["sore", "throat"]]),
+    ("Headache; headache / nausea", [["headache"], ["nausea"]]),
+    ("chest pain", [["chest", "pain"]]),
+    ("I am feeling", []),
+])
+def test_parse_symptom_terms(text, terms):
+    assert parse_symptom_terms(text) == terms
+
+
+def test_unmatched_phrases_are_split_into_words(db_path):
+    with connection(db_path) as conn:
+        assert expand_unmatched_terms(conn, [["chest", "pain"]]) == [["chest", "pain"]]
+        assert expand_unmatched_terms(conn, [["pain", "in", "my", "chest"]]) == [["pain"], ["chest"]]
+        assert expand_unmatched_terms(conn, [["fever", "cough"], ["fever"]]) == [["fever"], ["cough"]]
+
+
+@pytest.mark.parametrize("symptoms", ["fever cough", "high fever", "chest pain dizziness", "pain in my chest"])
+def test_symptoms_typed_without_separators_find_doctors(db_path, symptoms):
+    assert query_database(symptoms, db_path)
+
+
+def test_doctors_covering_more_symptoms_rank_first(db_path):
+    best = query_database("chest pain, dizziness", db_path, limit=1)[0]
+    with connection(db_path) as conn:
+        symptoms = conn.execute(
+            "SELECT symptom_name FROM doctors WHERE doctor_identity_number = ?", [best[0]]
+        ).fetchone()[0]
+    assert "chest pain" in symptoms and "dizziness" in symptoms
+
+
+def test_pages_do_not_overlap(db_path):
+    first = query_database("fever", db_path, limit=5)
+    second = query_database("fever", db_path, limit=5, offset=5)
+    assert not {row[0] for row in first} & {row[0] for row in second}
+
+
+def test_pages_slice_one_ranking(db_path, monkeypatch):
+    first = query_database("fever", db_path, limit=5)
+    monkeypatch.setattr(search, "ranked_doctor_ids", None)
+    assert query_database("fever", db_path, limit=5, offset=5)
+    assert query_database("fever", db_path, limit=5) == first
+
+
+def test_catalog_changes_rank_again(db_path, import_file):
+    assert query_database("hiccups", db_path) is None
+    ingest([import_file(doctor_record("9001", symptom_name="hiccups"))], db_path, log=lambda message: None)
+    assert [row[0] for row in query_database("hiccups", db_path)] == ["9001"]
+
+
+def test_each_term_ranks_at_most_its_best_candidates(db_path, monkeypatch):
+    monkeypatch.setattr(search, "CANDIDATES_PER_TERM", 3)
+    assert len(query_database("fever, cough", db_path, limit=100)) <= 6
+
+
+def test_unknown_symptoms_find_nothing(db_path):
+    assert query_database("xyzzy", db_path) is None
+    assert query_database("I have", db_path) is None
+
+
+def test_availability_filter(db_path):
+    for row in query_database("fever", db_path, limit=100, weekday=0, open_at=9 * 60 + 30):
+        opens, closes = row[7].split("-")
+        assert "Monday" in row[8]
+        assert opens <= "09:30" < closes
+
+
+# Query plan of the ranking query rank_doctors runs for "fever" with the given filters
+def ranking_plan(db_path, **filters):
+    statements = []
+    with connection(db_path) as conn:
+        conn.set_trace_callback(statements.append)
+        search.rank_doctors(conn, [["fever"]], **filters)
+        conn.set_trace_callback(None)
+        ranking = next(statement for statement in statements if "bm25" in statement)
+        return [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + ranking)]
+
+
+def test_availability_is_checked_on_the_matches_by_primary_key(db_path):
+    plan = ranking_plan(db_path, weekday=0, open_at=9 * 60 + 30)
+    assert "SEARCH doctors USING INTEGER PRIMARY KEY (rowid=?)" in plan
+    assert not [step for step in plan if step.startswith("SCAN doctors ")]
+
+
+def test_location_filter_and_nearest_first(db_path):
+    near = locate("560001")
+    rows = query_database("fever", db_path, limit=100, near=near, radius_km=50, nearest_first=True)
+    distances = [row[-1] for row in rows]
+    assert distances
+    assert distances == sorted(distances)
+    assert all(distance <= 50 for distance in distances)
+
+
+def test_location_search_reads_the_spatial_index(db_path):
+    plan = ranking_plan(db_path, near=locate("560001"), radius_km=10)
+    assert any(step.startswith("SCAN doctors_location VIRTUAL TABLE") for step in plan)
+    assert not [step for step in plan if step.startswith("SCAN doctors ")]
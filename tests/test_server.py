@@ -0,0 +1,112 @@
+import json
+import socket
+import threading
+
+import pytest
+
+from medibot.llm import FakeBackend
+from medibot.recommender import InvalidRequest, Recommender, search_filters
+from medibot.response_cache import ResponseCache
+from medibot.server import make_server
+
+
+@pytest.fixture
+def server(db_path):
+    backend = FakeBackend(first_token_latency=0, chunk_latency=0)
+    server = make_server(port=0, recommender=Recommender(db_path, backend=backend, cache=ResponseCache()))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+# (status, decoded JSON body) for a request sent byte for byte, so malformed headers get through
+def exchange(server, request_line, body=b"", headers=None):
+    if headers is None:
+        headers = {"Content-Length": str(len(body))}
+    head = request_line + "\r\n" + "".join(f"{name}: {value}\r\n" for name, value in headers.items()) + "\r\n"
+    with socket.create_connection(("127.0.0.1", server.server_port), timeout=10) as client:
+        client.sendall(head.encode("ascii") + body)
+        response = b""
+        while chunk := client.recv(65536):
+            response += chunk
+    status_line, _, rest = response.partition(b"\r\n")
+    payload = rest.partition(b"\r\n\r\n")[2]
+    return int(status_line.split()[1]), json.loads(payload) if payload.startswith((b"{", b"[")) else payload
+
+
+def post(server, path, payload):
+    return exchange(server, f"POST {path} HTTP/1.0", json.dumps(payload).encode("utf-8"))
+
+
+def test_recommend_with_summary(server):
+    status, result = post(server, "/recommend", {"symptoms": "fever", "limit": 3, "summary": True})
+    assert status == 200
+    assert len(result["doctors"]) == 3
+    assert result["summary"]
+
+
+def test_doctors_by_specialization(server):
+    status, result = post(server, "/doctors", {"specialization": "Cardiologist", "day": "Mon", "time": "10:00"})
+    assert status == 200
+    assert all(doctor["specialization"] == "Cardiologist" for doctor in result["doctors"])
+
+
+@pytest.mark.parametrize("payload", [
+    {"specialization": ["Cardiologist"]},
+    {"specialization": "Astrologer"},
+    {"specialization": "Cardiologist", "limit": 0},
+])
+def test_doctors_rejects_bad_requests(server, payload):
+    status, result = post(server, "/doctors", payload)
+    assert status == 400
+    assert result["error"]
+
+
+@pytest.mark.parametrize("length", ["abc", "-1", "1e3"])
+def test_bad_content_length_is_a_bad_request(server, length):
+    status, result = exchange(server, "POST /recommend HTTP/1.0", b"{}", {"Content-Length": length})
+    assert status == 400
+    assert "Content-Length" in result["error"]
+
+
+def test_body_that_is_not_a_json_object_is_a_bad_request(server):
+    assert exchange(server, "POST /recommend HTTP/1.0", b"[1, 2]")[0] == 400
+    assert exchange(server, "POST /recommend HTTP/1.0", b"{oops")[0] == 400
+
+
+def test_unexpected_failure_is_a_json_500(server, monkeypatch, capsys):
+    def fail(request):
+        raise RuntimeError("boom")
+    monkeypatch.setattr(server.recommender, "recommend", fail)
+    status, result = post(server, "/recommend", {"symptoms": "fever"})
+    assert (status, result) == (500, {"error": "internal error"})
+    assert "boom" in capsys.readouterr().err
+
+
+def test_failed_summary_still_returns_the_doctors(db_path):
+    backend = FakeBackend(first_token_latency=0, chunk_latency=0, failure_rate=1)
+    recommender = Recommender(db_path, backend=backend, cache=ResponseCache())
+    result = recommender.recommend({"symptoms": "fever", "summary": True})
+    assert result["doctors"]
+    assert "summary" not in result
+    assert result["summary_error"]
+
+
+def test_health_and_metrics(server):
+    status, health = exchange(server, "GET /health HTTP/1.0")
+    assert status == 200 and health["doctors"] > 0
+    status, metrics = exchange(server, "GET /metrics HTTP/1.0")
+    assert status == 200
+    assert b"medibot_response_cache_hits_total" in metrics
+    assert exchange(server, "GET /nowhere HTTP/1.0")[0] == 404
+
+
+def test_search_filters():
+    filters = search_filters({"day": "tuesday", "time": "9:05", "location": "560001", "radius_km": 10})
+    assert (filters["weekday"], filters["open_at"], filters["radius_km"]) == (1, 9 * 60 + 5, 10)
+    assert filters["near"] is not None
+    for request in ({"time": "10:00"}, {"day": "Funday"}, {"day": "Mon", "time": "25:00"}, {"location": "Atlantis"}):
+        with pytest.raises(InvalidRequest):
+            search_filters(request)
@@ -0,0 +1,22 @@
+import time
+from types import SimpleNamespace
+
+from medibot.streaming import TimedStream
+
+
+def test_timed_stream_records_only_completed_responses():
+    recorded = []
+
+    # Chunks with the timed_out and error flags of a BackgroundStream
+    class Source(list):
+        timed_out = False
+        error = None
+
+    complete, timed_out, empty = Source([SimpleNamespace(text="a")]), Source([SimpleNamespace(text="a")]), Source()
+    timed_out.timed_out = True
+    for source in (complete, timed_out, empty):
+        assert "".join(TimedStream(source, time.perf_counter(), "qa", recorded.append)) == "".join(
+            chunk.text for chunk in source
+        )
+    assert len(recorded) == 1
+    assert recorded[0].time_to_first_token <= recorded[0].total_latency